@@ -0,0 +1,92 @@
+"""
+opti: modelos de optimización para listas de espera hospitalarias y gestión de residuos.
+
+Importar el paquete no resuelve ningún modelo ni importa los backends (PuLP, docplex):
+los nombres públicos se cargan al primer acceso y cada modelo importa su solver al
+construirse. Así los procesos que solo importan el paquete arrancan de inmediato.
+
+Uso por línea de comandos: python -m opti --listar
+"""
+import importlib
+
+# Nombre público -> submódulo que lo define
+_EXPORTACIONES = {
+    "planificar_hospital": "hospital",
+    "construir_problema_hospital": "hospital",
+    "planificar_hospital_progresivo": "hospital",
+    "planificar_hospital_relajado": "hospital",
+    "planificar_hospital_multirecurso": "hospital",
+    "desagregar_plan": "desagregacion",
+    "planificar_hospital_automatico": "estimacion",
+    "estimar_modelo": "estimacion",
+    "elegir_estrategia": "estimacion",
+    "MemoriaInsuficiente": "estimacion",
+    "analizar_sensibilidad": "sensibilidad",
+    "sensibilidad_hospital": "sensibilidad",
+    "sensibilidad_residuos": "sensibilidad",
+    "construir_problema_hospital_multirecurso": "hospital",
+    "planificar_hospital_lagrangiano": "lagrangiano",
+    "frente_pareto_hospital": "pareto",
+    "planificar_hospital_estocastico": "estocastico",
+    "planificar_hospital_con_plantilla": "plantillas",
+    "obtener_plantilla": "plantillas",
+    "optimizar_gestion_residuos": "residuos",
+    "construir_problema_residuos": "residuos",
+    "optimizar_residuos_porcentual": "residuos",
+    "optimizar_residuos_plurianual": "residuos_plurianual",
+    "optimizar_fondos_balanceados": "residuos",
+    "programar_lista_espera": "agenda",
+    "construir_problema_agenda": "agenda",
+    "seleccionar_pacientes": "mochila",
+    "generar_ejemplos_hospital": "generadores",
+    "generar_ejemplos_residuos_porcentual": "generadores",
+    "generar_hospital_grande": "generadores",
+    "generar_residuos_grande": "generadores",
+    "cargar_instancia": "instancias",
+    "listar_instancias": "instancias",
+    "resolver_instancia": "instancias",
+    "cribar_instancia": "cribado",
+    "CertificadoInfactibilidad": "cribado",
+    "diagnosticar_instancia": "diagnostico",
+    "subconjunto_irreducible": "diagnostico",
+    "FormaMatricial": "matricial",
+    "ServicioResolucion": "servicio",
+    "ServicioSaturado": "servicio",
+    "OpcionesResolucion": "resolucion",
+    "resolver_progresivo": "resolucion",
+    "PoolSolvers": "trabajadores",
+    "SolverPersistente": "trabajadores",
+    "ColaTrabajos": "cola",
+    "verificar_instancia": "verificacion",
+    "reutilizable": "verificacion",
+    "guardar_instantanea": "instantaneas",
+    "cargar_instantanea": "instantaneas",
+    "resolver_instantanea": "instantaneas",
+    "DatosCompartidos": "memoria_compartida",
+    "mapear_compartido": "memoria_compartida",
+    "evaluar_escenarios_hospital": "memoria_compartida",
+    "reducir_hospital": "simetria",
+    "planificar_hospital_simetrico": "simetria",
+    "optimizar_residuos_simetrico": "simetria",
+    "planificar_hospital_dinamico": "hospital_dinamico",
+    "medir_escalamiento_dinamico": "hospital_dinamico",
+    "PredictorTiempo": "prediccion",
+    "planificar_lote": "prediccion",
+    "resolver_lote": "prediccion",
+    "planificar_rutas": "rutas",
+    "optimizar_residuos_con_rutas": "rutas",
+}
+
+__all__ = sorted(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{_EXPORTACIONES[nombre]}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
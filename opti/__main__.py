@@ -0,0 +1,97 @@
+"""
+Ejecutor de instancias por línea de comandos.
+
+Ejemplos:
+    python -m opti hospital_ej_1
+    python -m opti residuos_ej_3 residuos_ej_10 --silencioso
+    python -m opti hospital_ej_5 --limite-tiempo 10 --gap 0.01
+    python -m opti mi_instancia.json --json
+    python -m opti residuos_ej_8 --diagnosticar
+    python -m opti hospital_ej_1 hospital_ej_2 --exportar modelos --formato mps
+    python -m opti --listar
+"""
+import argparse
+import json
+import sys
+
+from .instancias import cargar_instancia, imprimir_resultado, listar_instancias, resolver_instancia
+from .resolucion import OpcionesResolucion
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m opti", description="Resuelve instancias de los modelos de opti.")
+    parser.add_argument("instancias", nargs="*",
+                        help="Nombres de instancias incluidas (ver --listar) o rutas a archivos JSON.")
+    parser.add_argument("--listar", action="store_true", help="Lista las instancias incluidas y termina.")
+    parser.add_argument("--json", action="store_true", help="Imprime cada resultado como una línea JSON.")
+    parser.add_argument("--silencioso", action="store_true", help="Oculta la salida del solver.")
+    parser.add_argument("--limite-tiempo", type=float, help="Segundos máximos por instancia.")
+    parser.add_argument("--gap", type=float, help="Gap relativo con el que se detiene el solver (p. ej. 0.01).")
+    parser.add_argument("--hilos", type=int, help="Hilos que puede usar el solver.")
+    parser.add_argument("--backend", choices=["cbc", "highs"], default="cbc", help="Solver a utilizar.")
+    parser.add_argument("--diagnosticar", action="store_true",
+                        help="En lugar de resolver, busca un subconjunto irreducible de restricciones en conflicto.")
+    parser.add_argument("--exportar", metavar="DIRECTORIO",
+                        help="En lugar de resolver, exporta el modelo de cada instancia al directorio.")
+    parser.add_argument("--formato", choices=["npz", "mps", "lp"], default="npz",
+                        help="Formato de --exportar: instantánea comprimida, MPS o LP.")
+    return parser
+
+
+def diagnosticar(nombre, instancia, como_json):
+    from .diagnostico import diagnosticar_instancia
+
+    diagnostico = diagnosticar_instancia(instancia)
+    if como_json:
+        restricciones = diagnostico.restricciones if diagnostico is not None else []
+        print(json.dumps({"instancia": nombre, "infactible": diagnostico is not None,
+                          "restricciones": restricciones}, ensure_ascii=False))
+        return
+    print(f"== {nombre}: {instancia['descripcion']}")
+    if diagnostico is None:
+        print("La relajación lineal es factible: no hay conflicto entre restricciones que diagnosticar.")
+        return
+    print(f"Restricciones en conflicto ({diagnostico.resoluciones} resoluciones, {diagnostico.segundos:.3f} s):")
+    for restriccion in diagnostico.restricciones:
+        print(f"  {restriccion}")
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+
+    if args.listar:
+        for nombre in listar_instancias():
+            print(nombre)
+        return 0
+
+    if not args.instancias:
+        crear_parser().print_usage()
+        return 2
+
+    if args.exportar:
+        from .instantaneas import exportar_instancias
+
+        for ruta in exportar_instancias(args.instancias, args.exportar, args.formato):
+            print(ruta)
+        return 0
+
+    opciones = OpcionesResolucion(limite_tiempo=args.limite_tiempo, gap_relativo=args.gap, hilos=args.hilos,
+                                  mensajes=not args.silencioso, backend=args.backend)
+    solver = opciones.crear_solver()
+
+    for nombre in args.instancias:
+        instancia = cargar_instancia(nombre)
+        if args.diagnosticar:
+            diagnosticar(nombre, instancia, args.json)
+            continue
+        resultado = resolver_instancia(instancia, solver)
+        if args.json:
+            print(json.dumps({"instancia": nombre, "resultado": resultado}, ensure_ascii=False))
+        else:
+            print(f"== {nombre}: {instancia['descripcion']}")
+            imprimir_resultado(instancia, resultado)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Programación diaria de la lista de espera con pacientes urgentes.
+"""
+
+
+def construir_problema_agenda(pacientes, dias, urgentes, capacidad_diaria, dias_urgentes=3):
+    """
+    Construye el modelo de asignación de pacientes a días sin resolverlo.
+
+    Parámetros:
+        - pacientes (iterable): Identificadores de los pacientes en espera.
+        - dias (iterable): Días de planificación (enteros crecientes, el costo es el número del día).
+        - urgentes (set): Pacientes que deben atenderse en los primeros días.
+        - capacidad_diaria (int): Pacientes que se pueden atender por día.
+        - dias_urgentes (int): Cantidad de días iniciales en que deben atenderse los urgentes.
+
+    Retorna:
+        - tuple: (model, x) con el LpProblem y el diccionario de variables x[i, j].
+    """
+    from pulp import LpProblem, LpMinimize, LpVariable, lpSum
+
+    pacientes = list(pacientes)
+    dias = list(dias)
+    primeros_dias = dias[:dias_urgentes]
+
+    # Crear el modelo de optimización
+    model = LpProblem("Gestion_Lista_Espera", LpMinimize)
+
+    # Variables de decisión: si el paciente i es atendido el día j
+    x = LpVariable.dicts("x", [(i, j) for i in pacientes for j in dias], cat="Binary")
+
+    # Función objetivo: minimizar el tiempo total en lista de espera
+    model += lpSum(j * x[i, j] for i in pacientes for j in dias), "Minimizar_Tiempo_Espera"
+
+    # Restricción 1: Cada paciente debe ser atendido exactamente un día
+    for i in pacientes:
+        model += lpSum(x[i, j] for j in dias) == 1, f"Paciente_{i}_Atendido_Una_Vez"
+
+    # Restricción 2: No superar la capacidad diaria
+    for j in dias:
+        model += lpSum(x[i, j] for i in pacientes) <= capacidad_diaria, f"Capacidad_Diaria_{j}"
+
+    # Restricción 3: Los pacientes urgentes deben ser atendidos en los primeros días
+    for i in urgentes:
+        model += lpSum(x[i, j] for j in primeros_dias) == 1, f"Urgente_{i}_En_{dias_urgentes}_Dias"
+
+    return model, x
+
+
+def programar_lista_espera(pacientes, dias, urgentes, capacidad_diaria, dias_urgentes=3, solver=None):
+    """
+    Asigna cada paciente a un día minimizando el tiempo total en lista de espera.
+
+    Parámetros:
+        - pacientes (iterable): Identificadores de los pacientes en espera.
+        - dias (iterable): Días de planificación (enteros crecientes).
+        - urgentes (set): Pacientes que deben atenderse en los primeros días.
+        - capacidad_diaria (int): Pacientes que se pueden atender por día.
+        - dias_urgentes (int): Cantidad de días iniciales en que deben atenderse los urgentes.
+        - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorna:
+        - dict: Diccionario con "estado", "estado_solucion" (1 óptima, 2 factible sin probar
+          optimalidad), "asignacion" (paciente -> día) y "funcion_objetivo".
+    """
+    pacientes = list(pacientes)
+    dias = list(dias)
+    model, x = construir_problema_agenda(pacientes, dias, urgentes, capacidad_diaria, dias_urgentes)
+
+    model.solve(solver)
+
+    asignacion = {}
+    for i in pacientes:
+        for j in dias:
+            if x[i, j].value() is not None and round(x[i, j].value()) == 1:
+                asignacion[i] = j
+
+    return {
+        "estado": model.status,
+        "estado_solucion": model.sol_status,
+        "asignacion": asignacion,
+        "funcion_objetivo": model.objective.value()
+    }
+
+
+def imprimir_resultados(resultados):
+    """
+    Muestra por pantalla el resultado de programar_lista_espera.
+    """
+    from pulp import LpStatus
+
+    print(f"Estado del modelo: {LpStatus[resultados['estado']]}")
+    print("Resultados:")
+    for i, j in resultados["asignacion"].items():
+        print(f"Paciente {i} atendido el día {j}")
@@ -0,0 +1,340 @@
+"""
+Cola de trabajos en un archivo SQLite para repartir campañas entre procesos locales.
+
+Cada trabajo es una instancia (modelo y datos, en el formato de instancias.py) dentro de
+una campaña. Varios procesos trabajadores comparten el mismo archivo:
+
+- Reclamo atómico: un trabajo se toma dentro de una transacción BEGIN IMMEDIATE, de modo
+  que dos trabajadores nunca reciben el mismo.
+- Arriendo con latido: el trabajo reclamado vence tras "arriendo" segundos salvo que el
+  trabajador lo renueve; un hilo lo renueva mientras se resuelve.
+- Reintentos: si el trabajador muere, el arriendo vence y otro trabajador retoma el
+  trabajo; tras max_intentos el trabajo queda como fallido.
+- El resultado (JSON) se escribe en la misma fila, así que una campaña interrumpida se
+  reanuda simplemente lanzando trabajadores otra vez.
+
+Uso por línea de comandos:
+    python -m opti.cola agregar campana.db hospital_ej_1 hospital_ej_2 --campana prueba
+    python -m opti.cola trabajar campana.db --procesos 4
+    python -m opti.cola estado campana.db
+    python -m opti.cola resultados campana.db --campana prueba
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from .servicio import clave_solicitud
+
+PENDIENTE = "pendiente"
+EN_CURSO = "en_curso"
+TERMINADO = "terminado"
+FALLIDO = "fallido"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS trabajos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campana TEXT NOT NULL,
+    clave TEXT NOT NULL,
+    modelo TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    estado TEXT NOT NULL DEFAULT 'pendiente',
+    intentos INTEGER NOT NULL DEFAULT 0,
+    trabajador TEXT,
+    vence REAL,
+    resultado TEXT,
+    error TEXT,
+    actualizado REAL,
+    UNIQUE (campana, clave)
+);
+CREATE INDEX IF NOT EXISTS trabajos_estado ON trabajos (estado, vence);
+"""
+
+
+class ColaTrabajos:
+    """
+    Cola de trabajos persistente en un archivo SQLite.
+
+    Parámetros:
+        - ruta (str): Archivo de la base de datos (se crea si no existe).
+        - arriendo (float): Segundos que un trabajo reclamado queda reservado sin latido.
+        - max_intentos (int): Intentos por trabajo antes de marcarlo como fallido.
+
+    Cada objeto abre su propia conexión: se crea uno por proceso o hilo.
+    """
+
+    def __init__(self, ruta, arriendo=60.0, max_intentos=3):
+        self.ruta = ruta
+        self.arriendo = arriendo
+        self.max_intentos = max_intentos
+        # isolation_level=None: las transacciones se abren explícitamente con BEGIN IMMEDIATE
+        self._conexion = sqlite3.connect(ruta, timeout=30, isolation_level=None)
+        self._conexion.row_factory = sqlite3.Row
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def _transaccion(self):
+        return _Transaccion(self._conexion)
+
+    def agregar(self, modelo, datos, campana="general"):
+        """
+        Agrega un trabajo. Los trabajos repetidos (mismo modelo y datos) dentro de una campaña se ignoran.
+
+        Retorna:
+            - bool: True si el trabajo es nuevo.
+        """
+        return self.agregar_instancias([{"modelo": modelo, "datos": datos}], campana) == 1
+
+    def agregar_instancias(self, instancias, campana="general"):
+        """
+        Agrega varias instancias ({"modelo": ..., "datos": ...}) en una sola transacción.
+
+        Retorna:
+            - int: Número de trabajos nuevos.
+        """
+        ahora = time.time()
+        filas = [(campana, clave_solicitud(instancia["modelo"], instancia["datos"]), instancia["modelo"],
+                  json.dumps(instancia["datos"], ensure_ascii=False), ahora) for instancia in instancias]
+        with self._transaccion() as cursor:
+            antes = cursor.execute("SELECT COUNT(*) FROM trabajos WHERE campana = ?", (campana,)).fetchone()[0]
+            cursor.executemany("INSERT OR IGNORE INTO trabajos (campana, clave, modelo, datos, actualizado) "
+                               "VALUES (?, ?, ?, ?, ?)", filas)
+            despues = cursor.execute("SELECT COUNT(*) FROM trabajos WHERE campana = ?", (campana,)).fetchone()[0]
+        return despues - antes
+
+    def reclamar(self, trabajador, campana=None):
+        """
+        Reclama el siguiente trabajo pendiente (o con arriendo vencido) de forma atómica.
+
+        Retorna:
+            - dict con las claves "id", "campana", "modelo", "datos" e "intentos", o None si no hay trabajos.
+        """
+        ahora = time.time()
+        filtro, parametros = ("AND campana = ?", (campana,)) if campana is not None else ("", ())
+        with self._transaccion() as cursor:
+            # Los trabajos cuyo arriendo venció sin intentos restantes se dan por fallidos
+            cursor.execute(f"UPDATE trabajos SET estado = ?, error = 'arriendo vencido', actualizado = ? "
+                           f"WHERE estado = ? AND vence < ? AND intentos >= ? {filtro}",
+                           (FALLIDO, ahora, EN_CURSO, ahora, self.max_intentos, *parametros))
+            fila = cursor.execute(f"SELECT * FROM trabajos WHERE (estado = ? OR (estado = ? AND vence < ?)) {filtro} "
+                                  f"ORDER BY id LIMIT 1", (PENDIENTE, EN_CURSO, ahora, *parametros)).fetchone()
+            if fila is None:
+                return None
+            cursor.execute("UPDATE trabajos SET estado = ?, trabajador = ?, vence = ?, intentos = intentos + 1, "
+                           "actualizado = ? WHERE id = ?",
+                           (EN_CURSO, trabajador, ahora + self.arriendo, ahora, fila["id"]))
+        return {"id": fila["id"], "campana": fila["campana"], "modelo": fila["modelo"],
+                "datos": json.loads(fila["datos"]), "intentos": fila["intentos"] + 1}
+
+    def renovar(self, identificador, trabajador):
+        """
+        Renueva el arriendo de un trabajo (latido).
+
+        Retorna:
+            - bool: False si el trabajo ya no pertenece a este trabajador.
+        """
+        ahora = time.time()
+        cursor = self._conexion.execute(
+            "UPDATE trabajos SET vence = ?, actualizado = ? WHERE id = ? AND trabajador = ? AND estado = ?",
+            (ahora + self.arriendo, ahora, identificador, trabajador, EN_CURSO))
+        return cursor.rowcount == 1
+
+    def completar(self, identificador, trabajador, resultado):
+        """
+        Escribe el resultado de un trabajo. Retorna False si el trabajo ya no pertenecía al trabajador.
+        """
+        cursor = self._conexion.execute(
+            "UPDATE trabajos SET estado = ?, resultado = ?, error = NULL, vence = NULL, actualizado = ? "
+            "WHERE id = ? AND trabajador = ? AND estado = ?",
+            (TERMINADO, json.dumps(resultado, ensure_ascii=False, default=str), time.time(),
+             identificador, trabajador, EN_CURSO))
+        return cursor.rowcount == 1
+
+    def fallar(self, identificador, trabajador, error):
+        """
+        Registra un error: el trabajo vuelve a pendiente si le quedan intentos y si no queda fallido.
+        """
+        cursor = self._conexion.execute(
+            "UPDATE trabajos SET estado = CASE WHEN intentos < ? THEN ? ELSE ? END, error = ?, vence = NULL, "
+            "actualizado = ? WHERE id = ? AND trabajador = ? AND estado = ?",
+            (self.max_intentos, PENDIENTE, FALLIDO, str(error), time.time(), identificador, trabajador, EN_CURSO))
+        return cursor.rowcount == 1
+
+    def reintentar_fallidos(self, campana=None):
+        """
+        Devuelve a pendiente los trabajos fallidos (con sus intentos en cero). Retorna cuántos.
+        """
+        filtro, parametros = ("AND campana = ?", (campana,)) if campana is not None else ("", ())
+        cursor = self._conexion.execute(f"UPDATE trabajos SET estado = ?, intentos = 0, error = NULL "
+                                        f"WHERE estado = ? {filtro}", (PENDIENTE, FALLIDO, *parametros))
+        return cursor.rowcount
+
+    def resumen(self, campana=None):
+        """
+        Retorna {campaña: {estado: cantidad}}.
+        """
+        filtro, parametros = ("WHERE campana = ?", (campana,)) if campana is not None else ("", ())
+        resumen = {}
+        for fila in self._conexion.execute(f"SELECT campana, estado, COUNT(*) AS n FROM trabajos {filtro} "
+                                           f"GROUP BY campana, estado ORDER BY campana", parametros):
+            resumen.setdefault(fila["campana"], {})[fila["estado"]] = fila["n"]
+        return resumen
+
+    def resultados(self, campana=None):
+        """
+        Generador de los trabajos terminados: dicts con "id", "campana", "modelo", "datos" y "resultado".
+        """
+        filtro, parametros = ("AND campana = ?", (campana,)) if campana is not None else ("", ())
+        for fila in self._conexion.execute(f"SELECT * FROM trabajos WHERE estado = ? {filtro} ORDER BY id",
+                                           (TERMINADO, *parametros)):
+            yield {"id": fila["id"], "campana": fila["campana"], "modelo": fila["modelo"],
+                   "datos": json.loads(fila["datos"]), "resultado": json.loads(fila["resultado"])}
+
+
+class _Transaccion:
+    # BEGIN IMMEDIATE toma el candado de escritura al empezar: dos reclamos no se intercalan
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def __enter__(self):
+        self.conexion.execute("BEGIN IMMEDIATE")
+        return self.conexion.cursor()
+
+    def __exit__(self, tipo, *exc):
+        self.conexion.execute("COMMIT" if tipo is None else "ROLLBACK")
+
+
+def _crear_solver_silencioso():
+    from pulp import PULP_CBC_CMD
+    return PULP_CBC_CMD(msg=0)
+
+
+def _latir(ruta, arriendo, identificador, trabajador, detener):
+    # Hilo de latido con su propia conexión (las conexiones de sqlite3 no se comparten entre hilos)
+    cola = ColaTrabajos(ruta, arriendo=arriendo)
+    try:
+        while not detener.wait(arriendo / 3):
+            if not cola.renovar(identificador, trabajador):
+                return
+    finally:
+        cola.cerrar()
+
+
+def trabajar(ruta, nombre=None, campana=None, arriendo=60.0, max_intentos=3, esperar_nuevos=False,
+             espera=1.0, crear_solver=_crear_solver_silencioso):
+    """
+    Bucle de un trabajador: reclama trabajos, los resuelve y escribe los resultados.
+
+    Parámetros:
+        - ruta (str): Archivo de la cola.
+        - nombre (str): Identificador del trabajador (por defecto host:pid).
+        - campana (str): Atender solo esta campaña (None para todas).
+        - arriendo (float), max_intentos (int): Ver ColaTrabajos.
+        - esperar_nuevos (bool): Si es False, el trabajador termina cuando no quedan trabajos.
+        - espera (float): Segundos entre consultas cuando la cola está vacía.
+        - crear_solver (callable): Fábrica del solver de PuLP de cada resolución.
+
+    Retorna:
+        - int: Trabajos completados por este trabajador.
+    """
+    from .instancias import resolver_instancia
+
+    nombre = nombre or f"{socket.gethostname()}:{os.getpid()}"
+    completados = 0
+    with ColaTrabajos(ruta, arriendo, max_intentos) as cola:
+        while True:
+            trabajo = cola.reclamar(nombre, campana)
+            if trabajo is None:
+                if not esperar_nuevos:
+                    return completados
+                time.sleep(espera)
+                continue
+
+            detener = threading.Event()
+            latido = threading.Thread(target=_latir, args=(ruta, arriendo, trabajo["id"], nombre, detener),
+                                      daemon=True)
+            latido.start()
+            try:
+                solver = crear_solver() if crear_solver is not None else None
+                resultado = resolver_instancia({"modelo": trabajo["modelo"], "datos": trabajo["datos"]}, solver)
+            except Exception as error:
+                cola.fallar(trabajo["id"], nombre, f"{type(error).__name__}: {error}")
+            else:
+                completados += cola.completar(trabajo["id"], nombre, resultado)
+            finally:
+                detener.set()
+                latido.join()
+
+
+def _trabajar_proceso(ruta, campana, arriendo, max_intentos, esperar_nuevos):
+    trabajar(ruta, campana=campana, arriendo=arriendo, max_intentos=max_intentos, esperar_nuevos=esperar_nuevos)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m opti.cola", description="Cola de trabajos en SQLite.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    agregar = subparsers.add_parser("agregar", help="Agrega instancias (nombres incluidos o rutas JSON).")
+    agregar.add_argument("cola")
+    agregar.add_argument("instancias", nargs="+")
+    agregar.add_argument("--campana", default="general")
+
+    trabajar_parser = subparsers.add_parser("trabajar", help="Lanza procesos trabajadores.")
+    trabajar_parser.add_argument("cola")
+    trabajar_parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    trabajar_parser.add_argument("--campana", default=None)
+    trabajar_parser.add_argument("--arriendo", type=float, default=60.0)
+    trabajar_parser.add_argument("--max-intentos", type=int, default=3)
+    trabajar_parser.add_argument("--esperar", action="store_true", help="No terminar cuando la cola se vacía.")
+
+    estado = subparsers.add_parser("estado", help="Muestra los trabajos por campaña y estado.")
+    estado.add_argument("cola")
+
+    resultados = subparsers.add_parser("resultados", help="Imprime los resultados como líneas JSON.")
+    resultados.add_argument("cola")
+    resultados.add_argument("--campana", default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.comando == "agregar":
+        from .instancias import cargar_instancia
+        with ColaTrabajos(args.cola) as cola:
+            nuevos = cola.agregar_instancias([cargar_instancia(nombre) for nombre in args.instancias], args.campana)
+        print(f"{nuevos} trabajos nuevos en la campaña '{args.campana}'")
+    elif args.comando == "trabajar":
+        ColaTrabajos(args.cola).cerrar()  # Crea el esquema antes de lanzar los procesos
+        procesos = [multiprocessing.Process(target=_trabajar_proceso,
+                                            args=(args.cola, args.campana, args.arriendo, args.max_intentos,
+                                                  args.esperar))
+                    for _ in range(args.procesos)]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join()
+    elif args.comando == "estado":
+        with ColaTrabajos(args.cola) as cola:
+            for campana, estados in cola.resumen().items():
+                print(campana + ": " + ", ".join(f"{estado} {n}" for estado, n in sorted(estados.items())))
+    elif args.comando == "resultados":
+        with ColaTrabajos(args.cola) as cola:
+            for trabajo in cola.resultados(args.campana):
+                print(json.dumps({"id": trabajo["id"], "campana": trabajo["campana"], "modelo": trabajo["modelo"],
+                                  "resultado": trabajo["resultado"]}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Cribado de factibilidad previo a la construcción del modelo.
+
+Comprueba condiciones necesarias que se verifican con aritmética sobre los datos (suma de
+mínimos frente al presupuesto, pacientes frente a capacidad, etc.) y, si alguna falla,
+retorna un certificado de infactibilidad sin construir el modelo ni llamar al solver.
+Las comprobaciones de residuos están vectorizadas con NumPy sobre lotes de instancias.
+
+Los certificados nombran las restricciones del modelo que entran en conflicto, con los
+mismos nombres que usan los constructores de hospital.py, residuos.py y agenda.py.
+"""
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass
+class CertificadoInfactibilidad:
+    """
+    Prueba de que una instancia no tiene solución factible.
+
+    Atributos:
+        - modelo (str): Modelo de la instancia ("residuos", "hospital", "agenda").
+        - motivo (str): Descripción de la condición necesaria que no se cumple.
+        - requerido (float): Lo que exigen las restricciones en conflicto.
+        - disponible (float): Lo que permiten las restricciones en conflicto.
+        - restricciones (list): Nombres de las restricciones en conflicto.
+    """
+    modelo: str
+    motivo: str
+    requerido: float
+    disponible: float
+    restricciones: list = field(default_factory=list)
+
+    def a_dict(self):
+        return asdict(self)
+
+
+def cribar_residuos_lote(F, C, R, I):
+    """
+    Evalúa las condiciones necesarias del modelo de residuos sobre un lote de instancias.
+
+    Parámetros:
+        - F (array K x M): Fondos disponibles por instancia y municipalidad.
+        - C (array K x A): Costo mínimo por instancia y actividad.
+        - R (array K x M): Residuos generados por instancia y municipalidad.
+        - I (array K x A): Impacto por instancia y actividad.
+
+    Retorna:
+        - tuple: (sin_presupuesto, sin_margen), matrices booleanas K x M. sin_presupuesto indica
+          que la suma de mínimos supera los fondos; sin_margen, que la reducción mínima que
+          imponen los mínimos (suma de I, cuando todos los impactos son no negativos) supera R.
+    """
+    import numpy as np
+
+    F = np.asarray(F, dtype=float)
+    C = np.asarray(C, dtype=float)
+    R = np.asarray(R, dtype=float)
+    I = np.asarray(I, dtype=float)
+
+    minimo_total = C.sum(axis=1, keepdims=True)
+    sin_presupuesto = minimo_total > F
+
+    # Con x[a] >= C[a] e I[a] >= 0, la reducción y = sum(I[a] x[a] / C[a]) es al menos sum(I[a])
+    aplica = ((I >= 0).all(axis=1) & (C > 0).all(axis=1))[:, None]
+    sin_margen = aplica & (I.sum(axis=1, keepdims=True) > R)
+    return sin_presupuesto, sin_margen
+
+
+def cribar_residuos(municipalidades, actividades, R, F, I, C):
+    """
+    Cribado de una instancia de optimizar_gestion_residuos.
+
+    Retorna:
+        - list: Certificados de infactibilidad (vacía si no se detectó ninguna).
+    """
+    import numpy as np
+
+    sin_presupuesto, sin_margen = cribar_residuos_lote(
+        [[F[m] for m in municipalidades]], [[C[a] for a in actividades]],
+        [[R[m] for m in municipalidades]], [[I[a] for a in actividades]])
+
+    minimo_total = sum(C[a] for a in actividades)
+    reduccion_minima = sum(I[a] for a in actividades)
+    certificados = []
+    for k in np.flatnonzero(sin_presupuesto[0]):
+        m = municipalidades[k]
+        certificados.append(CertificadoInfactibilidad(
+            modelo="residuos",
+            motivo=f"La suma de costos mínimos supera los fondos de {m}",
+            requerido=minimo_total,
+            disponible=F[m],
+            restricciones=[f"Presupuesto_{m}"] + [f"Asignacion_Minima_{a}_{m}" for a in actividades],
+        ))
+    for k in np.flatnonzero(sin_margen[0]):
+        m = municipalidades[k]
+        certificados.append(CertificadoInfactibilidad(
+            modelo="residuos",
+            motivo=f"La reducción mínima que imponen los costos mínimos supera los residuos de {m}",
+            requerido=reduccion_minima,
+            disponible=R[m],
+            restricciones=[f"Limite_Residuos_Reducidos_{m}", f"Calculo_Reduccion_Residuos_{m}"]
+                          + [f"Asignacion_Minima_{a}_{m}" for a in actividades],
+        ))
+    return certificados
+
+
+def cribar_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles):
+    """
+    Cribado de una instancia de planificar_hospital.
+
+    Todas las restricciones son de tipo <= con x >= 0, así que x = 0 es factible salvo que
+    algún lado derecho sea negativo; también se rechazan dimensiones inconsistentes.
+
+    Retorna:
+        - list: Certificados de infactibilidad (vacía si no se detectó ninguna).
+    """
+    import numpy as np
+
+    num_especialidades = len(prioridad)
+    num_semanas = len(recursos_disponibles)
+    if (len(pacientes) != num_especialidades or len(recursos_por_paciente) != num_especialidades
+            or np.shape(capacidad) != (num_especialidades, num_semanas)):
+        raise ValueError("Las dimensiones de los datos del hospital no son consistentes")
+
+    certificados = []
+    for i in np.flatnonzero(np.asarray(pacientes, dtype=float) < 0):
+        certificados.append(CertificadoInfactibilidad(
+            "hospital", f"Pacientes en espera negativos en la especialidad {i+1}", 0, pacientes[i],
+            [f"Pacientes_Especialidad_{i+1}"]))
+    for i, j in np.argwhere(np.asarray(capacidad, dtype=float) < 0):
+        certificados.append(CertificadoInfactibilidad(
+            "hospital", f"Capacidad negativa en la especialidad {i+1}, semana {j+1}", 0, capacidad[i][j],
+            [f"Capacidad_{i+1}_{j+1}"]))
+    for j in np.flatnonzero(np.asarray(recursos_disponibles, dtype=float) < 0):
+        certificados.append(CertificadoInfactibilidad(
+            "hospital", f"Recursos disponibles negativos en la semana {j+1}", 0, recursos_disponibles[j],
+            [f"Recursos_Semana_{j+1}"]))
+    return certificados
+
+
+def cribar_agenda(pacientes, dias, urgentes, capacidad_diaria, dias_urgentes=3):
+    """
+    Cribado de una instancia de programar_lista_espera.
+
+    Retorna:
+        - list: Certificados de infactibilidad (vacía si no se detectó ninguna).
+    """
+    pacientes = list(pacientes)
+    dias = list(dias)
+    primeros_dias = dias[:dias_urgentes]
+    certificados = []
+
+    if len(pacientes) > capacidad_diaria * len(dias):
+        certificados.append(CertificadoInfactibilidad(
+            "agenda", "Hay más pacientes que cupos en el horizonte", len(pacientes), capacidad_diaria * len(dias),
+            [f"Paciente_{i}_Atendido_Una_Vez" for i in pacientes] + [f"Capacidad_Diaria_{j}" for j in dias]))
+
+    if len(urgentes) > capacidad_diaria * len(primeros_dias):
+        certificados.append(CertificadoInfactibilidad(
+            "agenda", f"Hay más pacientes urgentes que cupos en los primeros {dias_urgentes} días",
+            len(urgentes), capacidad_diaria * len(primeros_dias),
+            [f"Urgente_{i}_En_{dias_urgentes}_Dias" for i in urgentes]
+            + [f"Capacidad_Diaria_{j}" for j in primeros_dias]))
+    return certificados
+
+
+# Modelo -> función de cribado que recibe los datos de la instancia
+CRIBADOS = {
+    "residuos": lambda datos: cribar_residuos(**datos),
+    "hospital": lambda datos: cribar_hospital(**datos),
+    "agenda": lambda datos: cribar_agenda(**datos),
+}
+
+
+def cribar_instancia(instancia):
+    """
+    Cribado de una instancia en el formato de instancias.py.
+
+    Retorna:
+        - list: Certificados de infactibilidad; vacía si no se detectó ninguna o si el modelo
+          no tiene cribado.
+    """
+    cribar = CRIBADOS.get(instancia["modelo"])
+    return cribar(instancia["datos"]) if cribar is not None else []
@@ -0,0 +1,149 @@
+"""
+Desagregación del plan semanal en listas concretas de pacientes.
+
+planificar_hospital decide cuántos pacientes x[i][j] atiende cada especialidad i en cada
+semana j, pero no cuáles. desagregar_plan recorre la lista de espera por bloques de
+arreglos NumPy (sin crear un objeto de Python por paciente) y conserva, para cada
+especialidad, solo los sum_j x[i][j] pacientes de mayor prioridad vistos hasta el momento:
+una selección acotada por especialidad, que cumple el papel de un montículo de tamaño fijo
+pero procesa cada bloque con un único ordenamiento vectorizado. Al terminar, los pacientes
+elegidos se reparten en las semanas en orden de prioridad (los más prioritarios primero)
+y las asignaciones se entregan semana a semana.
+
+La prioridad de un paciente es, en este orden: mayor urgencia, mayor tiempo de espera y
+aparición más temprana en la lista de espera.
+"""
+import re
+import warnings
+
+import numpy as np
+
+ASIGNACION = np.dtype([("paciente", np.int64), ("especialidad", np.int64), ("semana", np.int64)])
+
+
+def _plan_a_matriz(plan):
+    # Resultado de planificar_hospital ({"variables": {"x_i_j": valor}}) o matriz especialidades x semanas
+    if isinstance(plan, dict):
+        indices = {}
+        for nombre, valor in plan["variables"].items():
+            coincidencia = re.fullmatch(r"x_(\d+)_(\d+)", nombre)
+            if coincidencia:
+                indices[int(coincidencia.group(1)) - 1, int(coincidencia.group(2)) - 1] = valor or 0.0
+        if not indices:
+            raise ValueError("El plan no contiene variables x_i_j")
+        matriz = np.zeros((max(i for i, _ in indices) + 1, max(j for _, j in indices) + 1))
+        for (i, j), valor in indices.items():
+            matriz[i, j] = valor
+        plan = matriz
+    return np.rint(np.asarray(plan, dtype=float)).astype(np.int64)
+
+
+def _bloques(lista_espera):
+    # Un solo bloque (diccionario de arreglos o arreglo estructurado) o un iterable de bloques
+    if isinstance(lista_espera, dict) or isinstance(lista_espera, np.ndarray):
+        return [lista_espera]
+    return lista_espera
+
+
+def leer_lista_espera_csv(ruta, tamano_bloque=1_000_000):
+    """
+    Lee una lista de espera en CSV por bloques, como arreglos NumPy.
+
+    El archivo debe tener encabezado y las columnas numéricas paciente, especialidad
+    (numerada desde 1), espera y urgencia, en cualquier orden.
+
+    Retorna:
+        - Generador de arreglos estructurados con esos cuatro campos.
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        columnas = [columna.strip() for columna in archivo.readline().split(",")]
+        while True:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)  # loadtxt avisa al llegar al final del archivo
+                bloque = np.loadtxt(archivo, delimiter=",", max_rows=tamano_bloque, ndmin=2)
+            if len(bloque) == 0:
+                return
+            yield np.rec.fromarrays(bloque.T, names=columnas)
+
+
+def _seleccionar(cupos, lista_espera):
+    # Retiene, por especialidad, los cupos[i] pacientes más prioritarios de toda la lista,
+    # ordenados por (especialidad, prioridad)
+    vacio = np.empty(0, dtype=np.int64)
+    retenidos = {"paciente": vacio, "especialidad": vacio, "espera": np.empty(0), "urgencia": np.empty(0)}
+    for bloque in _bloques(lista_espera):
+        especialidad = np.asarray(bloque["especialidad"], dtype=np.int64) - 1
+        espera = np.asarray(bloque["espera"], dtype=float)
+        urgencia = np.asarray(bloque["urgencia"], dtype=float)
+        valido = (especialidad >= 0) & (especialidad < len(cupos))
+        valido[valido] = cupos[especialidad[valido]] > 0
+        # Descartar antes de ordenar a quienes no superan al último retenido de una
+        # especialidad que ya tiene todos sus cupos (como la cima de un montículo acotado)
+        llena = (np.bincount(retenidos["especialidad"], minlength=len(cupos)) >= cupos) & (cupos > 0)
+        if llena.any():
+            ultimo = np.searchsorted(retenidos["especialidad"], np.arange(len(cupos)), side="right") - 1
+            indice = np.where(valido, especialidad, 0)
+            peor = ultimo[indice]
+            urgencia_peor, espera_peor = retenidos["urgencia"][peor], retenidos["espera"][peor]
+            supera = (urgencia > urgencia_peor) | ((urgencia == urgencia_peor) & (espera > espera_peor))
+            valido &= ~llena[indice] | supera
+        nuevos = {
+            "paciente": np.asarray(bloque["paciente"], dtype=np.int64)[valido],
+            "especialidad": especialidad[valido],
+            "espera": espera[valido],
+            "urgencia": urgencia[valido],
+        }
+        # lexsort es estable: en un empate queda primero quien apareció antes en la lista
+        candidatos = {campo: np.concatenate([retenidos[campo], nuevos[campo]]) for campo in retenidos}
+        orden = np.lexsort((-candidatos["espera"], -candidatos["urgencia"], candidatos["especialidad"]))
+        especialidad_ordenada = candidatos["especialidad"][orden]
+        # Posición de cada candidato dentro de su especialidad
+        inicio_grupo = np.searchsorted(especialidad_ordenada, especialidad_ordenada, side="left")
+        rango = np.arange(len(orden)) - inicio_grupo
+        orden = orden[rango < cupos[especialidad_ordenada]]
+        retenidos = {campo: valores[orden] for campo, valores in candidatos.items()}
+    return retenidos
+
+
+def desagregar_plan(plan, lista_espera):
+    """
+    Asigna pacientes concretos a las semanas según un plan agregado.
+
+    Parámetros:
+        - plan: Resultado de planificar_hospital (o de sus variantes) o matriz especialidades
+          x semanas con el número de pacientes a atender.
+        - lista_espera: Diccionario de arreglos, arreglo estructurado o iterable de bloques
+          (p. ej. leer_lista_espera_csv) con los campos "paciente" (identificador entero),
+          "especialidad" (numerada desde 1, como en x_i_j), "espera" y "urgencia".
+
+    Retorna:
+        - Generador de arreglos estructurados (dtype ASIGNACION: paciente, especialidad,
+          semana, numeradas desde 1), uno por semana con asignaciones y en orden de semana.
+          Si una especialidad tiene menos pacientes en espera que cupos en el plan, los
+          cupos sobrantes de sus últimas semanas quedan sin asignar.
+
+    Lanza:
+        - ValueError: Si el plan es un diccionario sin variables x_i_j.
+    """
+    x = _plan_a_matriz(plan)
+    cupos = x.sum(axis=1)
+    retenidos = _seleccionar(cupos, lista_espera)
+
+    # Los retenidos vienen ordenados por especialidad y prioridad: el k-ésimo de la
+    # especialidad i va a la primera semana j con sum_{j' <= j} x[i][j'] > k
+    especialidad = retenidos["especialidad"]
+    inicio_grupo = np.searchsorted(especialidad, especialidad, side="left")
+    rango = np.arange(len(especialidad)) - inicio_grupo
+    acumulado = np.cumsum(x, axis=1)
+    semana = np.empty(len(especialidad), dtype=np.int64)
+    for i in np.unique(especialidad):
+        grupo = slice(*np.searchsorted(especialidad, [i, i + 1]))
+        semana[grupo] = np.searchsorted(acumulado[i], rango[grupo], side="right")
+
+    orden = np.lexsort((rango, especialidad, semana))
+    asignaciones = np.empty(len(orden), dtype=ASIGNACION)
+    asignaciones["paciente"] = retenidos["paciente"][orden]
+    asignaciones["especialidad"] = especialidad[orden] + 1
+    asignaciones["semana"] = semana[orden] + 1
+    cortes = np.flatnonzero(np.diff(asignaciones["semana"])) + 1
+    yield from np.split(asignaciones, cortes) if len(asignaciones) else []
@@ -0,0 +1,171 @@
+"""
+Diagnóstico de instancias infactibles: subconjunto irreducible de restricciones (IIS).
+
+El modelo se carga una sola vez en HiGHS como problema de factibilidad (costo cero) y las
+restricciones se activan o desactivan cambiando las cotas de sus filas, de modo que cada
+nueva resolución parte de la base de la anterior. El algoritmo combina:
+
+1. Filtro aditivo: partiendo de ninguna fila activa, se resuelve y se activan todas las
+   filas que viola la solución obtenida, hasta que el conjunto activo es infactible.
+2. Filtro de eliminación por bloques: se intenta desactivar bloques completos del conjunto
+   activo; si sigue infactible, el bloque sobra, y si no, se divide en mitades.
+
+El resultado se informa con los nombres de las restricciones del modelo original. Las
+cotas de las variables (p. ej. x >= 0) se consideran siempre activas y el diagnóstico se
+hace sobre la relajación lineal: un modelo entero cuya relajación es factible no tiene IIS
+lineal y se informa como tal.
+"""
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .matricial import FormaMatricial, desde_problema
+
+
+@dataclass
+class DiagnosticoInfactibilidad:
+    """
+    Resultado del diagnóstico.
+
+    Atributos:
+        - restricciones (list): Nombres de las restricciones del subconjunto irreducible.
+        - resoluciones (int): Resoluciones de HiGHS realizadas.
+        - segundos (float): Tiempo total del diagnóstico.
+    """
+    restricciones: list = field(default_factory=list)
+    resoluciones: int = 0
+    segundos: float = 0.0
+
+
+class _Factibilidad:
+    # Problema de factibilidad en HiGHS con filas que se activan y desactivan
+
+    def __init__(self, forma, tolerancia):
+        import highspy
+
+        self.highspy = highspy
+        self.forma = forma
+        self.h = forma.a_highs(relajar_enteras=True, objetivo=False)
+        inf = highspy.kHighsInf
+        self.inf = inf
+        self.inferior = np.where(np.isinf(forma.fila_inf), -inf, forma.fila_inf)
+        self.superior = np.where(np.isinf(forma.fila_sup), inf, forma.fila_sup)
+        self.activas = np.ones(forma.num_restricciones, dtype=bool)
+        self.tolerancia = tolerancia
+        self.resoluciones = 0
+
+    def fijar(self, filas, activas):
+        filas = np.asarray(filas, dtype=np.int32)
+        if len(filas) == 0:
+            return
+        if activas:
+            self.h.changeRowsBounds(len(filas), filas, self.inferior[filas], self.superior[filas])
+        else:
+            self.h.changeRowsBounds(len(filas), filas, np.full(len(filas), -self.inf), np.full(len(filas), self.inf))
+        self.activas[filas] = activas
+
+    def factible(self):
+        self.h.run()
+        self.resoluciones += 1
+        estado = self.h.getModelStatus()
+        if estado == self.highspy.HighsModelStatus.kOptimal:
+            return True
+        if estado in (self.highspy.HighsModelStatus.kInfeasible,
+                      self.highspy.HighsModelStatus.kUnboundedOrInfeasible):
+            return False
+        raise RuntimeError(f"HiGHS terminó con estado {self.h.modelStatusToString(estado)}")
+
+    def filas_violadas(self):
+        x = np.asarray(self.h.getSolution().col_value)
+        actividad = self.forma.actividad(x)
+        holgura = self.tolerancia * (1 + np.abs(actividad))
+        violadas = (actividad < self.forma.fila_inf - holgura) | (actividad > self.forma.fila_sup + holgura)
+        return np.flatnonzero(violadas & ~self.activas)
+
+
+def subconjunto_irreducible(problema, tolerancia=1e-7):
+    """
+    Calcula un subconjunto irreducible infactible de restricciones.
+
+    Parámetros:
+        - problema (LpProblem o FormaMatricial): Modelo a diagnosticar.
+        - tolerancia (float): Tolerancia relativa para considerar violada una fila.
+
+    Retorna:
+        - DiagnosticoInfactibilidad, o None si la relajación lineal del modelo es factible.
+    """
+    inicio = time.perf_counter()
+    forma = problema if isinstance(problema, FormaMatricial) else desde_problema(problema)
+    modelo = _Factibilidad(forma, tolerancia)
+
+    if modelo.factible():
+        return None
+
+    # 1. Filtro aditivo: activar las filas violadas hasta que el conjunto sea infactible
+    modelo.fijar(np.arange(forma.num_restricciones), False)
+    while modelo.factible():
+        violadas = modelo.filas_violadas()
+        if len(violadas) == 0:
+            # Todas las filas se satisfacen con esta solución: solo puede ser un problema numérico
+            raise RuntimeError("No se pudo aislar la infactibilidad (problema numérico)")
+        modelo.fijar(violadas, True)
+
+    # 2. Filtro de eliminación por bloques sobre el conjunto activo
+    irreducible = []
+
+    def filtrar(bloque):
+        modelo.fijar(bloque, False)
+        if not modelo.factible():
+            return  # El bloque completo sobra y queda desactivado
+        modelo.fijar(bloque, True)
+        if len(bloque) == 1:
+            irreducible.append(int(bloque[0]))
+            return
+        mitad = len(bloque) // 2
+        filtrar(bloque[:mitad])
+        filtrar(bloque[mitad:])
+
+    filtrar(np.flatnonzero(modelo.activas))
+
+    return DiagnosticoInfactibilidad(
+        restricciones=[forma.nombres_restricciones[k] for k in sorted(irreducible)],
+        resoluciones=modelo.resoluciones,
+        segundos=time.perf_counter() - inicio,
+    )
+
+
+def _construir_hospital(datos):
+    from .hospital import construir_problema_hospital
+    return construir_problema_hospital(**datos)[0]
+
+
+def _construir_residuos(datos):
+    from .residuos import construir_problema_residuos
+    return construir_problema_residuos(**datos)[0]
+
+
+def _construir_agenda(datos):
+    from .agenda import construir_problema_agenda
+    return construir_problema_agenda(**dict(datos, urgentes=set(datos["urgentes"])))[0]
+
+
+# Modelo -> función que construye el LpProblem a partir de los datos de la instancia
+CONSTRUCTORES = {
+    "hospital": _construir_hospital,
+    "residuos": _construir_residuos,
+    "agenda": _construir_agenda,
+}
+
+
+def diagnosticar_instancia(instancia, tolerancia=1e-7):
+    """
+    Construye el modelo de una instancia (formato de instancias.py) y diagnostica su infactibilidad.
+
+    Retorna:
+        - DiagnosticoInfactibilidad, o None si la relajación lineal es factible.
+    """
+    construir = CONSTRUCTORES.get(instancia["modelo"])
+    if construir is None:
+        raise ValueError(f"El modelo {instancia['modelo']!r} no admite diagnóstico")
+    return subconjunto_irreducible(construir(instancia["datos"]), tolerancia)
@@ -0,0 +1,236 @@
+"""
+Estimación del tamaño de los modelos y elección de la estrategia según la memoria disponible.
+
+El grafo de expresiones de PuLP ocupa del orden de un kilobyte por variable, así que una
+instancia grande puede agotar la memoria de un trabajador compartido antes de llegar al
+solver. estimar_modelo() predice variables, filas, no ceros y el pico de memoria a partir
+de las dimensiones de los datos, sin construir nada, y elegir_estrategia() escoge la
+estrategia más exacta que cabe en el presupuesto:
+
+- "directa": modelo de PuLP (construir_problema_*), resuelto con el solver indicado.
+- "matricial": la misma formulación armada en CSR con NumPy y resuelta con HiGHS sin PuLP.
+- "descomposicion": relajación lagrangiana (lagrangiano.py), que solo guarda unos pocos
+  arreglos especialidades x semanas y no carga el modelo en ningún solver.
+
+Las constantes de memoria se midieron con tracemalloc (CPython 3.11, PuLP 3.3) y pueden
+recalibrarse en la máquina de destino con medir_memoria() sobre una instancia pequeña.
+"""
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+
+# Pico de memoria de construir_problema_* por variable de decisión (objetos de PuLP,
+# nombres y expresiones temporales), medido con tracemalloc
+BYTES_PULP_POR_VARIABLE = {"hospital": 1600, "agenda": 560, "residuos": 1500}
+# Forma matricial: nombre de la columna, vectores por columna y CSR por no cero
+BYTES_MATRICIAL_POR_VARIABLE = 100
+BYTES_MATRICIAL_POR_NO_CERO = 16
+# Copia del modelo en el solver (matrices por filas y columnas, presolve, árbol)
+BYTES_SOLVER_POR_NO_CERO = 200
+# Descomposición lagrangiana: arreglos de trabajo especialidades x semanas
+BYTES_DESCOMPOSICION_POR_VARIABLE = 160
+
+ESTRATEGIAS = {
+    "hospital": ("directa", "matricial", "descomposicion"),
+    "agenda": ("directa",),
+    "residuos": ("directa",),
+}
+
+
+class MemoriaInsuficiente(MemoryError):
+    """Ninguna estrategia cabe en el presupuesto de memoria."""
+
+
+@dataclass
+class EstimacionModelo:
+    """
+    Tamaño previsto de un modelo.
+
+    Atributos:
+        - modelo (str): Clave del modelo.
+        - variables (int), restricciones (int), no_ceros (int): Dimensiones de la formulación de PuLP.
+        - memoria (dict): Estrategia -> pico de memoria previsto en bytes.
+    """
+    modelo: str
+    variables: int
+    restricciones: int
+    no_ceros: int
+    memoria: dict
+
+
+def _dimensiones(modelo, datos):
+    if modelo == "hospital":
+        especialidades, semanas = len(datos["prioridad"]), len(datos["recursos_disponibles"])
+        variables = especialidades * semanas
+        return variables, especialidades + variables + semanas, 3 * variables
+    if modelo == "agenda":
+        pacientes, dias, urgentes = len(datos["pacientes"]), len(datos["dias"]), len(datos["urgentes"])
+        primeros = min(datos.get("dias_urgentes", 3), dias)
+        variables = pacientes * dias
+        return variables, pacientes + dias + urgentes, 2 * variables + urgentes * primeros
+    if modelo == "residuos":
+        municipalidades, actividades = len(datos["municipalidades"]), len(datos["actividades"])
+        celdas = municipalidades * actividades
+        return celdas + municipalidades, 3 * municipalidades + celdas, 3 * celdas + 2 * municipalidades
+    raise ValueError(f"El modelo {modelo!r} no admite estimación")
+
+
+def estimar_modelo(modelo, datos):
+    """
+    Predice el tamaño y la memoria de un modelo a partir de las dimensiones de sus datos.
+
+    Parámetros:
+        - modelo (str): "hospital", "agenda" o "residuos".
+        - datos (dict): Argumentos del modelo (formato de instancias.py).
+
+    Retorna:
+        - EstimacionModelo
+    """
+    variables, restricciones, no_ceros = _dimensiones(modelo, datos)
+    solver = BYTES_SOLVER_POR_NO_CERO * no_ceros
+    memoria = {"directa": BYTES_PULP_POR_VARIABLE[modelo] * variables + solver}
+    if "matricial" in ESTRATEGIAS[modelo]:
+        # En el hospital la capacidad pasa a cotas: un no cero menos por variable
+        no_ceros_matricial = no_ceros - variables if modelo == "hospital" else no_ceros
+        memoria["matricial"] = (BYTES_MATRICIAL_POR_VARIABLE * variables
+                                + (BYTES_MATRICIAL_POR_NO_CERO + BYTES_SOLVER_POR_NO_CERO) * no_ceros_matricial)
+    if "descomposicion" in ESTRATEGIAS[modelo]:
+        memoria["descomposicion"] = BYTES_DESCOMPOSICION_POR_VARIABLE * variables
+    return EstimacionModelo(modelo, variables, restricciones, no_ceros, memoria)
+
+
+def memoria_disponible():
+    """
+    Retorna los bytes de memoria física disponibles, o None si el sistema no lo informa.
+    """
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def elegir_estrategia(modelo, datos, memoria_maxima=None):
+    """
+    Elige la estrategia más exacta cuyo pico de memoria previsto cabe en el presupuesto.
+
+    Parámetros:
+        - modelo (str), datos (dict): Como en estimar_modelo.
+        - memoria_maxima (int): Presupuesto en bytes (por defecto, la mitad de la memoria
+          disponible; sin límite si el sistema no la informa).
+
+    Retorna:
+        - tuple: (estrategia, EstimacionModelo).
+
+    Lanza:
+        - MemoriaInsuficiente: Si ninguna estrategia del modelo cabe.
+    """
+    estimacion = estimar_modelo(modelo, datos)
+    if memoria_maxima is None:
+        disponible = memoria_disponible()
+        memoria_maxima = disponible // 2 if disponible is not None else float("inf")
+    for estrategia in ESTRATEGIAS[modelo]:
+        if estimacion.memoria[estrategia] <= memoria_maxima:
+            return estrategia, estimacion
+    raise MemoriaInsuficiente(
+        f"El modelo {modelo!r} necesita al menos {min(estimacion.memoria.values()) / 2**20:.1f} MiB "
+        f"y el presupuesto es de {memoria_maxima / 2**20:.1f} MiB")
+
+
+def medir_memoria(funcion, *args, **kwargs):
+    """
+    Ejecuta funcion(*args, **kwargs) midiendo el pico de memoria asignada desde Python con tracemalloc.
+
+    No incluye la memoria de solvers en otros procesos o asignada fuera de Python.
+
+    Retorna:
+        - tuple: (resultado, pico en bytes).
+    """
+    ya_activo = tracemalloc.is_tracing()
+    if not ya_activo:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    inicial = tracemalloc.get_traced_memory()[0]
+    try:
+        resultado = funcion(*args, **kwargs)
+        return resultado, tracemalloc.get_traced_memory()[1] - inicial
+    finally:
+        if not ya_activo:
+            tracemalloc.stop()
+
+
+def _hospital_matricial(datos, opciones):
+    import highspy
+
+    from .hospital import construir_forma_hospital
+
+    forma = construir_forma_hospital(**datos)
+    h = opciones.aplicar_highs(forma.a_highs())
+    h.run()
+    if h.getInfo().primal_solution_status != 2:  # Sin solución factible
+        estado = -1 if h.getModelStatus() == highspy.HighsModelStatus.kInfeasible else 0
+        return {"estado": estado, "asignacion": None, "funcion_objetivo": None}
+    valores = np.rint(np.asarray(h.getSolution().col_value))
+    return {
+        "estado": 1 if h.getModelStatus() == highspy.HighsModelStatus.kOptimal else 0,
+        "asignacion": valores.reshape(len(datos["prioridad"]), -1),
+        "funcion_objetivo": forma.valor_objetivo(valores),
+    }
+
+
+def _hospital_directa(datos, solver):
+    from .hospital import construir_problema_hospital
+
+    problema, x = construir_problema_hospital(**datos)
+    problema.solve(solver)
+    asignacion = np.array([[variable.varValue or 0.0 for variable in fila] for fila in x])
+    return {"estado": problema.status, "asignacion": asignacion, "funcion_objetivo": problema.objective.value()}
+
+
+def planificar_hospital_automatico(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                   memoria_maxima=None, solver=None, opciones=None, perfilar=False):
+    """
+    Planificación hospitalaria con la estrategia que cabe en el presupuesto de memoria.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - memoria_maxima (int): Presupuesto en bytes (ver elegir_estrategia).
+        - solver: Solver de PuLP de la estrategia "directa".
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos de HiGHS en la estrategia "matricial".
+        - perfilar (bool): Medir con tracemalloc el pico de memoria real.
+
+    Retorna:
+        - dict: Claves "estado", "asignacion" (arreglo especialidades x semanas),
+          "funcion_objetivo", "estrategia", "memoria_estimada", "tiempo" y, si perfilar,
+          "memoria_medida". Con "descomposicion" se agregan las claves de
+          planificar_hospital_lagrangiano (p. ej. "cota_inferior" y "gap").
+
+    Lanza:
+        - MemoriaInsuficiente: Si ni la descomposición cabe en el presupuesto.
+    """
+    from .lagrangiano import planificar_hospital_lagrangiano
+    from .resolucion import OpcionesResolucion
+
+    datos = {"prioridad": prioridad, "pacientes": pacientes, "capacidad": capacidad,
+             "recursos_por_paciente": recursos_por_paciente, "recursos_disponibles": recursos_disponibles}
+    estrategia, estimacion = elegir_estrategia("hospital", datos, memoria_maxima)
+    inicio = time.perf_counter()
+
+    if estrategia == "directa":
+        ejecutar, argumentos = _hospital_directa, (datos, solver)
+    elif estrategia == "matricial":
+        ejecutar, argumentos = _hospital_matricial, (datos, opciones or OpcionesResolucion())
+    else:
+        ejecutar, argumentos = (lambda d: planificar_hospital_lagrangiano(**d)), (datos,)
+    if perfilar:
+        resultado, pico = medir_memoria(ejecutar, *argumentos)
+        resultado["memoria_medida"] = pico
+    else:
+        resultado = ejecutar(*argumentos)
+
+    resultado.update(estrategia=estrategia, memoria_estimada=estimacion.memoria[estrategia],
+                     tiempo=time.perf_counter() - inicio)
+    return resultado
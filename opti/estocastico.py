@@ -0,0 +1,194 @@
+"""
+Planificación hospitalaria estocástica en dos etapas (método L-shaped / Benders).
+
+Primera etapa: se reservan y[i][j] cupos por especialidad y semana, dentro de la capacidad
+y de los recursos semanales, con un costo de reserva por cupo. Segunda etapa: en cada
+escenario s de demanda P_s[i], se atienden hasta min(P_s[i], sum_j y[i][j]) pacientes y se
+paga la prioridad de los no atendidos:
+
+    Q_s(y) = sum_i p[i] * max(P_s[i] - sum_j y[i][j], 0)
+
+El recurso tiene forma cerrada, así que todos los escenarios se evalúan a la vez con
+NumPy (valor y subgradiente), sin construir un modelo por escenario ni el modelo extensivo.
+El maestro (PuLP) solo contiene las variables de primera etapa y los cortes de
+optimalidad, uno agregado por iteración o uno por escenario (multicorte). Se resuelve
+primero como relajación continua, que converge en pocas iteraciones, y luego como modelo
+entero con los cortes acumulados; las reservas continuas redondeadas hacia abajo también
+se evalúan como candidatas a la cota superior.
+"""
+import time
+
+import numpy as np
+
+
+def evaluar_recurso(reservados, demanda, prioridad):
+    """
+    Evalúa el recurso de todos los escenarios para una reserva dada.
+
+    Parámetros:
+        - reservados (array I): Cupos reservados por especialidad (sum_j y[i][j]).
+        - demanda (array S x I): Pacientes por escenario y especialidad.
+        - prioridad (array I): Prioridad de cada especialidad.
+
+    Retorna:
+        - tuple: (Q, g) con el costo de recurso de cada escenario (array S) y un
+          subgradiente respecto de los cupos reservados (array S x I).
+    """
+    faltante = demanda - reservados[None, :]
+    Q = np.maximum(faltante, 0) @ prioridad
+    g = np.where(faltante > 0, -prioridad[None, :], 0.0)
+    return Q, g
+
+
+def _completar(reserva, capacidad, recursos_por_paciente, recursos_disponibles, demanda, prioridad, pi, kappa):
+    # Agrega cupos de a uno a la especialidad de mayor beneficio marginal esperado
+    # (p[i] * P(P_s[i] > Y[i]) - kappa[i]) mientras haya una semana con holgura para ella
+    reserva = reserva.copy()
+    holgura = recursos_disponibles - recursos_por_paciente @ reserva
+    while True:
+        Y = reserva.sum(axis=1)
+        beneficio = prioridad * (pi @ (demanda > Y[None, :])) - kappa
+        cabe = (reserva < capacidad) & (recursos_por_paciente[:, None] <= holgura[None, :] + 1e-9)
+        beneficio[~cabe.any(axis=1)] = 0
+        i = int(np.argmax(beneficio))
+        if beneficio[i] <= 1e-12:
+            return reserva
+        j = int(np.argmax(np.where(cabe[i], holgura, -np.inf)))
+        reserva[i, j] += 1
+        holgura[j] -= recursos_por_paciente[i]
+
+
+def planificar_hospital_estocastico(prioridad, escenarios, capacidad, recursos_por_paciente, recursos_disponibles,
+                                    probabilidades=None, costo_reserva=0.0, multicorte=False, iteraciones=100,
+                                    tolerancia_gap=1e-3, solver=None):
+    """
+    Resuelve la planificación hospitalaria con demanda incierta por el método L-shaped.
+
+    Parámetros:
+        - prioridad, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - escenarios (list of lists): Pacientes en espera por especialidad en cada escenario.
+        - probabilidades (list): Probabilidad de cada escenario (por defecto, uniforme).
+        - costo_reserva (float o list): Costo de reservar un cupo, global o por especialidad.
+        - multicorte (bool): Agregar un corte por escenario en vez de uno agregado (menos
+          iteraciones, pero un maestro más grande).
+        - iteraciones (int): Máximo de iteraciones del maestro.
+        - tolerancia_gap (float): Gap relativo entre cotas con el que se detiene.
+        - solver: Solver de PuLP para el maestro (por defecto el de PuLP, CBC). La cota
+          inferior de la fase entera es exacta solo si el solver cierra su propio gap.
+
+    Retorna:
+        - dict: Claves "estado" (1 si las cotas se acercaron a tolerancia_gap, 0 si se agotaron
+          las iteraciones antes, o el estado de PuLP del maestro si este falló), "reservas"
+          (y_i_j -> valor), "funcion_objetivo" (costo de reserva más recurso esperado de la
+          mejor reserva), "cota_inferior", "gap", "recurso_por_escenario", "iteraciones" y
+          "tiempo".
+
+    Lanza:
+        - ValueError: Si los escenarios no coinciden con las especialidades, las
+          probabilidades no son válidas o iteraciones es menor que 1.
+    """
+    from pulp import LpMinimize, LpProblem, LpVariable, lpSum
+
+    inicio = time.perf_counter()
+    p = np.asarray(prioridad, dtype=float)
+    demanda = np.asarray(escenarios, dtype=float)
+    num_escenarios, num_especialidades = demanda.shape
+    num_semanas = len(recursos_disponibles)
+    if len(p) != num_especialidades:
+        raise ValueError("Cada escenario debe tener un número de pacientes por especialidad")
+    pi = (np.full(num_escenarios, 1 / num_escenarios) if probabilidades is None
+          else np.asarray(probabilidades, dtype=float))
+    if len(pi) != num_escenarios or not np.isclose(pi.sum(), 1):
+        raise ValueError("Las probabilidades deben ser una por escenario y sumar 1")
+    if iteraciones < 1:
+        raise ValueError("Se necesita al menos una iteración del maestro")
+    kappa = np.broadcast_to(np.asarray(costo_reserva, dtype=float), (num_especialidades,))
+    c = np.asarray(capacidad, dtype=float)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    R = np.asarray(recursos_disponibles, dtype=float)
+
+    # Maestro: variables de primera etapa y cortes
+    maestro = LpProblem("Maestro_Hospital_Estocastico", LpMinimize)
+    y = [[LpVariable(f"y_{i+1}_{j+1}", lowBound=0, upBound=capacidad[i][j], cat="Integer")
+          for j in range(num_semanas)] for i in range(num_especialidades)]
+    reservados = [lpSum(fila) for fila in y]
+    if multicorte:
+        theta = [LpVariable(f"theta_{s+1}", lowBound=0) for s in range(num_escenarios)]
+        recurso_esperado = lpSum(pi[s] * theta[s] for s in range(num_escenarios))
+    else:
+        theta = LpVariable("theta", lowBound=0)
+        recurso_esperado = theta
+    maestro += lpSum(kappa[i] * reservados[i] for i in range(num_especialidades)) + recurso_esperado
+    for j in range(num_semanas):
+        maestro += (lpSum(recursos_por_paciente[i] * y[i][j] for i in range(num_especialidades))
+                    <= recursos_disponibles[j], f"Recursos_Semana_{j+1}")
+
+    # Fase 1: maestro continuo. Fase 2: maestro entero con los cortes de la fase 1
+    for fila in y:
+        for variable in fila:
+            variable.cat = "Continuous"
+    fase_entera = False
+
+    cota_superior, cota_inferior = np.inf, -np.inf
+    mejor = None
+    iteracion = 0
+    for iteracion in range(1, iteraciones + 1):
+        maestro.solve(solver)
+        if maestro.status != 1:
+            return {"estado": maestro.status, "reservas": {}, "funcion_objetivo": None, "cota_inferior": None,
+                    "gap": None, "recurso_por_escenario": None, "iteraciones": iteracion,
+                    "tiempo": time.perf_counter() - inicio}
+        cota_inferior = max(cota_inferior, maestro.objective.value())
+
+        actual = np.array([[variable.varValue or 0.0 for variable in fila] for fila in y])
+        Y = actual.sum(axis=1)
+        Q, g = evaluar_recurso(Y, demanda, p)
+        valor = float(kappa @ Y + pi @ Q)
+
+        # Redondear hacia abajo una reserva es siempre factible (recursos "<=" con coeficientes
+        # no negativos), así que también la fase continua aporta planes enteros, que se
+        # completan con la holgura que deja el redondeo
+        entero = np.floor(actual + 1e-6)
+        if not fase_entera:
+            entero = _completar(entero, c, r, R, demanda, p, pi, kappa)
+        Q_entero = evaluar_recurso(entero.sum(axis=1), demanda, p)[0]
+        valor_entero = float(kappa @ entero.sum(axis=1) + pi @ Q_entero)
+        if valor_entero < cota_superior:
+            cota_superior, mejor = valor_entero, (entero, Q_entero)
+
+        if cota_superior - cota_inferior <= tolerancia_gap * max(abs(cota_superior), 1.0):
+            break
+        if not fase_entera and valor - cota_inferior <= tolerancia_gap * max(abs(valor), 1.0):
+            # La relajación convergió: los cortes ya la describen y se pasa al maestro entero
+            fase_entera = True
+            for fila in y:
+                for variable in fila:
+                    variable.cat = "Integer"
+            continue
+
+        # Cortes de optimalidad: theta >= Q(Y_k) + g_k (Y - Y_k)
+        if multicorte:
+            for s in np.flatnonzero(Q > np.array([t.varValue or 0.0 for t in theta]) + 1e-9):
+                maestro += (theta[s] >= float(Q[s]) + lpSum(float(g[s, i]) * (reservados[i] - float(Y[i]))
+                                                             for i in np.flatnonzero(g[s])),
+                            f"Corte_{iteracion}_{s+1}")
+        else:
+            g_esperado = pi @ g
+            maestro += (theta >= float(pi @ Q) + lpSum(float(g_esperado[i]) * (reservados[i] - float(Y[i]))
+                                                       for i in np.flatnonzero(g_esperado)),
+                        f"Corte_{iteracion}")
+
+    actual, Q = mejor
+    gap = max(cota_superior - cota_inferior, 0.0) / max(abs(cota_superior), 1.0)
+    return {
+        "estado": 1 if gap <= tolerancia_gap else 0,
+        "reservas": {f"y_{i+1}_{j+1}": float(actual[i, j])
+                     for i in range(num_especialidades) for j in range(num_semanas)},
+        "funcion_objetivo": cota_superior,
+        "cota_inferior": cota_inferior,
+        "gap": gap,
+        "recurso_por_escenario": Q.tolist(),
+        "iteraciones": iteracion,
+        "tiempo": time.perf_counter() - inicio,
+    }
@@ -0,0 +1,174 @@
+"""
+Generadores de instancias aleatorias para los modelos del paquete.
+
+Los generadores generar_ejemplos_* producen muchas instancias pequeñas con el módulo random.
+Los generadores generar_*_grande producen una instancia grande con NumPy, sin bucles de
+Python sobre los coeficientes, con parámetros para controlar su estructura (holgura de los
+recursos y correlación entre prioridad o impacto y consumo) y son deterministas para una
+semilla dada.
+"""
+import random
+
+import numpy as np
+
+ACTIVIDADES_PORCENTUAL = ["Educacion Ambiental", "Reciclaje", "Economia Circular"]
+MUNICIPALIDADES_PORCENTUAL = ["A", "B", "C"]
+
+
+def generar_ejemplos_hospital(cantidad=10, semanas=4, semilla=None):
+    """
+    Genera instancias aleatorias para planificar_hospital.
+
+    Parámetros:
+        - cantidad (int): Número de instancias a generar.
+        - semanas (int): Semanas del horizonte de planificación.
+        - semilla (int): Semilla del generador (None para no fijarla).
+
+    Retorna:
+        - list: Lista de diccionarios con los argumentos de planificar_hospital.
+    """
+    rng = random.Random(semilla)
+    ejemplos = []
+    for _ in range(cantidad):
+        n = rng.randint(3, 5)  # Número de especialidades (entre 3 y 5)
+
+        ejemplos.append({
+            "prioridad": [rng.randint(1, 10) for _ in range(n)],
+            "pacientes": [rng.randint(20, 50) for _ in range(n)],
+            "capacidad": [[rng.randint(5, 15) for _ in range(semanas)] for _ in range(n)],
+            "recursos_por_paciente": [rng.randint(1, 3) for _ in range(n)],
+            "recursos_disponibles": [rng.randint(50, 100) for _ in range(semanas)],
+        })
+
+    return ejemplos
+
+
+def generar_ejemplos_residuos_porcentual(cantidad=10, semilla=None):
+    """
+    Genera instancias aleatorias para optimizar_residuos_porcentual.
+
+    Parámetros:
+        - cantidad (int): Número de instancias a generar.
+        - semilla (int): Semilla del generador (None para no fijarla).
+
+    Retorna:
+        - list: Lista de diccionarios con los argumentos de optimizar_residuos_porcentual.
+    """
+    rng = random.Random(semilla)
+    actividades = ACTIVIDADES_PORCENTUAL
+    municipalidades = MUNICIPALIDADES_PORCENTUAL
+    ejemplos = []
+
+    for _ in range(cantidad):
+        ejemplos.append({
+            "actividades": list(actividades),
+            "municipalidades": list(municipalidades),
+            "residuos_generados": {m: rng.randint(100, 500) for m in municipalidades},
+            "costos_actividad": {
+                (a, m): rng.randint(5, 20) for a in actividades for m in municipalidades
+            },
+            "impacto_actividad": {
+                (a, m): rng.uniform(1, 10) for a in actividades for m in municipalidades
+            },
+            "presupuesto_municipal": {m: rng.randint(200, 500) for m in municipalidades},
+            "max_fondos_actividad": {
+                (a, m): rng.randint(50, 150) for a in actividades for m in municipalidades
+            },
+            "max_reduccion_porcentual": {m: rng.randint(20, 50) for m in municipalidades},
+        })
+
+    return ejemplos
+
+
+def _uniformes_correlacionadas(rng, n, correlacion):
+    # Dos muestras uniformes en (0, 1) cuyos rangos tienen correlación aproximada "correlacion"
+    # (cópula gaussiana, transformada por rangos para no depender de la normal acumulada)
+    if not -1 <= correlacion <= 1:
+        raise ValueError("La correlación debe estar entre -1 y 1")
+    z = rng.standard_normal((2, n))
+    z[1] = correlacion * z[0] + np.sqrt(1 - correlacion ** 2) * z[1]
+    rangos = np.argsort(np.argsort(z, axis=1), axis=1)
+    return (rangos + 0.5) / n
+
+
+def generar_hospital_grande(especialidades, semanas=52, holgura=0.8, correlacion=0.0, prioridad_maxima=10,
+                            recursos_maximos=5, semilla=None, listas=False):
+    """
+    Genera una instancia grande para planificar_hospital.
+
+    Parámetros:
+        - especialidades (int): Número de especialidades.
+        - semanas (int): Semanas del horizonte de planificación.
+        - holgura (float): Recursos disponibles de cada semana como fracción de los que se
+          necesitarían para usar toda la capacidad de esa semana (menor que 1: los recursos
+          son la restricción activa; mayor o igual que 1: lo es la capacidad).
+        - correlacion (float): Correlación entre la prioridad de una especialidad y los
+          recursos que consume cada paciente (positiva: lo urgente es más caro).
+        - prioridad_maxima (int), recursos_maximos (int): Rangos de prioridad y de recursos por paciente.
+        - semilla (int): Semilla del generador (None para no fijarla).
+        - listas (bool): Retornar listas de Python (serializables a JSON) en vez de arreglos.
+
+    Retorna:
+        - dict: Argumentos de planificar_hospital. La instancia siempre es factible (no
+          atender a nadie lo es) y toda especialidad tiene pacientes y capacidad.
+    """
+    rng = np.random.default_rng(semilla)
+    u_prioridad, u_recursos = _uniformes_correlacionadas(rng, especialidades, correlacion)
+    prioridad = 1 + np.floor(u_prioridad * prioridad_maxima).astype(np.int64)
+    recursos_por_paciente = 1 + np.floor(u_recursos * recursos_maximos).astype(np.int64)
+
+    # La capacidad semanal media alcanza para atender a toda la espera en el horizonte
+    pacientes = rng.integers(20, 50 * max(semanas // 4, 1), size=especialidades, endpoint=True)
+    media = np.maximum(pacientes / semanas, 1.0)
+    capacidad = rng.poisson(media[:, None], size=(especialidades, semanas)) + 1
+    recursos_disponibles = np.maximum(np.floor(holgura * (recursos_por_paciente @ capacidad)),
+                                      recursos_por_paciente.max()).astype(np.int64)
+
+    datos = {
+        "prioridad": prioridad,
+        "pacientes": pacientes,
+        "capacidad": capacidad,
+        "recursos_por_paciente": recursos_por_paciente,
+        "recursos_disponibles": recursos_disponibles,
+    }
+    return {clave: valor.tolist() for clave, valor in datos.items()} if listas else datos
+
+
+def generar_residuos_grande(municipalidades, actividades, holgura=0.8, correlacion=0.0, semilla=None):
+    """
+    Genera una instancia grande para optimizar_gestion_residuos.
+
+    Parámetros:
+        - municipalidades (int): Número de municipalidades.
+        - actividades (int): Número de actividades.
+        - holgura (float): Límite de residuos R[m] como fracción de la mayor reducción que
+          permiten los fondos de la municipalidad (menor que 1: el límite es activo).
+        - correlacion (float): Correlación entre el impacto de una actividad y su costo mínimo.
+        - semilla (int): Semilla del generador (None para no fijarla).
+
+    Retorna:
+        - dict: Argumentos de optimizar_gestion_residuos. Los fondos de cada municipalidad
+          cubren siempre la suma de los costos mínimos, así que la instancia es factible.
+    """
+    rng = np.random.default_rng(semilla)
+    nombres_municipalidades = [f"M{m+1}" for m in range(municipalidades)]
+    nombres_actividades = [f"A{a+1}" for a in range(actividades)]
+
+    u_impacto, u_costo = _uniformes_correlacionadas(rng, actividades, correlacion)
+    I = np.round(1000 + 19000 * u_impacto)
+    C = np.round(100000 + 900000 * u_costo, -3)
+    F = np.round(C.sum() * (1 + rng.uniform(0.1, 2.0, size=municipalidades)), -3)
+
+    # Mayor reducción posible: los mínimos de todas las actividades y el resto de los fondos
+    # en la actividad de mayor impacto por peso
+    maximo = I.sum() + (F - C.sum()) * (I / C).max()
+    R = np.maximum(np.floor(holgura * maximo), np.ceil(I.sum()))
+
+    return {
+        "municipalidades": nombres_municipalidades,
+        "actividades": nombres_actividades,
+        "R": dict(zip(nombres_municipalidades, R.tolist())),
+        "F": dict(zip(nombres_municipalidades, F.tolist())),
+        "I": dict(zip(nombres_actividades, I.tolist())),
+        "C": dict(zip(nombres_actividades, C.tolist())),
+    }
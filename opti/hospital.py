@@ -0,0 +1,329 @@
+"""
+Modelo de planificación hospitalaria (pacientes atendidos por especialidad y semana).
+
+El módulo no importa PuLP al cargarse: el backend se importa dentro de las funciones
+que construyen el modelo, de modo que importar la biblioteca es inmediato.
+"""
+
+
+def construir_problema_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles):
+    """
+    Construye el problema de planificación hospitalaria sin resolverlo.
+
+    Parámetros:
+        - prioridad (list): Lista con la prioridad de cada especialidad.
+        - pacientes (list): Lista con el número de pacientes en lista de espera por especialidad.
+        - capacidad (list of lists): Matriz de capacidad semanal por especialidad y semana.
+        - recursos_por_paciente (list): Lista de recursos necesarios por paciente por especialidad.
+        - recursos_disponibles (list): Lista de recursos disponibles por semana.
+
+    Retorna:
+        - tuple: (problema, x) con el LpProblem y la matriz de variables x[i][j].
+    """
+    from pulp import LpProblem, LpMinimize, LpVariable, lpSum
+
+    num_especialidades = len(prioridad)
+    num_semanas = len(recursos_disponibles)
+
+    # Crear el problema de optimización
+    problema = LpProblem("Planificacion_Hospitalaria", LpMinimize)
+
+    # Variables de decisión
+    x = [[LpVariable(f"x_{i+1}_{j+1}", lowBound=0, cat="Integer") for j in range(num_semanas)]
+         for i in range(num_especialidades)]
+
+    # Función objetivo: Minimizar los pacientes no atendidos ponderados por prioridad
+    problema += lpSum(prioridad[i] * (pacientes[i] - lpSum(x[i][j] for j in range(num_semanas)))
+                      for i in range(num_especialidades))
+
+    # Restricciones:
+    # 1. No atender más pacientes de los que están en lista de espera
+    for i in range(num_especialidades):
+        problema += lpSum(x[i][j] for j in range(num_semanas)) <= pacientes[i], f"Pacientes_Especialidad_{i+1}"
+
+    # 2. No exceder la capacidad semanal por especialidad
+    for i in range(num_especialidades):
+        for j in range(num_semanas):
+            problema += x[i][j] <= capacidad[i][j], f"Capacidad_{i+1}_{j+1}"
+
+    # 3. Los recursos utilizados no deben superar los disponibles semanalmente
+    for j in range(num_semanas):
+        problema += (lpSum(recursos_por_paciente[i] * x[i][j] for i in range(num_especialidades))
+                     <= recursos_disponibles[j], f"Recursos_Semana_{j+1}")
+
+    return problema, x
+
+
+def construir_forma_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles):
+    """
+    Construye el problema de planificación hospitalaria directamente en forma matricial,
+    con NumPy y sin objetos de PuLP (ver matricial.py).
+
+    Es el mismo modelo de construir_problema_hospital, salvo que la capacidad semanal se
+    impone como cota superior de cada variable en vez de como fila. Las columnas están en
+    orden x_1_1, x_1_2, ..., x_I_J.
+    """
+    import numpy as np
+
+    from .matricial import MINIMIZAR, FormaMatricial
+
+    p = np.asarray(prioridad, dtype=float)
+    P = np.asarray(pacientes, dtype=float)
+    c = np.asarray(capacidad, dtype=float)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    R = np.asarray(recursos_disponibles, dtype=float)
+    num_especialidades, num_semanas = c.shape
+    n = num_especialidades * num_semanas
+
+    # Filas Pacientes_Especialidad_i (la fila i usa las columnas i*J .. i*J+J-1) y
+    # Recursos_Semana_j (la fila j usa las columnas j, J+j, 2J+j, ...)
+    columnas_recursos = np.arange(n).reshape(num_especialidades, num_semanas).T.ravel()
+    return FormaMatricial(
+        nombres_variables=[f"x_{i+1}_{j+1}" for i in range(num_especialidades) for j in range(num_semanas)],
+        nombres_restricciones=([f"Pacientes_Especialidad_{i+1}" for i in range(num_especialidades)]
+                               + [f"Recursos_Semana_{j+1}" for j in range(num_semanas)]),
+        c=np.repeat(-p, num_semanas),
+        constante=float(p @ P),
+        sentido=MINIMIZAR,
+        indptr=np.concatenate([np.arange(0, n + 1, num_semanas),
+                               n + np.arange(num_especialidades, n + 1, num_especialidades)]).astype(np.int64),
+        indices=np.concatenate([np.arange(n), columnas_recursos]).astype(np.int64),
+        datos=np.concatenate([np.ones(n), np.tile(r, num_semanas)]),
+        fila_inf=np.full(num_especialidades + num_semanas, -np.inf),
+        fila_sup=np.concatenate([P, R]),
+        col_inf=np.zeros(n),
+        col_sup=c.ravel(),
+        entera=np.ones(n, dtype=bool),
+    )
+
+
+def recopilar_resultados(problema, x):
+    """
+    Recopila el estado, los valores de x[i][j] y el valor de la función objetivo.
+
+    Retorna:
+        - dict: Diccionario con las claves "estado", "estado_solucion", "variables" y "funcion_objetivo".
+          "estado_solucion" distingue una solución óptima (1) de una factible sin probar
+          optimalidad (2), p. ej. cuando se alcanzó el tiempo límite.
+    """
+    resultados = {
+        "estado": problema.status,
+        "estado_solucion": problema.sol_status,
+        "variables": {},
+        "funcion_objetivo": problema.objective.value()
+    }
+
+    for i, fila in enumerate(x):
+        for j, variable in enumerate(fila):
+            resultados["variables"][f"x_{i+1}_{j+1}"] = variable.varValue
+
+    return resultados
+
+
+def planificar_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles, solver=None):
+    """
+    Resuelve el problema de planificación hospitalaria basado en los parámetros dados.
+
+    Parámetros:
+        - prioridad (list): Lista con la prioridad de cada especialidad.
+        - pacientes (list): Lista con el número de pacientes en lista de espera por especialidad.
+        - capacidad (list of lists): Matriz de capacidad semanal por especialidad y semana.
+        - recursos_por_paciente (list): Lista de recursos necesarios por paciente por especialidad.
+        - recursos_disponibles (list): Lista de recursos disponibles por semana.
+        - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorna:
+        - dict: Diccionario con los valores de las variables de decisión y el valor de la función objetivo.
+    """
+    problema, x = construir_problema_hospital(prioridad, pacientes, capacidad,
+                                              recursos_por_paciente, recursos_disponibles)
+
+    # Resolver el problema
+    problema.solve(solver)
+
+    return recopilar_resultados(problema, x)
+
+
+def planificar_hospital_progresivo(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                   opciones=None):
+    """
+    Generador que entrega cada plan mejorado mientras se resuelve el problema.
+
+    Cada evento es un Incumbente (ver resolucion.py) con el objetivo, la cota, el gap y los
+    valores x_i_j del plan. El último evento tiene final=True. Abandonar el generador antes
+    de tiempo interrumpe la búsqueda.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos.
+    """
+    from .resolucion import resolver_progresivo
+
+    problema, _ = construir_problema_hospital(prioridad, pacientes, capacidad,
+                                              recursos_por_paciente, recursos_disponibles)
+    yield from resolver_progresivo(problema, opciones)
+
+
+def planificar_hospital_relajado(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                 tolerancia_gap=0.01, solver=None):
+    """
+    Planificación hospitalaria por relajación lineal y redondeo (ver relajacion.py).
+
+    Como todas las restricciones son "<=" con coeficientes no negativos, redondear hacia abajo
+    la solución de la relajación siempre es factible; la heurística completa después la
+    capacidad sobrante. El modelo se arma con construir_forma_hospital y el LpProblem solo
+    se construye si el gap frente a la cota de la relajación supera tolerancia_gap, para
+    resolver el modelo entero con "solver".
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - tolerancia_gap (float): Gap relativo aceptado sin resolver el modelo entero.
+        - solver: Solver de PuLP para el modelo entero, si hace falta.
+
+    Retorna:
+        - dict: El mismo de planificar_hospital, más las claves "cota", "gap" y "metodo"
+          ("relajacion" o "entero").
+    """
+    from .relajacion import relajar_y_redondear, resolver_entero
+
+    forma = construir_forma_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles)
+    relajado = relajar_y_redondear(forma)
+    if relajado["infactible"]:
+        return {"estado": -1, "estado_solucion": 0, "variables": dict.fromkeys(forma.nombres_variables),
+                "funcion_objetivo": None, "cota": None, "gap": None, "metodo": "relajacion"}
+
+    if relajado["gap"] is None or relajado["gap"] > tolerancia_gap:
+        problema, x = construir_problema_hospital(prioridad, pacientes, capacidad,
+                                                  recursos_por_paciente, recursos_disponibles)
+        resumen = resolver_entero(problema, forma, relajado, solver)
+        resultados = recopilar_resultados(problema, x)
+        resultados.update(cota=resumen["cota"], gap=resumen["gap"], metodo=resumen["metodo"])
+        return resultados
+
+    return {
+        "estado": 1,
+        "estado_solucion": 1 if relajado["gap"] == 0 else 2,
+        "variables": dict(zip(forma.nombres_variables, relajado["x"].tolist())),
+        "funcion_objetivo": relajado["funcion_objetivo"],
+        "cota": relajado["cota"],
+        "gap": relajado["gap"],
+        "metodo": "relajacion",
+    }
+
+
+def _consumo_disperso(consumo, disponibilidad, num_especialidades):
+    # Normaliza el consumo a (nombres de recursos, {recurso: (especialidades, unidades)}) y la
+    # disponibilidad a una lista por recurso, con solo los términos no nulos
+    if isinstance(consumo, dict):
+        recursos = list(consumo)
+        terminos = {k: [(i, u) for i, u in consumo[recurso].items() if u] for k, recurso in enumerate(recursos)}
+    else:
+        if hasattr(consumo, "tocoo"):  # Matriz dispersa (p. ej. de scipy.sparse)
+            coo = consumo.tocoo()
+            tripletas = zip(coo.row.tolist(), coo.col.tolist(), coo.data.tolist())
+            num_recursos = coo.shape[1]
+        else:
+            tripletas = [(i, k, u) for i, fila in enumerate(consumo) for k, u in enumerate(fila)]
+            num_recursos = len(consumo[0]) if len(consumo) else 0
+        recursos = [str(k + 1) for k in range(num_recursos)]
+        terminos = {k: [] for k in range(num_recursos)}
+        for i, k, u in tripletas:
+            if u:
+                terminos[k].append((i, u))
+    for k, lista in terminos.items():
+        if any(not 0 <= i < num_especialidades for i, _ in lista):
+            raise ValueError(f"El recurso {recursos[k]!r} tiene consumo para una especialidad inexistente")
+
+    if isinstance(disponibilidad, dict):
+        faltantes = set(recursos) - set(disponibilidad)
+        if faltantes:
+            raise ValueError(f"Falta la disponibilidad de los recursos: {sorted(faltantes)}")
+        disponibilidad = [disponibilidad[recurso] for recurso in recursos]
+    elif len(disponibilidad) != len(recursos):
+        raise ValueError("Debe haber una fila de disponibilidad semanal por recurso")
+    return recursos, terminos, disponibilidad
+
+
+def construir_problema_hospital_multirecurso(prioridad, pacientes, capacidad, consumo, disponibilidad):
+    """
+    Construye el problema de planificación hospitalaria con varios tipos de recursos.
+
+    Generaliza construir_problema_hospital: en vez de un recurso escalar, cada especialidad
+    consume unidades de algunos recursos (camas, horas de pabellón, enfermería, imágenes...)
+    por paciente atendido, y cada recurso tiene su propia disponibilidad semanal. Solo se
+    agregan los términos no nulos del consumo, así que el armado de las filas de recursos
+    es proporcional a no ceros x semanas y no a especialidades x recursos x semanas. La
+    capacidad semanal se impone como cota superior de cada variable, sin filas.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad: Los mismos de construir_problema_hospital.
+        - consumo: Unidades de cada recurso por paciente, como diccionario
+          {recurso: {índice de especialidad: unidades}} o como matriz especialidades x
+          recursos (lista de listas o matriz dispersa con tocoo(), como las de scipy.sparse).
+        - disponibilidad: Unidades disponibles por semana de cada recurso, como diccionario
+          {recurso: lista semanal} o lista de listas (recursos x semanas).
+
+    Retorna:
+        - tuple: (problema, x) con el LpProblem y la matriz de variables x[i][j]. Las filas de
+          recursos se llaman "Recursos_{recurso}_Semana_{j}" (recursos numerados desde 1 si
+          el consumo se da como matriz).
+    """
+    from pulp import LpAffineExpression, LpConstraint, LpConstraintLE, LpMinimize, LpProblem, LpVariable
+
+    num_especialidades = len(prioridad)
+    recursos, terminos, disponibilidad = _consumo_disperso(consumo, disponibilidad, num_especialidades)
+    num_semanas = len(disponibilidad[0]) if disponibilidad else len(capacidad[0])
+
+    problema = LpProblem("Planificacion_Hospitalaria_Multirecurso", LpMinimize)
+    x = [[LpVariable(f"x_{i+1}_{j+1}", lowBound=0, upBound=capacidad[i][j], cat="Integer")
+          for j in range(num_semanas)] for i in range(num_especialidades)]
+
+    # Función objetivo: Minimizar los pacientes no atendidos ponderados por prioridad
+    problema.setObjective(LpAffineExpression(
+        [(variable, -prioridad[i]) for i, fila in enumerate(x) for variable in fila],
+        constant=sum(p * P for p, P in zip(prioridad, pacientes))))
+
+    # 1. No atender más pacientes de los que están en lista de espera
+    for i, fila in enumerate(x):
+        problema.addConstraint(LpConstraint(LpAffineExpression([(variable, 1) for variable in fila]),
+                                            LpConstraintLE, f"Pacientes_Especialidad_{i+1}", pacientes[i]))
+
+    # 2. Cada recurso, cada semana, solo con las especialidades que lo consumen
+    for k, recurso in enumerate(recursos):
+        if not terminos[k]:
+            continue
+        for j in range(num_semanas):
+            problema.addConstraint(LpConstraint(LpAffineExpression([(x[i][j], u) for i, u in terminos[k]]),
+                                                LpConstraintLE, f"Recursos_{recurso}_Semana_{j+1}",
+                                                disponibilidad[k][j]))
+
+    return problema, x
+
+
+def planificar_hospital_multirecurso(prioridad, pacientes, capacidad, consumo, disponibilidad, solver=None):
+    """
+    Resuelve la planificación hospitalaria con varios tipos de recursos.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, consumo, disponibilidad: Los mismos de
+          construir_problema_hospital_multirecurso.
+        - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorna:
+        - dict: El mismo de planificar_hospital.
+    """
+    problema, x = construir_problema_hospital_multirecurso(prioridad, pacientes, capacidad, consumo, disponibilidad)
+    problema.solve(solver)
+    return recopilar_resultados(problema, x)
+
+
+def imprimir_resultados(resultados):
+    """
+    Muestra por pantalla el resultado de planificar_hospital.
+    """
+    print("Estado de la solución:", resultados["estado"])
+    for variable, valor in resultados["variables"].items():
+        print(f"{variable}: {valor}")
+    print("Valor de la función objetivo:", resultados["funcion_objetivo"])
@@ -0,0 +1,198 @@
+"""
+Planificación hospitalaria con llegadas semanales y arrastre de la lista de espera.
+
+En planificar_hospital la lista de espera pacientes[i] es un stock fijo. Aquí llegan
+a[i][j] pacientes nuevos cada semana y los no atendidos pasan a la semana siguiente:
+
+    Flujo_i_j:          x[i][j] + b[i][j] - b[i][j-1] = a[i][j]     (b[i][0] = pacientes[i])
+    Recursos_Semana_j:  sum_i r[i] x[i][j] <= R[j]
+                        0 <= x[i][j] <= capacidad[i][j] enteras,  b[i][j] >= 0
+
+donde b[i][j] es la lista de espera al final de la semana j. Se minimiza la espera
+ponderada por prioridad, sum_i sum_j penalizacion_espera * p[i] * b[i][j] (pacientes-semana),
+más penalizacion_final * p[i] * b[i][J] por los que quedan en espera al final del horizonte.
+
+Cada fila de flujo usa a lo más tres columnas (escalera por especialidad) y cada columna x
+aparece además en una sola fila de recursos, así que la matriz tiene menos de 4 I J no
+ceros y se arma directamente en CSR con NumPy, en tiempo lineal en el horizonte.
+"""
+import time
+
+import numpy as np
+
+from .matricial import MINIMIZAR, FormaMatricial
+
+
+def _llegadas(llegadas, num_especialidades, num_semanas):
+    # Matriz especialidades x semanas, o un vector con las llegadas semanales de cada especialidad
+    a = np.asarray(llegadas, dtype=float)
+    if a.ndim == 1:
+        a = np.repeat(a[:, None], num_semanas, axis=1)
+    if a.shape != (num_especialidades, num_semanas):
+        raise ValueError(f"Se esperaban llegadas de forma {(num_especialidades, num_semanas)}, no {a.shape}")
+    return a
+
+
+def construir_forma_hospital_dinamico(prioridad, pacientes, llegadas, capacidad, recursos_por_paciente,
+                                      recursos_disponibles, penalizacion_espera=1.0, penalizacion_final=0.0):
+    """
+    Construye el modelo dinámico en forma matricial.
+
+    Parámetros:
+        - prioridad, capacidad, recursos_por_paciente, recursos_disponibles: Los mismos de
+          planificar_hospital.
+        - pacientes (list): Lista de espera inicial por especialidad.
+        - llegadas (array especialidades x semanas o list): Pacientes que se suman a la lista
+          cada semana (un valor por especialidad si son iguales todas las semanas).
+        - penalizacion_espera (float): Costo por paciente-semana en espera, por unidad de prioridad.
+        - penalizacion_final (float): Costo adicional por paciente en espera al final del
+          horizonte, por unidad de prioridad.
+
+    Retorna:
+        - FormaMatricial: Columnas x_1_1, ..., x_I_J y luego b_1_1, ..., b_I_J; filas
+          Flujo_i_j y luego Recursos_Semana_j.
+    """
+    p = np.asarray(prioridad, dtype=float)
+    P = np.asarray(pacientes, dtype=float)
+    c = np.asarray(capacidad, dtype=float)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    R = np.asarray(recursos_disponibles, dtype=float)
+    num_especialidades, num_semanas = c.shape
+    a = _llegadas(llegadas, num_especialidades, num_semanas)
+    n = num_especialidades * num_semanas
+
+    # Fila Flujo_i_j (k = i*J + j): x_k, b_k y b_{k-1} si j > 0
+    k = np.arange(n)
+    anterior = k % num_semanas > 0
+    columnas = np.column_stack([k, n + k, n + k - 1])
+    coeficientes = np.broadcast_to([1.0, 1.0, -1.0], columnas.shape)
+    usadas = np.column_stack([np.ones(n, dtype=bool), np.ones(n, dtype=bool), anterior])
+    lado_derecho = a.ravel().copy()
+    lado_derecho[::num_semanas] += P
+
+    columnas_recursos = k.reshape(num_especialidades, num_semanas).T.ravel()
+    largos = np.concatenate([2 + anterior, np.full(num_semanas, num_especialidades)])
+
+    costo_espera = np.repeat(penalizacion_espera * p, num_semanas).reshape(num_especialidades, num_semanas)
+    costo_espera[:, -1] += penalizacion_final * p
+
+    return FormaMatricial(
+        nombres_variables=([f"x_{i+1}_{j+1}" for i in range(num_especialidades) for j in range(num_semanas)]
+                           + [f"b_{i+1}_{j+1}" for i in range(num_especialidades) for j in range(num_semanas)]),
+        nombres_restricciones=([f"Flujo_{i+1}_{j+1}" for i in range(num_especialidades) for j in range(num_semanas)]
+                               + [f"Recursos_Semana_{j+1}" for j in range(num_semanas)]),
+        c=np.concatenate([np.zeros(n), costo_espera.ravel()]),
+        constante=0.0,
+        sentido=MINIMIZAR,
+        indptr=np.concatenate([[0], np.cumsum(largos)]).astype(np.int64),
+        indices=np.concatenate([columnas[usadas], columnas_recursos]).astype(np.int64),
+        datos=np.concatenate([coeficientes[usadas], np.tile(r, num_semanas)]),
+        fila_inf=np.concatenate([lado_derecho, np.full(num_semanas, -np.inf)]),
+        fila_sup=np.concatenate([lado_derecho, R]),
+        col_inf=np.zeros(2 * n),
+        col_sup=np.concatenate([c.ravel(), np.full(n, np.inf)]),
+        entera=np.concatenate([np.ones(n, dtype=bool), np.zeros(n, dtype=bool)]),
+    )
+
+
+def planificar_hospital_dinamico(prioridad, pacientes, llegadas, capacidad, recursos_por_paciente,
+                                 recursos_disponibles, penalizacion_espera=1.0, penalizacion_final=0.0,
+                                 relajar=False, presolve=True, opciones=None):
+    """
+    Resuelve la planificación hospitalaria con llegadas semanales y arrastre de la lista de
+    espera (ver construir_forma_hospital_dinamico) con HiGHS.
+
+    Parámetros:
+        - Los de construir_forma_hospital_dinamico.
+        - relajar (bool): Resolver la relajación lineal (x continuas).
+        - presolve (bool): Usar el presolve de HiGHS (el valor por defecto de HiGHS). En el
+          modelo entero reduce el tiempo a la mitad o menos; en la relajación lineal el
+          efecto depende de la máquina y puede convenir desactivarlo. Ver
+          medir_escalamiento_dinamico.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos de HiGHS.
+
+    Retorna:
+        - dict: Claves "estado" (1 óptimo, 0 sin probar optimalidad, -1 infactible),
+          "atendidos" y "en_espera" (arrays especialidades x semanas, o None sin solución),
+          "funcion_objetivo", "pacientes_semana" (espera total), "tiempo_construccion" y "tiempo".
+    """
+    import highspy
+
+    from .resolucion import OpcionesResolucion
+
+    inicio = time.perf_counter()
+    forma = construir_forma_hospital_dinamico(prioridad, pacientes, llegadas, capacidad, recursos_por_paciente,
+                                              recursos_disponibles, penalizacion_espera, penalizacion_final)
+    tiempo_construccion = time.perf_counter() - inicio
+
+    h = (opciones or OpcionesResolucion()).aplicar_highs(forma.a_highs(relajar_enteras=relajar))
+    if not presolve:
+        h.setOptionValue("presolve", "off")
+    h.run()
+    resultado = {"tiempo_construccion": tiempo_construccion}
+    if h.getInfo().primal_solution_status != 2:  # Sin solución factible
+        estado = -1 if h.getModelStatus() == highspy.HighsModelStatus.kInfeasible else 0
+        resultado.update(estado=estado, atendidos=None, en_espera=None, funcion_objetivo=None,
+                         pacientes_semana=None, tiempo=time.perf_counter() - inicio)
+        return resultado
+
+    valores = np.asarray(h.getSolution().col_value)
+    n = forma.num_variables // 2
+    forma_plan = (len(prioridad), -1)
+    x = valores[:n] if relajar else np.rint(valores[:n])
+    b = valores[n:]
+    resultado.update(
+        estado=1 if h.getModelStatus() == highspy.HighsModelStatus.kOptimal else 0,
+        atendidos=x.reshape(forma_plan),
+        en_espera=b.reshape(forma_plan),
+        funcion_objetivo=forma.valor_objetivo(np.concatenate([x, b])),
+        pacientes_semana=float(b.sum()),
+        tiempo=time.perf_counter() - inicio,
+    )
+    return resultado
+
+
+def medir_escalamiento_dinamico(especialidades, horizontes=(26, 52, 104), relajar=False, presolve=(True, False),
+                                llegadas_relativas=0.9, semilla=None, opciones=None):
+    """
+    Mide cómo crece el tiempo de planificar_hospital_dinamico con el horizonte, con y sin
+    presolve, sobre instancias de generar_hospital_grande.
+
+    Cada especialidad recibe por semana llegadas_relativas veces su lista de espera inicial
+    dividida por el número de semanas (truncado al entero).
+
+    Parámetros:
+        - especialidades (int): Número de especialidades.
+        - horizontes (tuple): Semanas de cada instancia.
+        - relajar (bool): Medir la relajación lineal en vez del modelo entero.
+        - presolve (tuple): Valores de presolve a comparar.
+        - llegadas_relativas (float): Llegadas del horizonte como fracción de la lista inicial.
+        - semilla (int): Semilla del generador.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos de HiGHS.
+
+    Retorna:
+        - list: Un dict por (horizonte, presolve) con "semanas", "presolve", "estado",
+          "funcion_objetivo", "tiempo_construccion", "tiempo" y "crecimiento" (cociente
+          entre el tiempo y el del horizonte anterior con el mismo presolve; None en el primero).
+    """
+    from .generadores import generar_hospital_grande
+
+    mediciones, anterior = [], {}
+    for semanas in horizontes:
+        datos = generar_hospital_grande(especialidades, semanas=semanas, semilla=semilla)
+        llegadas = np.floor(llegadas_relativas * np.asarray(datos["pacientes"], dtype=float) / semanas)
+        for usar_presolve in presolve:
+            resultado = planificar_hospital_dinamico(**datos, llegadas=llegadas, relajar=relajar,
+                                                     presolve=usar_presolve, opciones=opciones)
+            mediciones.append({
+                "semanas": semanas,
+                "presolve": usar_presolve,
+                "estado": resultado["estado"],
+                "funcion_objetivo": resultado["funcion_objetivo"],
+                "tiempo_construccion": resultado["tiempo_construccion"],
+                "tiempo": resultado["tiempo"],
+                "crecimiento": (resultado["tiempo"] / anterior[usar_presolve]
+                                if usar_presolve in anterior else None),
+            })
+            anterior[usar_presolve] = resultado["tiempo"]
+    return mediciones
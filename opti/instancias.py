@@ -0,0 +1,158 @@
+"""
+Carga y resolución de instancias descritas en archivos JSON.
+
+Cada archivo tiene la forma {"modelo": ..., "descripcion": ..., "datos": {...}}, donde
+"modelo" es una de las claves de MODELOS y "datos" contiene los argumentos del modelo.
+Las instancias de ejemplo del proyecto se encuentran en el directorio datos/ del paquete.
+"""
+import json
+import os
+
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos")
+
+
+def listar_instancias():
+    """
+    Retorna los nombres (sin extensión) de las instancias incluidas en el paquete.
+    """
+    nombres = [archivo[:-len(".json")] for archivo in os.listdir(DIRECTORIO_DATOS) if archivo.endswith(".json")]
+    return sorted(nombres, key=_clave_natural)
+
+
+def _clave_natural(nombre):
+    # Ordena "hospital_ej_10" después de "hospital_ej_9"
+    base, _, sufijo = nombre.rpartition("_")
+    return (base, int(sufijo)) if sufijo.isdigit() else (nombre, 0)
+
+
+def cargar_instancia(ruta_o_nombre):
+    """
+    Carga una instancia desde una ruta a un archivo JSON o por su nombre en datos/.
+
+    Parámetros:
+        - ruta_o_nombre (str): Ruta al archivo o nombre de una instancia incluida (p. ej. "hospital_ej_1").
+
+    Retorna:
+        - dict: Diccionario con las claves "modelo", "descripcion" y "datos".
+    """
+    ruta = ruta_o_nombre
+    if not os.path.exists(ruta):
+        ruta = os.path.join(DIRECTORIO_DATOS, f"{ruta_o_nombre}.json")
+        if not os.path.exists(ruta):
+            raise FileNotFoundError(f"No existe la instancia '{ruta_o_nombre}'")
+
+    with open(ruta, encoding="utf-8") as archivo:
+        instancia = json.load(archivo)
+
+    if instancia.get("modelo") not in MODELOS:
+        raise ValueError(f"Modelo desconocido en '{ruta_o_nombre}': {instancia.get('modelo')!r}")
+    instancia.setdefault("descripcion", os.path.basename(ruta))
+    return instancia
+
+
+def resolver_instancia(instancia, solver=None, cribar=True):
+    """
+    Resuelve una instancia con el modelo que indica su clave "modelo".
+
+    Parámetros:
+        - instancia (dict): Instancia con las claves "modelo" y "datos".
+        - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+        - cribar (bool): Comprobar antes condiciones necesarias de factibilidad (ver cribado.py).
+
+    Retorna:
+        - dict: Resultado del modelo en una forma serializable a JSON. Si el cribado prueba
+          que la instancia es infactible, el modelo no se construye y se retorna
+          {"estado": -1, "certificados": [...]}.
+    """
+    if cribar:
+        from .cribado import cribar_instancia
+        certificados = cribar_instancia(instancia)
+        if certificados:
+            return {"estado": -1, "certificados": [certificado.a_dict() for certificado in certificados]}
+
+    resolver, _ = MODELOS[instancia["modelo"]]
+    return resolver(instancia["datos"], solver)
+
+
+def imprimir_resultado(instancia, resultado):
+    """
+    Muestra por pantalla el resultado de una instancia en el formato de su modelo.
+    """
+    if "certificados" in resultado:
+        print("Instancia infactible (detectada antes de resolver):")
+        for certificado in resultado["certificados"]:
+            print(f"  {certificado['motivo']}: requerido {certificado['requerido']:,}, "
+                  f"disponible {certificado['disponible']:,}")
+            print(f"    Restricciones: {', '.join(certificado['restricciones'])}")
+        return
+    _, imprimir = MODELOS[instancia["modelo"]]
+    imprimir(instancia["datos"], resultado)
+
+
+def _resolver_hospital(datos, solver):
+    from .hospital import planificar_hospital
+    return planificar_hospital(**datos, solver=solver)
+
+
+def _imprimir_hospital(datos, resultado):
+    from .hospital import imprimir_resultados
+    imprimir_resultados(resultado)
+
+
+def _resolver_residuos(datos, solver):
+    from .residuos import _resolver_gestion_residuos
+    resultados, objetivo, tiempo, estado = _resolver_gestion_residuos(**datos, solver=solver)
+    return {"resultados": resultados, "funcion_objetivo": objetivo, "tiempo": tiempo, "estado_solucion": estado}
+
+
+def _imprimir_residuos(datos, resultado):
+    from .residuos import imprimir_resultados
+    imprimir_resultados(resultado["resultados"], resultado["funcion_objetivo"], resultado["tiempo"], datos["R"])
+
+
+def _resolver_fondos_balanceados(datos, solver):
+    from .residuos import optimizar_fondos_balanceados
+    resultado = optimizar_fondos_balanceados(**datos, solver=solver)
+    fondos = {}
+    for (a, m), valor in resultado["fondos"].items():
+        fondos.setdefault(m, {})[a] = valor
+    return dict(resultado, fondos=fondos)
+
+
+def _imprimir_fondos_balanceados(datos, resultado):
+    print("Estado de la solución:", resultado["estado"])
+    for m, fondos in resultado["fondos"].items():
+        for a, valor in fondos.items():
+            print(f"Fondos asignados a {a} en {m}: {valor}")
+    print("Valor de la función objetivo:", resultado["funcion_objetivo"])
+
+
+def _resolver_agenda(datos, solver):
+    from .agenda import programar_lista_espera
+    return programar_lista_espera(**dict(datos, urgentes=set(datos["urgentes"])), solver=solver)
+
+
+def _imprimir_agenda(datos, resultado):
+    from .agenda import imprimir_resultados
+    imprimir_resultados(resultado)
+
+
+def _resolver_mochila(datos, solver):
+    # docplex usa su propio motor; el solver de PuLP no aplica a este modelo
+    from .mochila import seleccionar_pacientes
+    return seleccionar_pacientes(**datos)
+
+
+def _imprimir_mochila(datos, resultado):
+    from .mochila import imprimir_resultados
+    imprimir_resultados(resultado)
+
+
+# Modelo -> (función que resuelve los datos, función que imprime el resultado)
+MODELOS = {
+    "hospital": (_resolver_hospital, _imprimir_hospital),
+    "residuos": (_resolver_residuos, _imprimir_residuos),
+    "fondos_balanceados": (_resolver_fondos_balanceados, _imprimir_fondos_balanceados),
+    "agenda": (_resolver_agenda, _imprimir_agenda),
+    "mochila": (_resolver_mochila, _imprimir_mochila),
+}
@@ -0,0 +1,203 @@
+"""
+Instantáneas comprimidas de los modelos para resolverlos sin regenerarlos.
+
+Una instantánea guarda en un solo archivo .npz comprimido la forma matricial del modelo tal
+como se envía al solver (matriz CSR, cotas, integralidad, nombres) junto con el modelo de
+origen y sus datos de entrada. Cargarla solo lee arreglos de NumPy, sin volver a crear las
+variables ni las expresiones de PuLP, y el modelo puede resolverse directamente con HiGHS,
+reconstruirse como LpProblem (a_problema) o escribirse en MPS/LP para otros solvers.
+
+Formato del archivo (todos arreglos de NumPy, sin pickle):
+
+- c, indptr, indices, datos, fila_inf, fila_sup, col_inf, col_sup, entera: los de FormaMatricial.
+- nombres_variables, nombres_restricciones: nombres separados por saltos de línea, en UTF-8.
+- metadatos: JSON en UTF-8 con "version", "sentido", "constante", "modelo" y "datos".
+"""
+import json
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .matricial import FormaMatricial, desde_problema
+
+VERSION = 1
+
+_ARREGLOS = ("c", "indptr", "indices", "datos", "fila_inf", "fila_sup", "col_inf", "col_sup", "entera")
+
+
+@dataclass
+class Instantanea:
+    """
+    Modelo capturado en forma matricial junto con su origen.
+
+    Atributos:
+        - forma (FormaMatricial): Modelo tal como se envía al solver.
+        - modelo (str): Clave del modelo de origen ("hospital", "residuos", "agenda"), o None.
+        - datos (dict): Datos de entrada con que se construyó el modelo, o None.
+    """
+    forma: FormaMatricial
+    modelo: str = None
+    datos: dict = None
+
+
+def _a_bytes(texto):
+    return np.frombuffer(texto.encode("utf-8"), dtype=np.uint8)
+
+
+def _desde_bytes(arreglo):
+    return arreglo.tobytes().decode("utf-8")
+
+
+def capturar_problema(problema, modelo=None, datos=None):
+    """
+    Captura un LpProblem ya construido.
+    """
+    return Instantanea(desde_problema(problema), modelo, datos)
+
+
+def capturar_instancia(instancia):
+    """
+    Construye el modelo de una instancia (formato de instancias.py) con el mismo constructor
+    que usa su función de resolución y lo captura.
+    """
+    from .diagnostico import CONSTRUCTORES
+
+    construir = CONSTRUCTORES.get(instancia["modelo"])
+    if construir is None:
+        raise ValueError(f"El modelo {instancia['modelo']!r} no admite instantáneas")
+    return capturar_problema(construir(instancia["datos"]), instancia["modelo"], instancia["datos"])
+
+
+def guardar_instantanea(instantanea, ruta):
+    """
+    Guarda la instantánea en un archivo .npz comprimido.
+
+    Parámetros:
+        - instantanea (Instantanea): Instantánea a guardar.
+        - ruta (str): Archivo de destino (NumPy agrega la extensión .npz si falta).
+    """
+    forma = instantanea.forma
+    metadatos = {"version": VERSION, "sentido": forma.sentido, "constante": forma.constante,
+                 "modelo": instantanea.modelo, "datos": instantanea.datos}
+    np.savez_compressed(
+        ruta,
+        **{nombre: getattr(forma, nombre) for nombre in _ARREGLOS},
+        nombres_variables=_a_bytes("\n".join(forma.nombres_variables)),
+        nombres_restricciones=_a_bytes("\n".join(forma.nombres_restricciones)),
+        # Los conjuntos (p. ej. los urgentes de la agenda) se guardan como listas
+        metadatos=_a_bytes(json.dumps(metadatos, ensure_ascii=False, default=list)),
+    )
+
+
+def cargar_instantanea(ruta):
+    """
+    Carga una instantánea guardada con guardar_instantanea.
+
+    Retorna:
+        - Instantanea
+    """
+    with np.load(ruta, allow_pickle=False) as archivo:
+        metadatos = json.loads(_desde_bytes(archivo["metadatos"]))
+        if metadatos["version"] > VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {metadatos['version']}")
+        nombres_variables = _desde_bytes(archivo["nombres_variables"])
+        nombres_restricciones = _desde_bytes(archivo["nombres_restricciones"])
+        forma = FormaMatricial(
+            nombres_variables=nombres_variables.split("\n") if nombres_variables else [],
+            nombres_restricciones=nombres_restricciones.split("\n") if nombres_restricciones else [],
+            constante=metadatos["constante"],
+            sentido=metadatos["sentido"],
+            **{nombre: archivo[nombre] for nombre in _ARREGLOS},
+        )
+    return Instantanea(forma, metadatos["modelo"], metadatos["datos"])
+
+
+def escribir_modelo(forma, ruta):
+    """
+    Escribe el modelo en MPS o LP (según la extensión de la ruta) usando HiGHS, con los
+    nombres de filas y columnas, el sentido y la constante del objetivo originales.
+    """
+    import highspy
+
+    from .matricial import MAXIMIZAR
+
+    h = forma.a_highs(nombres=True)
+    if forma.sentido == MAXIMIZAR:
+        h.changeObjectiveSense(highspy.ObjSense.kMaximize)
+        h.changeColsCost(forma.num_variables, np.arange(forma.num_variables, dtype=np.int32), forma.c)
+    h.changeObjectiveOffset(float(forma.constante))
+    estado = h.writeModel(str(ruta))
+    if estado == highspy.HighsStatus.kError:
+        raise RuntimeError(f"HiGHS no pudo escribir el modelo en '{ruta}'")
+
+
+def exportar_instancias(instancias, directorio, formato="npz"):
+    """
+    Captura y exporta varias instancias de una vez.
+
+    Parámetros:
+        - instancias (list): Nombres o rutas de instancias (ver cargar_instancia).
+        - directorio (str): Directorio de destino (se crea si no existe).
+        - formato (str): "npz" (instantánea), "mps" o "lp".
+
+    Retorna:
+        - list: Rutas de los archivos escritos, en el orden de las instancias.
+    """
+    from .instancias import cargar_instancia
+
+    if formato not in ("npz", "mps", "lp"):
+        raise ValueError(f"Formato desconocido: {formato!r}")
+    os.makedirs(directorio, exist_ok=True)
+    rutas = []
+    for nombre in instancias:
+        instantanea = capturar_instancia(cargar_instancia(nombre))
+        ruta = os.path.join(directorio, f"{os.path.splitext(os.path.basename(nombre))[0]}.{formato}")
+        if formato == "npz":
+            guardar_instantanea(instantanea, ruta)
+        else:
+            escribir_modelo(instantanea.forma, ruta)
+        rutas.append(ruta)
+    return rutas
+
+
+def resolver_instantanea(instantanea, opciones=None):
+    """
+    Resuelve una instantánea directamente con HiGHS, sin pasar por PuLP.
+
+    Parámetros:
+        - instantanea (Instantanea o str): Instantánea, o ruta de una instantánea guardada.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos (el backend se ignora).
+
+    Retorna:
+        - dict: Claves "estado" (con los códigos de PuLP), "variables" (nombre -> valor),
+          "funcion_objetivo" y "tiempo".
+    """
+    import highspy
+
+    from .resolucion import OpcionesResolucion
+
+    if not isinstance(instantanea, Instantanea):
+        instantanea = cargar_instantanea(instantanea)
+    forma = instantanea.forma
+    inicio = time.perf_counter()
+    h = (opciones or OpcionesResolucion()).aplicar_highs(forma.a_highs())
+    h.run()
+
+    estado_modelo = h.getModelStatus()
+    if estado_modelo == highspy.HighsModelStatus.kOptimal:
+        estado = 1
+    elif estado_modelo == highspy.HighsModelStatus.kInfeasible:
+        estado = -1
+    elif estado_modelo == highspy.HighsModelStatus.kUnbounded:
+        estado = -2
+    else:
+        estado = 0
+    variables, objetivo = {}, None
+    if h.getInfo().primal_solution_status == 2:  # Hay una solución factible (p. ej. al llegar al tiempo límite)
+        valores = np.asarray(h.getSolution().col_value)
+        variables = dict(zip(forma.nombres_variables, valores.tolist()))
+        objetivo = forma.valor_objetivo(valores)
+    return {"estado": estado, "variables": variables, "funcion_objetivo": objetivo,
+            "tiempo": time.perf_counter() - inicio}
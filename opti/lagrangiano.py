@@ -0,0 +1,197 @@
+"""
+Descomposición lagrangiana del modelo hospitalario para instancias muy grandes.
+
+Las únicas restricciones que ligan especialidades son las de recursos semanales
+sum_i r[i] x[i][j] <= R[j]. Al relajarlas con multiplicadores lambda[j] >= 0, el problema se
+separa en un subproblema por especialidad:
+
+    min sum_j (lambda[j] r[i] - p[i]) x[i][j]   s.a.  sum_j x[i][j] <= P[i],  0 <= x[i][j] <= c[i][j]
+
+que se resuelve en forma cerrada (tomar las semanas de costo reducido negativo, de menor a
+mayor, hasta agotar P[i]) y con solución entera si los datos lo son. Como el orden de las
+semanas solo depende de lambda, basta un ordenamiento por iteración para todas las
+especialidades. Todos los subproblemas
+se resuelven a la vez con operaciones NumPy, por bloques de especialidades repartidos
+entre hilos. Los multiplicadores se actualizan con pasos de subgradiente de Polyak y la
+cota superior se obtiene reparando la solución de los subproblemas (quitar pacientes de
+las especialidades de menor prioridad por recurso en las semanas excedidas y completar
+después con la holgura restante), tanto de la última solución de los subproblemas como de
+su promedio a lo largo de las iteraciones.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def _subproblemas(p, P, c, r, multiplicadores):
+    # Resuelve los subproblemas de un bloque de especialidades; retorna (x, valor de cada uno).
+    # Con r[i] > 0, el orden de las semanas por costo reducido lambda[j] r[i] - p[i] es el de
+    # lambda para todas las especialidades, y la semana j conviene si lambda[j] < p[i] / r[i].
+    orden = np.argsort(multiplicadores, kind="stable")
+    multiplicadores_ordenados = multiplicadores[orden]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        umbral = np.where(r > 0, p / np.where(r > 0, r, 1), np.where(p > 0, np.inf, -np.inf))
+    semanas_utiles = np.searchsorted(multiplicadores_ordenados, umbral, side="left")
+
+    c_ordenada = c[:, orden]
+    capacidad_util = np.where(np.arange(len(orden))[None, :] < semanas_utiles[:, None], c_ordenada, 0)
+    anteriores = np.cumsum(capacidad_util, axis=1) - capacidad_util
+    x_ordenado = np.clip(P[:, None] - anteriores, 0, capacidad_util)
+    x = np.empty_like(x_ordenado)
+    x[:, orden] = x_ordenado
+    valor = r * (x_ordenado @ multiplicadores_ordenados) - p * x_ordenado.sum(axis=1)
+    return x, valor
+
+
+def _reparar(x, p, P, c_semanal, r, R):
+    # Convierte la solución de los subproblemas en un plan factible. Trabaja sobre la
+    # traspuesta (semanas x especialidades) para recorrer cada semana en memoria contigua.
+    x = np.ascontiguousarray(x.T)
+    uso = x @ r
+    con_recursos = np.flatnonzero(r > 0)
+    quitar = con_recursos[np.argsort(p[con_recursos] / r[con_recursos], kind="stable")]
+    for j in np.flatnonzero(uso > R + 1e-9):
+        exceso = uso[j] - R[j]
+        acumulado = np.cumsum(r[quitar] * x[j, quitar])
+        k = min(int(np.searchsorted(acumulado, exceso - 1e-9)), len(quitar) - 1)
+        x[j, quitar[:k]] = 0
+        restante = exceso - (acumulado[k - 1] if k else 0.0)
+        x[j, quitar[k]] = max(x[j, quitar[k]] - np.ceil(restante / r[quitar[k]] - 1e-9), 0)
+
+    # Completar con la holgura restante, por prioridad por unidad de recurso
+    beneficiosas = np.flatnonzero(p > 0)
+    with np.errstate(divide="ignore"):
+        razon = np.where(r[beneficiosas] > 0, p[beneficiosas] / np.where(r[beneficiosas] > 0, r[beneficiosas], 1), np.inf)
+    llenar = beneficiosas[np.argsort(-razon, kind="stable")]
+    r_llenar = r[llenar]
+    pendientes = (P - x.sum(axis=0))[llenar]
+    for j in range(x.shape[0]):
+        holgura = R[j] - x[j] @ r
+        margen = np.maximum(np.minimum(c_semanal[j, llenar] - x[j, llenar], pendientes), 0)
+        acumulado = np.cumsum(r_llenar * margen)
+        k = int(np.searchsorted(acumulado, holgura + 1e-9, side="right"))
+        agregado = np.zeros(len(llenar))
+        agregado[:k] = margen[:k]
+        if k < len(llenar) and r_llenar[k] > 0:
+            disponible = holgura - (acumulado[k - 1] if k else 0.0)
+            agregado[k] = min(np.floor(disponible / r_llenar[k] + 1e-9), margen[k])
+        x[j, llenar] += agregado
+        pendientes -= agregado
+    return x.T
+
+
+def planificar_hospital_lagrangiano(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                    iteraciones=300, tolerancia_gap=1e-3, hilos=1, bloque=4096):
+    """
+    Resuelve la planificación hospitalaria por relajación lagrangiana de los recursos semanales.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital (listas o arreglos NumPy).
+        - iteraciones (int): Máximo de iteraciones de subgradiente (al menos 1).
+        - tolerancia_gap (float): Gap relativo entre cotas con el que se detiene.
+        - hilos (int): Hilos que resuelven los bloques de subproblemas en paralelo.
+        - bloque (int): Especialidades por bloque de subproblemas.
+
+    Retorna:
+        - dict: Claves "estado" (1 si el plan alcanzó tolerancia_gap, 0 si las iteraciones
+          o el paso se agotaron antes, -1 infactible), "asignacion" (arreglo especialidades x
+          semanas), "funcion_objetivo" (cota superior), "cota_inferior", "gap",
+          "multiplicadores", "iteraciones" y "tiempo".
+
+    Lanza:
+        - ValueError: Si las dimensiones de los datos no son consistentes, algún recurso por
+          paciente es negativo o iteraciones es menor que 1.
+    """
+    inicio = time.perf_counter()
+    p = np.asarray(prioridad, dtype=float)
+    P = np.asarray(pacientes, dtype=float)
+    c = np.asarray(capacidad, dtype=float)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    R = np.asarray(recursos_disponibles, dtype=float)
+    if c.shape != (len(p), len(R)) or len(P) != len(p) or len(r) != len(p):
+        raise ValueError("Las dimensiones de los datos del hospital no son consistentes")
+    if (r < 0).any():
+        raise ValueError("La descomposición supone recursos por paciente no negativos")
+    if iteraciones < 1:
+        raise ValueError("Se necesita al menos una iteración de subgradiente")
+    if (R < 0).any() or (P < 0).any() or (c < 0).any():
+        return {"estado": -1, "asignacion": None, "funcion_objetivo": None, "cota_inferior": None, "gap": None,
+                "multiplicadores": None, "iteraciones": 0, "tiempo": time.perf_counter() - inicio}
+
+    constante = float(p @ P)
+    c_semanal = np.ascontiguousarray(c.T)
+    objetivo_entero = np.allclose(p, np.round(p))
+    bloques = [slice(k, k + bloque) for k in range(0, len(p), bloque)]
+    ejecutor = ThreadPoolExecutor(hilos) if hilos > 1 else None
+
+    def resolver_subproblemas(multiplicadores):
+        tareas = [(p[b], P[b], c[b], r[b], multiplicadores) for b in bloques]
+        partes = list(ejecutor.map(lambda t: _subproblemas(*t), tareas) if ejecutor
+                      else (_subproblemas(*t) for t in tareas))
+        x = np.vstack([parte[0] for parte in partes]) if partes else np.zeros(c.shape)
+        valor = sum(float(parte[1].sum()) for parte in partes)
+        return x, constante + valor - float(multiplicadores @ R)
+
+    multiplicadores = np.zeros(len(R))
+    mejor_x, cota_superior = None, np.inf
+    cota_inferior, mejores_multiplicadores = -np.inf, multiplicadores
+    paso, sin_mejora = 2.0, 0
+    promedio, peso_total = np.zeros(c.shape), 0.0
+    iteracion = 0
+    optimo = False
+    try:
+        for iteracion in range(1, iteraciones + 1):
+            x, dual = resolver_subproblemas(multiplicadores)
+            if dual > cota_inferior + 1e-9:
+                cota_inferior, mejores_multiplicadores, sin_mejora = dual, multiplicadores, 0
+            else:
+                sin_mejora += 1
+                if sin_mejora >= 10:
+                    paso, sin_mejora = paso / 2, 0
+                    promedio, peso_total = np.zeros(c.shape), 0.0  # Olvidar las iteraciones lejanas
+
+            # Promedio ergódico de las soluciones de los subproblemas, ponderado por el paso:
+            # se aproxima a la solución de la relajación lineal y suele repararse mejor
+            promedio += paso * x
+            peso_total += paso
+
+            if iteracion == 1 or iteracion % 5 == 0:
+                for candidato in (x, np.floor(promedio / peso_total + 1e-9)):
+                    plan = _reparar(candidato, p, P, c_semanal, r, R)
+                    valor = constante - float(p @ plan.sum(axis=1))
+                    if valor < cota_superior:
+                        mejor_x, cota_superior = plan, valor
+
+            cota = np.ceil(cota_inferior - 1e-6) if objetivo_entero else cota_inferior
+            if cota_superior - cota <= tolerancia_gap * max(abs(cota_superior), 1.0) or paso < 1e-4:
+                break
+
+            subgradiente = r @ x - R
+            norma = float(subgradiente @ subgradiente)
+            if norma == 0:
+                # Los subproblemas usan exactamente los recursos: x es factible y su valor
+                # coincide con la cota dual, así que es óptima
+                valor = constante - float(p @ x.sum(axis=1))
+                if valor < cota_superior:
+                    mejor_x, cota_superior = x, valor
+                optimo = True
+                break
+            multiplicadores = np.maximum(multiplicadores + paso * (cota_superior - dual) / norma * subgradiente, 0)
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    cota = float(np.ceil(cota_inferior - 1e-6)) if objetivo_entero else float(cota_inferior)
+    gap = max(cota_superior - cota, 0.0) / max(abs(cota_superior), 1.0)
+    return {
+        "estado": 1 if optimo or gap <= tolerancia_gap else 0,
+        "asignacion": mejor_x,
+        "funcion_objetivo": float(cota_superior),
+        "cota_inferior": cota,
+        "gap": gap,
+        "multiplicadores": mejores_multiplicadores,
+        "iteraciones": iteracion,
+        "tiempo": time.perf_counter() - inicio,
+    }
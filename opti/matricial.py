@@ -0,0 +1,204 @@
+"""
+Forma matricial de los modelos: vectores y matriz dispersa CSR en NumPy.
+
+min/max  c'x + constante
+s.a.     fila_inf <= A x <= fila_sup
+         col_inf  <=  x  <= col_sup,   x[k] entero si entera[k]
+
+Permite trabajar con un modelo sin recorrer las expresiones de PuLP (evaluar soluciones,
+pasarlo directo a HiGHS, guardarlo) y es la base de los módulos que operan sobre arreglos.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+MINIMIZAR = 1
+MAXIMIZAR = -1
+
+
+@dataclass
+class FormaMatricial:
+    """
+    Modelo lineal (entero mixto) en forma matricial.
+
+    Atributos:
+        - nombres_variables (list), nombres_restricciones (list): Nombres de columnas y filas.
+        - c (array n): Coeficientes de la función objetivo.
+        - constante (float): Término constante de la función objetivo.
+        - sentido (int): MINIMIZAR (1) o MAXIMIZAR (-1), con la convención de PuLP.
+        - indptr, indices, datos (arrays): Matriz A en formato CSR (filas = restricciones).
+        - fila_inf, fila_sup (arrays m): Cotas de cada fila (±inf si no hay).
+        - col_inf, col_sup (arrays n): Cotas de cada variable (±inf si no hay).
+        - entera (array n de bool): Variables enteras.
+    """
+    nombres_variables: list
+    nombres_restricciones: list
+    c: np.ndarray
+    constante: float
+    sentido: int
+    indptr: np.ndarray
+    indices: np.ndarray
+    datos: np.ndarray
+    fila_inf: np.ndarray
+    fila_sup: np.ndarray
+    col_inf: np.ndarray
+    col_sup: np.ndarray
+    entera: np.ndarray
+
+    @property
+    def num_variables(self):
+        return len(self.c)
+
+    @property
+    def num_restricciones(self):
+        return len(self.indptr) - 1
+
+    @property
+    def no_ceros(self):
+        return len(self.datos)
+
+    def filas_de_elementos(self):
+        """
+        Retorna el índice de fila de cada elemento no nulo de A (formato COO).
+        """
+        return np.repeat(np.arange(self.num_restricciones), np.diff(self.indptr))
+
+    def actividad(self, x):
+        """
+        Calcula A x en una sola pasada vectorizada.
+        """
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.filas_de_elementos(), weights=self.datos * x[self.indices],
+                           minlength=self.num_restricciones)
+
+    def valor_objetivo(self, x):
+        return float(self.c @ np.asarray(x, dtype=float) + self.constante)
+
+    def a_highs(self, relajar_enteras=False, objetivo=True, nombres=False):
+        """
+        Construye un highspy.Highs con el modelo cargado (sin salida por pantalla).
+
+        Parámetros:
+            - relajar_enteras (bool): Cargar la relajación lineal.
+            - objetivo (bool): Si es False, carga costo cero (problema de factibilidad).
+            - nombres (bool): Cargar también los nombres de filas y columnas (para escribir
+              el modelo en MPS o LP con writeModel).
+        """
+        import highspy
+
+        inf = highspy.kHighsInf
+        lp = highspy.HighsLp()
+        lp.num_col_ = self.num_variables
+        lp.num_row_ = self.num_restricciones
+        lp.col_cost_ = self.sentido * self.c if objetivo else np.zeros(self.num_variables)
+        lp.col_lower_ = np.where(np.isinf(self.col_inf), -inf, self.col_inf)
+        lp.col_upper_ = np.where(np.isinf(self.col_sup), inf, self.col_sup)
+        lp.row_lower_ = np.where(np.isinf(self.fila_inf), -inf, self.fila_inf)
+        lp.row_upper_ = np.where(np.isinf(self.fila_sup), inf, self.fila_sup)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = self.indptr.astype(np.int32)
+        lp.a_matrix_.index_ = self.indices.astype(np.int32)
+        lp.a_matrix_.value_ = self.datos.astype(float)
+        if not relajar_enteras and self.entera.any():
+            lp.integrality_ = [highspy.HighsVarType.kInteger if e else highspy.HighsVarType.kContinuous
+                               for e in self.entera]
+        if nombres:
+            lp.col_names_ = list(self.nombres_variables)
+            lp.row_names_ = list(self.nombres_restricciones)
+
+        h = highspy.Highs()
+        h.setOptionValue("output_flag", False)
+        h.passModel(lp)
+        return h
+
+
+def desde_problema(problema):
+    """
+    Extrae la forma matricial de un LpProblem de PuLP.
+    """
+    from pulp import LpConstraintEQ, LpConstraintGE, LpConstraintLE
+
+    variables = problema.variables()
+    posicion = {v.name: k for k, v in enumerate(variables)}
+    n = len(variables)
+
+    c = np.zeros(n)
+    constante = 0.0
+    if problema.objective is not None:
+        for variable, coeficiente in problema.objective.items():
+            c[posicion[variable.name]] = coeficiente
+        constante = float(problema.objective.constant)
+
+    restricciones = problema.constraints
+    m = len(restricciones)
+    indptr = np.zeros(m + 1, dtype=np.int64)
+    indices = []
+    datos = []
+    fila_inf = np.full(m, -np.inf)
+    fila_sup = np.full(m, np.inf)
+    for k, restriccion in enumerate(restricciones.values()):
+        for variable, coeficiente in restriccion.items():
+            indices.append(posicion[variable.name])
+            datos.append(coeficiente)
+        indptr[k + 1] = len(indices)
+        lado_derecho = -restriccion.constant
+        if restriccion.sense in (LpConstraintGE, LpConstraintEQ):
+            fila_inf[k] = lado_derecho
+        if restriccion.sense in (LpConstraintLE, LpConstraintEQ):
+            fila_sup[k] = lado_derecho
+
+    return FormaMatricial(
+        nombres_variables=[v.name for v in variables],
+        nombres_restricciones=list(restricciones),
+        c=c,
+        constante=constante,
+        sentido=problema.sense,
+        indptr=indptr,
+        indices=np.asarray(indices, dtype=np.int64),
+        datos=np.asarray(datos, dtype=float),
+        fila_inf=fila_inf,
+        fila_sup=fila_sup,
+        col_inf=np.array([-np.inf if v.lowBound is None else v.lowBound for v in variables], dtype=float),
+        col_sup=np.array([np.inf if v.upBound is None else v.upBound for v in variables], dtype=float),
+        entera=np.array([v.cat == "Integer" for v in variables], dtype=bool),
+    )
+
+
+def a_problema(forma, nombre="Modelo"):
+    """
+    Reconstruye un LpProblem de PuLP a partir de la forma matricial (inversa de desde_problema).
+
+    Las filas con dos cotas finitas distintas se agregan como dos restricciones, con los
+    sufijos "_inf" y "_sup".
+    """
+    from pulp import LpAffineExpression, LpConstraint, LpConstraintEQ, LpConstraintGE, LpConstraintLE, LpProblem
+    from pulp import LpVariable
+
+    variables = [
+        LpVariable(nombre_variable,
+                   lowBound=None if np.isinf(inferior) else float(inferior),
+                   upBound=None if np.isinf(superior) else float(superior),
+                   cat="Integer" if entera else "Continuous")
+        for nombre_variable, inferior, superior, entera
+        in zip(forma.nombres_variables, forma.col_inf, forma.col_sup, forma.entera)
+    ]
+    problema = LpProblem(nombre, forma.sentido)
+    problema.setObjective(LpAffineExpression(
+        [(variables[k], float(forma.c[k])) for k in np.flatnonzero(forma.c)], constant=forma.constante))
+
+    for k, nombre_fila in enumerate(forma.nombres_restricciones):
+        inicio, fin = forma.indptr[k], forma.indptr[k + 1]
+        terminos = [(variables[j], float(a)) for j, a in zip(forma.indices[inicio:fin], forma.datos[inicio:fin])]
+        inferior, superior = forma.fila_inf[k], forma.fila_sup[k]
+        if inferior == superior:
+            filas = [(nombre_fila, LpConstraintEQ, inferior)]
+        elif np.isinf(inferior):
+            filas = [(nombre_fila, LpConstraintLE, superior)]
+        elif np.isinf(superior):
+            filas = [(nombre_fila, LpConstraintGE, inferior)]
+        else:
+            filas = [(f"{nombre_fila}_inf", LpConstraintGE, inferior), (f"{nombre_fila}_sup", LpConstraintLE, superior)]
+        for nombre_restriccion, sentido, lado_derecho in filas:
+            problema.addConstraint(LpConstraint(LpAffineExpression(terminos), sentido, nombre_restriccion,
+                                                float(lado_derecho)))
+    return problema
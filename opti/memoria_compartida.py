@@ -0,0 +1,216 @@
+"""
+Datos de instancias en memoria compartida para los procesos trabajadores.
+
+Al repartir instancias grandes entre procesos, pasar los arreglos como argumentos obliga a
+serializarlos y copiarlos en cada tarea y en cada proceso. Aquí los arreglos se copian una
+sola vez a segmentos de multiprocessing.shared_memory; a los trabajadores solo viajan
+manejadores livianos (ArregloCompartido: nombre del segmento, forma y tipo), y cada proceso
+abre los segmentos una vez y obtiene vistas NumPy sobre el mismo búfer, sin copias. Los
+constructores de modelos reciben esas vistas como cualquier otro arreglo.
+
+Uso:
+    with DatosCompartidos({"capacidad": capacidad, "escenarios": escenarios}) as datos:
+        resultados = mapear_compartido(funcion, datos, tareas, procesos=4)
+
+Lo usan evaluar_escenarios_hospital (todos los escenarios comparten capacidad y demanda) y
+prediccion.resolver_lote (los arreglos de cada instancia del hospital). PoolSolvers
+(trabajadores.py) queda fuera a propósito: a sus procesos no viajan datos de instancia
+sino el modelo ya construido (LpProblem.to_dict), un diccionario de objetos Python sin
+arreglos que compartir.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ArregloCompartido:
+    """
+    Manejador de un arreglo en memoria compartida (lo único que se envía a los procesos).
+
+    Atributos:
+        - nombre (str): Nombre del segmento de memoria compartida.
+        - forma (tuple): Forma del arreglo.
+        - tipo (str): dtype del arreglo.
+    """
+    nombre: str
+    forma: tuple
+    tipo: str
+
+
+# Segmentos abiertos en este proceso: se mantienen abiertos mientras viva el proceso para
+# que las vistas entregadas por abrir() sigan siendo válidas
+_ABIERTOS = {}
+
+
+def abrir(manejador):
+    """
+    Retorna una vista NumPy de solo lectura sobre el arreglo compartido (sin copiarlo).
+    """
+    segmento = _ABIERTOS.get(manejador.nombre)
+    if segmento is None:
+        segmento = shared_memory.SharedMemory(name=manejador.nombre)
+        _ABIERTOS[manejador.nombre] = segmento
+    vista = np.ndarray(manejador.forma, dtype=manejador.tipo, buffer=segmento.buf)
+    vista.flags.writeable = False
+    return vista
+
+
+def materializar(datos):
+    """
+    Reemplaza los ArregloCompartido de un diccionario por vistas NumPy; el resto de los
+    valores se deja igual.
+    """
+    return {clave: abrir(valor) if isinstance(valor, ArregloCompartido) else valor for clave, valor in datos.items()}
+
+
+class DatosCompartidos:
+    """
+    Copia a memoria compartida los arreglos de un diccionario de datos.
+
+    Los valores que son listas anidadas o arreglos NumPy con al menos minimo_elementos
+    elementos se comparten; los escalares, diccionarios y arreglos pequeños se envían tal
+    cual. Los segmentos se liberan al salir del bloque with (o con cerrar()).
+
+    Parámetros:
+        - datos (dict): Datos de la instancia (p. ej. los argumentos de planificar_hospital).
+        - minimo_elementos (int): Tamaño a partir del cual un arreglo se comparte.
+        - tipo: dtype con el que se guardan los arreglos numéricos (float64 por defecto, el
+          que usan los constructores, para que np.asarray no haga copias).
+
+    Atributos:
+        - datos (dict): Los datos con los arreglos grandes reemplazados por ArregloCompartido.
+    """
+
+    def __init__(self, datos, minimo_elementos=1024, tipo=np.float64):
+        self._segmentos = []
+        self.datos = {}
+        try:
+            for clave, valor in datos.items():
+                if isinstance(valor, (list, tuple, np.ndarray)):
+                    arreglo = np.asarray(valor)
+                    if arreglo.dtype.kind in "biuf" and arreglo.size >= minimo_elementos:
+                        self.datos[clave] = self._compartir(arreglo.astype(tipo, copy=False))
+                        continue
+                self.datos[clave] = valor
+        except BaseException:
+            self.cerrar()
+            raise
+
+    def _compartir(self, arreglo):
+        segmento = shared_memory.SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+        self._segmentos.append(segmento)
+        np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=segmento.buf)[...] = arreglo
+        return ArregloCompartido(segmento.name, arreglo.shape, arreglo.dtype.str)
+
+    @property
+    def bytes_compartidos(self):
+        return sum(segmento.size for segmento in self._segmentos)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        while self._segmentos:
+            segmento = self._segmentos.pop()
+            _ABIERTOS.pop(segmento.name, None)
+            segmento.close()
+            segmento.unlink()
+
+
+def _ejecutar(funcion, datos, tareas):
+    # Se ejecuta en el trabajador: las vistas se crean una vez por grupo de tareas
+    vistas = materializar(datos)
+    return [funcion(vistas, tarea) for tarea in tareas]
+
+
+def mapear_compartido(funcion, datos, tareas, procesos=None, tareas_por_envio=None):
+    """
+    Aplica funcion(datos, tarea) a cada tarea en procesos trabajadores, con los datos en
+    memoria compartida.
+
+    Parámetros:
+        - funcion (callable): Función de nivel de módulo (se envía por referencia) que recibe
+          el diccionario de datos con vistas NumPy y una tarea.
+        - datos (DatosCompartidos o dict): Datos compartidos (o su atributo datos).
+        - tareas (list): Argumentos livianos de cada llamada (p. ej. índices de escenario).
+        - procesos (int): Procesos trabajadores (por defecto, los núcleos disponibles).
+        - tareas_por_envio (int): Tareas por mensaje a un trabajador (por defecto, las
+          necesarias para repartir el trabajo en unos cuatro envíos por proceso).
+
+    Retorna:
+        - list: Resultados en el orden de las tareas.
+    """
+    if isinstance(datos, DatosCompartidos):
+        datos = datos.datos
+    tareas = list(tareas)
+    procesos = procesos or multiprocessing.cpu_count()
+    tareas_por_envio = tareas_por_envio or max(1, -(-len(tareas) // (4 * procesos)))
+    grupos = [tareas[k:k + tareas_por_envio] for k in range(0, len(tareas), tareas_por_envio)]
+    # spawn, como en PoolSolvers: no se heredan hilos ni candados del proceso padre
+    with ProcessPoolExecutor(procesos, mp_context=multiprocessing.get_context("spawn")) as ejecutor:
+        partes = ejecutor.map(_ejecutar, [funcion] * len(grupos), [datos] * len(grupos), grupos)
+        return [resultado for parte in partes for resultado in parte]
+
+
+def _escenario_hospital(datos, tarea):
+    import highspy
+
+    from .hospital import construir_forma_hospital
+    from .resolucion import OpcionesResolucion
+
+    # Solo el índice del escenario viaja en la tarea; la fila de demanda es una vista
+    s, opciones = tarea
+    forma = construir_forma_hospital(datos["prioridad"], datos["escenarios"][s], datos["capacidad"],
+                                     datos["recursos_por_paciente"], datos["recursos_disponibles"])
+    h = (opciones or OpcionesResolucion()).aplicar_highs(forma.a_highs())
+    h.run()
+    if h.getInfo().primal_solution_status != 2:
+        return None, None
+    valores = np.rint(np.asarray(h.getSolution().col_value))
+    optimo = h.getModelStatus() == highspy.HighsModelStatus.kOptimal
+    return forma.valor_objetivo(valores), (valores.reshape(len(datos["prioridad"]), -1).sum(axis=1), optimo)
+
+
+def evaluar_escenarios_hospital(prioridad, escenarios, capacidad, recursos_por_paciente, recursos_disponibles,
+                                procesos=None, opciones=None):
+    """
+    Resuelve la planificación hospitalaria para cada escenario de demanda (p. ej. una
+    simulación de Monte Carlo de la lista de espera) en procesos trabajadores, con la
+    capacidad y los escenarios en memoria compartida.
+
+    Parámetros:
+        - prioridad, capacidad, recursos_por_paciente, recursos_disponibles: Los mismos de
+          planificar_hospital.
+        - escenarios (array S x especialidades): Pacientes en espera en cada escenario.
+        - procesos (int): Procesos trabajadores.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos de HiGHS por escenario.
+
+    Retorna:
+        - dict: Claves "funcion_objetivo" (array S, NaN si el escenario no tuvo solución),
+          "atendidos" (array S x especialidades), "optimos" (array S de bool) y
+          "bytes_compartidos".
+    """
+    datos = {"prioridad": prioridad, "escenarios": escenarios, "capacidad": capacidad,
+             "recursos_por_paciente": recursos_por_paciente, "recursos_disponibles": recursos_disponibles}
+    num_escenarios, num_especialidades = np.shape(escenarios)
+    with DatosCompartidos(datos) as compartidos:
+        resultados = mapear_compartido(_escenario_hospital, compartidos,
+                                       [(s, opciones) for s in range(num_escenarios)], procesos)
+        bytes_compartidos = compartidos.bytes_compartidos
+
+    objetivo = np.full(num_escenarios, np.nan)
+    atendidos = np.zeros((num_escenarios, num_especialidades))
+    optimos = np.zeros(num_escenarios, dtype=bool)
+    for s, (valor, detalle) in enumerate(resultados):
+        if valor is not None:
+            objetivo[s] = valor
+            atendidos[s], optimos[s] = detalle
+    return {"funcion_objetivo": objetivo, "atendidos": atendidos, "optimos": optimos,
+            "bytes_compartidos": bytes_compartidos}
@@ -0,0 +1,61 @@
+"""
+Selección de pacientes a atender bajo un límite de horas médicas (problema de la mochila).
+
+El modelo usa docplex, que es una dependencia opcional y se importa solo al resolver.
+"""
+
+
+def seleccionar_pacientes(pacientes, tiempo_por_paciente, prioridad, horas_disponibles):
+    """
+    Maximiza la prioridad total de los pacientes atendidos sin superar las horas disponibles.
+
+    Parámetros:
+        - pacientes (list): Identificadores de los pacientes.
+        - tiempo_por_paciente (dict): Horas requeridas por cada paciente.
+        - prioridad (dict): Prioridad de atención de cada paciente (mayor es más prioritario).
+        - horas_disponibles (float): Total de horas médicas disponibles.
+
+    Retorna:
+        - dict: Diccionario con "factible", "atendidos" (paciente -> bool) y "funcion_objetivo",
+          o None en "funcion_objetivo" si no se encontró solución.
+    """
+    from docplex.mp.model import Model  # type: ignore
+
+    # Crear modelo de optimización
+    mdl = Model(name="Lista_de_espera")
+
+    # Variables de decisión
+    # x[i] = 1 si el paciente i es atendido, 0 en caso contrario
+    x = mdl.binary_var_dict(pacientes, name="x")
+
+    # Función objetivo: maximizar la prioridad total de los pacientes atendidos
+    mdl.maximize(mdl.sum(prioridad[i] * x[i] for i in pacientes))
+
+    # Restricción: El tiempo total de atención no puede superar las horas disponibles
+    mdl.add_constraint(mdl.sum(tiempo_por_paciente[i] * x[i] for i in pacientes) <= horas_disponibles,
+                       "Horas_disponibles")
+
+    # Resolver el modelo
+    solution = mdl.solve()
+
+    if not solution:
+        return {"factible": False, "atendidos": {}, "funcion_objetivo": None}
+
+    return {
+        "factible": True,
+        "atendidos": {i: round(x[i].solution_value) == 1 for i in pacientes},
+        "funcion_objetivo": solution.objective_value
+    }
+
+
+def imprimir_resultados(resultados):
+    """
+    Muestra por pantalla el resultado de seleccionar_pacientes.
+    """
+    if resultados["factible"]:
+        print("Solución encontrada:")
+        for i, atendido in resultados["atendidos"].items():
+            print(f"Paciente {i}: {'Atendido' if atendido else 'No atendido'}")
+        print(f"Prioridad total maximizada: {resultados['funcion_objetivo']}")
+    else:
+        print("No se encontró solución factible.")
@@ -0,0 +1,214 @@
+"""
+Frente de Pareto de la planificación hospitalaria.
+
+Además de los pacientes no atendidos ponderados por prioridad (el objetivo de
+planificar_hospital), se consideran dos objetivos secundarios:
+
+- "recursos": recursos totales utilizados, sum_ij r[i] x[i][j].
+- "equidad": peor fracción de pacientes no atendidos entre especialidades,
+  max_i (P[i] - sum_j x[i][j]) / P[i].
+
+El frente se genera con el método epsilon-restricción: minimizar el objetivo principal
+sujeto a secundario <= epsilon. El modelo se carga una sola vez en HiGHS y en cada paso
+solo cambian el lado derecho de la fila "Epsilon" y la solución inicial, que se toma del
+punto vecino con menor valor del secundario (factible para el nuevo epsilon). Los valores
+de epsilon se eligen de forma adaptativa: se bisecta primero el tramo del frente con
+mayor área normalizada entre puntos consecutivos, y se descartan los tramos en los que
+ya no puede haber puntos nuevos.
+"""
+import heapq
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+SECUNDARIOS = ("recursos", "equidad")
+
+
+@dataclass
+class PuntoPareto:
+    """
+    Punto no dominado del frente.
+
+    Atributos:
+        - epsilon (float): Cota del objetivo secundario con la que se obtuvo.
+        - funcion_objetivo (float): Pacientes no atendidos ponderados por prioridad.
+        - recursos (float): Recursos totales utilizados.
+        - peor_fraccion (float): Peor fracción de pacientes no atendidos entre especialidades.
+        - variables (dict): Valores de x_i_j.
+    """
+    epsilon: float
+    funcion_objetivo: float
+    recursos: float
+    peor_fraccion: float
+    variables: dict = field(default_factory=dict)
+
+
+def construir_problema_pareto(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                              secundario="recursos"):
+    """
+    Construye el modelo hospitalario con la fila "Epsilon" que acota el objetivo secundario.
+
+    Retorna:
+        - tuple: (problema, x) como construir_problema_hospital.
+    """
+    from pulp import LpVariable, lpSum
+
+    from .hospital import construir_problema_hospital
+
+    if secundario not in SECUNDARIOS:
+        raise ValueError(f"Objetivo secundario desconocido: {secundario!r} (opciones: {', '.join(SECUNDARIOS)})")
+
+    problema, x = construir_problema_hospital(prioridad, pacientes, capacidad,
+                                              recursos_por_paciente, recursos_disponibles)
+    if secundario == "recursos":
+        problema += (lpSum(recursos_por_paciente[i] * variable for i, fila in enumerate(x) for variable in fila)
+                     <= sum(recursos_disponibles), "Epsilon")
+    else:
+        peor_fraccion = LpVariable("Peor_Fraccion_No_Atendida", lowBound=0, upBound=1)
+        for i, fila in enumerate(x):
+            if pacientes[i] > 0:
+                problema += lpSum(fila) * (1 / pacientes[i]) + peor_fraccion >= 1, f"Equidad_{i+1}"
+        problema += peor_fraccion <= 1, "Epsilon"
+    return problema, x
+
+
+def frente_pareto_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                           secundario="recursos", puntos=10, tolerancia=1e-3, opciones=None):
+    """
+    Genera el frente de Pareto entre pacientes no atendidos y un objetivo secundario.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - secundario (str): "recursos" o "equidad".
+        - puntos (int): Máximo de resoluciones epsilon (sin contar las dos de los extremos).
+        - tolerancia (float): Ancho relativo (sobre el rango del secundario) por debajo del
+          cual un tramo no se sigue dividiendo.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos de cada resolución.
+
+    Retorna:
+        - dict: Claves "frente" (lista de PuntoPareto ordenada por el secundario, de menor a
+          mayor), "resoluciones" y "tiempo". Si no se obtiene solución al minimizar el
+          secundario (p. ej. por el tiempo límite), el frente tiene solo el óptimo del
+          objetivo principal.
+    """
+    import highspy
+
+    from .matricial import desde_problema
+    from .resolucion import OpcionesResolucion
+
+    inicio = time.perf_counter()
+    problema, x = construir_problema_pareto(prioridad, pacientes, capacidad, recursos_por_paciente,
+                                            recursos_disponibles, secundario)
+    forma = desde_problema(problema)
+    h = (opciones or OpcionesResolucion()).aplicar_highs(forma.a_highs())
+    n = forma.num_variables
+
+    fila = forma.nombres_restricciones.index("Epsilon")
+    g = np.zeros(n)
+    g[forma.indices[forma.indptr[fila]:forma.indptr[fila + 1]]] = forma.datos[forma.indptr[fila]:forma.indptr[fila + 1]]
+    g_maximo = forma.fila_sup[fila]
+    g_entero = bool(np.allclose(g, np.round(g)) and forma.entera[g != 0].all())
+
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), forma.c)
+
+    posicion = {nombre: k for k, nombre in enumerate(forma.nombres_variables)}
+    columnas_x = [posicion[variable.name] for fila_x in x for variable in fila_x]
+    p = np.asarray(prioridad, dtype=float)
+    P = np.asarray(pacientes, dtype=float)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    resoluciones = 0
+
+    def resolver(epsilon, inicial):
+        nonlocal resoluciones
+        h.changeRowBounds(fila, -highspy.kHighsInf, float(epsilon))
+        if inicial is not None:
+            h.setSolution(n, np.arange(n, dtype=np.int32), inicial)
+        h.run()
+        resoluciones += 1
+        if h.getInfo().primal_solution_status != 2:  # Sin solución factible
+            return None, None
+        valores = np.asarray(h.getSolution().col_value)
+        matriz = np.round(valores[columnas_x]).reshape(len(p), -1)
+        atendidos = matriz.sum(axis=1)
+        con_pacientes = P > 0
+        punto = PuntoPareto(
+            epsilon=float(epsilon),
+            funcion_objetivo=float(p @ (P - atendidos)),
+            recursos=float(r @ atendidos),
+            peor_fraccion=float(((P - atendidos)[con_pacientes] / P[con_pacientes]).max(initial=0.0)),
+            variables={forma.nombres_variables[k]: float(v) for k, v in zip(columnas_x, matriz.ravel())},
+        )
+        return punto, valores
+
+    def valor_secundario(punto):
+        return punto.recursos if secundario == "recursos" else punto.peor_fraccion
+
+    # Extremos: el óptimo del objetivo principal y el mínimo del secundario
+    derecho, valores_derecho = resolver(g_maximo, None)
+    if derecho is None:
+        return {"frente": [], "resoluciones": resoluciones, "tiempo": time.perf_counter() - inicio}
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), g)
+    h.changeRowBounds(fila, -highspy.kHighsInf, float(g_maximo))
+    h.run()
+    resoluciones += 1
+    # La información y la solución se leen antes de cambiar los costos, que las invalidan
+    g_factible = h.getInfo().primal_solution_status == 2  # Con tiempo límite puede no haber solución
+    g_minimo = float(h.getInfo().objective_function_value)
+    valores_g = np.asarray(h.getSolution().col_value)
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), forma.c)
+    izquierdo = None
+    if g_factible:
+        # Si el valor es el de una solución factible no óptima sigue siendo un epsilon
+        # alcanzable; solo que el extremo izquierdo queda más adentro del frente
+        g_minimo = round(g_minimo) if g_entero else g_minimo + 1e-9
+        izquierdo, valores_izquierdo = resolver(g_minimo, valores_g)
+    if izquierdo is None:
+        # Sin el mínimo del secundario no hay tramo que recorrer: el frente es el óptimo principal
+        return {"frente": [derecho], "resoluciones": resoluciones, "tiempo": time.perf_counter() - inicio}
+
+    frente = {valor_secundario(derecho): (derecho, valores_derecho),
+              valor_secundario(izquierdo): (izquierdo, valores_izquierdo)}
+    rango_g = max(valor_secundario(derecho) - valor_secundario(izquierdo), 1e-12)
+    rango_f = max(izquierdo.funcion_objetivo - derecho.funcion_objetivo, 1e-12)
+
+    # Tramos pendientes: (-área normalizada, epsilon desde el que puede haber puntos, izquierdo, derecho)
+    tramos = []
+
+    def agregar_tramo(desde, punto_izquierdo, punto_derecho):
+        ancho = valor_secundario(punto_derecho) - desde
+        alto = punto_izquierdo.funcion_objetivo - punto_derecho.funcion_objetivo
+        if ancho <= max(tolerancia * rango_g, 1.0 if g_entero else 0.0) or alto <= 1e-9:
+            return
+        heapq.heappush(tramos, (-(ancho / rango_g) * (alto / rango_f), desde,
+                                valor_secundario(punto_izquierdo), valor_secundario(punto_derecho)))
+
+    agregar_tramo(valor_secundario(izquierdo), izquierdo, derecho)
+    for _ in range(puntos):
+        if not tramos:
+            break
+        _, desde, clave_izquierdo, clave_derecho = heapq.heappop(tramos)
+        (punto_izquierdo, valores), (punto_derecho, _) = frente[clave_izquierdo], frente[clave_derecho]
+        epsilon = (desde + valor_secundario(punto_derecho)) / 2
+        if g_entero:
+            epsilon = np.floor(epsilon)
+        nuevo, valores_nuevo = resolver(epsilon, valores)
+        if nuevo is None or nuevo.funcion_objetivo >= punto_izquierdo.funcion_objetivo - 1e-9:
+            # Entre "desde" y epsilon el frente no cambia: seguir buscando a la derecha
+            agregar_tramo(epsilon, punto_izquierdo, punto_derecho)
+            continue
+        frente[valor_secundario(nuevo)] = (nuevo, valores_nuevo)
+        agregar_tramo(desde, punto_izquierdo, nuevo)
+        agregar_tramo(epsilon, nuevo, punto_derecho)
+
+    # Cada punto minimiza el objetivo principal para su epsilon, pero el plan puede no ser el
+    # de menor secundario entre los óptimos: se descartan los dominados por otro punto
+    ordenados = [frente[clave][0] for clave in sorted(frente)]
+    no_dominados = [punto for k, punto in enumerate(ordenados)
+                    if all(otro.funcion_objetivo > punto.funcion_objetivo + 1e-9 for otro in ordenados[:k])]
+    return {
+        "frente": no_dominados,
+        "resoluciones": resoluciones,
+        "tiempo": time.perf_counter() - inicio,
+    }
@@ -0,0 +1,152 @@
+"""
+Plantillas reutilizables del modelo hospitalario, indexadas por forma del problema.
+
+Construir el modelo con PuLP (nombres, variables, expresiones y restricciones) cuesta mucho
+más que resolver las instancias pequeñas del proyecto. Una plantilla construye la estructura
+una sola vez para un par (especialidades, semanas) y, en cada instancia nueva, solo reescribe
+los coeficientes y lados derechos que cambiaron respecto de la instancia anterior.
+"""
+import threading
+
+from .hospital import construir_problema_hospital, recopilar_resultados
+
+_PLANTILLAS = {}
+_CANDADO_CACHE = threading.Lock()
+
+
+class PlantillaHospital:
+    """
+    Modelo hospitalario ya construido para una forma fija, al que se le vinculan datos.
+
+    La plantilla es mutable: cada llamada a resolver() reescribe los coeficientes del
+    modelo, por lo que las llamadas concurrentes se serializan con un candado propio.
+    """
+
+    def __init__(self, num_especialidades, num_semanas):
+        self.forma = (num_especialidades, num_semanas)
+
+        # Estructura con datos neutros: todos los términos quedan presentes con coeficiente 1
+        self._prioridad = [1] * num_especialidades
+        self._pacientes = [0] * num_especialidades
+        self._capacidad = [[0] * num_semanas for _ in range(num_especialidades)]
+        self._recursos_por_paciente = [1] * num_especialidades
+        self._recursos_disponibles = [0] * num_semanas
+        self.problema, self.x = construir_problema_hospital(
+            self._prioridad, self._pacientes, self._capacidad,
+            self._recursos_por_paciente, self._recursos_disponibles)
+
+        restricciones = self.problema.constraints
+        self._fila_pacientes = [restricciones[f"Pacientes_Especialidad_{i+1}"] for i in range(num_especialidades)]
+        self._fila_capacidad = [[restricciones[f"Capacidad_{i+1}_{j+1}"] for j in range(num_semanas)]
+                                for i in range(num_especialidades)]
+        self._fila_recursos = [restricciones[f"Recursos_Semana_{j+1}"] for j in range(num_semanas)]
+        self._candado = threading.Lock()
+        self.cambios_ultima_vinculacion = 0
+
+    def vincular(self, prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles):
+        """
+        Reescribe en el modelo solo los números que difieren de la instancia anterior.
+
+        Retorna:
+            - int: Cantidad de coeficientes y lados derechos modificados.
+        """
+        num_especialidades, num_semanas = self.forma
+        if len(prioridad) != num_especialidades or len(recursos_disponibles) != num_semanas:
+            raise ValueError(f"La instancia no tiene la forma {self.forma} de la plantilla")
+
+        objetivo = self.problema.objective
+        cambios = 0
+        constante_cambia = False
+
+        for i in range(num_especialidades):
+            if prioridad[i] != self._prioridad[i]:
+                self._prioridad[i] = prioridad[i]
+                for variable in self.x[i]:
+                    objetivo[variable] = -prioridad[i]
+                cambios += num_semanas
+                constante_cambia = True
+
+            if pacientes[i] != self._pacientes[i]:
+                self._pacientes[i] = pacientes[i]
+                self._fila_pacientes[i].changeRHS(pacientes[i])
+                cambios += 1
+                constante_cambia = True
+
+            if recursos_por_paciente[i] != self._recursos_por_paciente[i]:
+                self._recursos_por_paciente[i] = recursos_por_paciente[i]
+                for j in range(num_semanas):
+                    self._fila_recursos[j].expr[self.x[i][j]] = recursos_por_paciente[i]
+                cambios += num_semanas
+
+            capacidad_actual = self._capacidad[i]
+            for j in range(num_semanas):
+                if capacidad[i][j] != capacidad_actual[j]:
+                    capacidad_actual[j] = capacidad[i][j]
+                    self._fila_capacidad[i][j].changeRHS(capacidad[i][j])
+                    cambios += 1
+
+        for j in range(num_semanas):
+            if recursos_disponibles[j] != self._recursos_disponibles[j]:
+                self._recursos_disponibles[j] = recursos_disponibles[j]
+                self._fila_recursos[j].changeRHS(recursos_disponibles[j])
+                cambios += 1
+
+        # Término constante del objetivo: suma de prioridad[i] * pacientes[i]
+        if constante_cambia:
+            objetivo.constant = sum(p * d for p, d in zip(self._prioridad, self._pacientes))
+            cambios += 1
+
+        self.cambios_ultima_vinculacion = cambios
+        return cambios
+
+    def resolver(self, prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles, solver=None):
+        """
+        Vincula los datos de la instancia y resuelve el modelo.
+
+        Retorna:
+            - dict: El mismo diccionario que retorna planificar_hospital.
+        """
+        with self._candado:
+            self.vincular(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles)
+            self.problema.solve(solver)
+            return recopilar_resultados(self.problema, self.x)
+
+
+def obtener_plantilla(num_especialidades, num_semanas):
+    """
+    Retorna la plantilla en caché para la forma dada, construyéndola la primera vez.
+    """
+    forma = (num_especialidades, num_semanas)
+    with _CANDADO_CACHE:
+        plantilla = _PLANTILLAS.get(forma)
+        if plantilla is None:
+            plantilla = _PLANTILLAS[forma] = PlantillaHospital(num_especialidades, num_semanas)
+    return plantilla
+
+
+def limpiar_plantillas():
+    """
+    Vacía la caché de plantillas.
+    """
+    with _CANDADO_CACHE:
+        _PLANTILLAS.clear()
+
+
+def planificar_hospital_con_plantilla(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                      solver=None):
+    """
+    Igual que planificar_hospital, pero reutiliza el modelo construido para la misma forma.
+
+    Parámetros:
+        - prioridad (list): Lista con la prioridad de cada especialidad.
+        - pacientes (list): Lista con el número de pacientes en lista de espera por especialidad.
+        - capacidad (list of lists): Matriz de capacidad semanal por especialidad y semana.
+        - recursos_por_paciente (list): Lista de recursos necesarios por paciente por especialidad.
+        - recursos_disponibles (list): Lista de recursos disponibles por semana.
+        - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorna:
+        - dict: Diccionario con los valores de las variables de decisión y el valor de la función objetivo.
+    """
+    plantilla = obtener_plantilla(len(prioridad), len(recursos_disponibles))
+    return plantilla.resolver(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles, solver)
@@ -0,0 +1,350 @@
+"""
+Predicción del tiempo de resolución para elegir backend, límite de tiempo y orden de un lote.
+
+La dificultad de las instancias de una campaña varía mucho: con un límite de tiempo común
+se sobredimensiona para las fáciles y las difíciles quedan rezagadas al final del lote.
+PredictorTiempo aprende de tiempos ya medidos un modelo lineal del logaritmo del tiempo
+sobre características baratas de la instancia (calculadas de los datos, sin construir el
+modelo): tamaño, holgura de los recursos respecto de la capacidad, fracción de variables
+enteras y rango de los coeficientes. Se ajusta un modelo por (modelo, backend) con mínimos
+cuadrados regularizados, y la dispersión de sus residuos da el margen del límite de tiempo.
+
+resolver_lote() usa el predictor para elegir el backend más rápido de cada instancia,
+fijar su límite de tiempo, enviar primero las más largas (así los procesos no quedan
+ociosos esperando a la última instancia larga) y registrar los tiempos obtenidos. Para
+que todos los backends lleguen a tener predicción, una fracción de cada lote (y las
+instancias sin predicción) se envía a los backends que aún no tienen registros suficientes.
+"""
+import json
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+# Modelos cuyos datos son arreglos numéricos y se envían a los trabajadores en memoria
+# compartida (ver memoria_compartida.py). En agenda, mochila y residuos los datos son
+# identificadores y diccionarios, que deben conservar su tipo y son pequeños.
+_MODELOS_COMPARTIDOS = ("hospital",)
+
+CARACTERISTICAS = ("log_variables", "log_no_ceros", "enteras", "log_holgura", "rango_coeficientes")
+
+
+def _rango(valores):
+    # Órdenes de magnitud entre el mayor y el menor coeficiente no nulo
+    valores = np.abs(np.asarray(valores, dtype=float).ravel())
+    valores = valores[valores > 0]
+    return float(np.log10(valores.max() / valores.min())) if len(valores) else 0.0
+
+
+def _holgura(disponible, requerido):
+    # Cociente disponible / requerido en escala logarítmica: negativo si los recursos no alcanzan
+    return math.log(max(disponible, 1e-9) / max(requerido, 1e-9))
+
+
+def caracteristicas_instancia(instancia):
+    """
+    Calcula las características de una instancia a partir de sus datos.
+
+    Parámetros:
+        - instancia (dict): Instancia con las claves "modelo" y "datos".
+
+    Retorna:
+        - dict con las claves de CARACTERISTICAS, o None si el modelo no admite predicción
+          (los mismos de estimar_modelo).
+    """
+    from .estimacion import estimar_modelo
+
+    modelo, datos = instancia["modelo"], instancia["datos"]
+    try:
+        estimacion = estimar_modelo(modelo, datos)
+    except ValueError:
+        return None
+
+    if modelo == "hospital":
+        c = np.asarray(datos["capacidad"], dtype=float)
+        r = np.asarray(datos["recursos_por_paciente"], dtype=float)
+        # Recursos disponibles frente a los que consumiría usar toda la capacidad
+        holgura = _holgura(float(np.sum(datos["recursos_disponibles"])), float(r @ c.sum(axis=1)))
+        enteras, rango = 1.0, _rango(np.concatenate([r, np.asarray(datos["prioridad"], dtype=float)]))
+    elif modelo == "agenda":
+        holgura = _holgura(datos["capacidad_diaria"] * len(datos["dias"]), len(datos["pacientes"]))
+        enteras, rango = 1.0, _rango(datos["dias"])
+    else:
+        # Fondos de cada municipalidad frente a la suma de las asignaciones mínimas
+        minimo = sum(datos["C"][a] for a in datos["actividades"])
+        holgura = float(np.mean([_holgura(datos["F"][m], minimo) for m in datos["municipalidades"]]))
+        enteras = 0.0
+        rango = _rango([datos["I"][a] / datos["C"][a] for a in datos["actividades"]])
+
+    return {
+        "log_variables": math.log1p(estimacion.variables),
+        "log_no_ceros": math.log1p(estimacion.no_ceros),
+        "enteras": enteras,
+        "log_holgura": holgura,
+        "rango_coeficientes": rango,
+    }
+
+
+class PredictorTiempo:
+    """
+    Modelo del tiempo de resolución aprendido de tiempos registrados.
+
+    Parámetros:
+        - regularizacion (float): Peso de la penalización ridge de los coeficientes (no
+          se aplica al término constante).
+        - minimo_registros (int): Registros de un (modelo, backend) necesarios para predecir.
+
+    Los registros y coeficientes se guardan en JSON con guardar() y cargar().
+    """
+
+    def __init__(self, regularizacion=1e-3, minimo_registros=None):
+        self.regularizacion = regularizacion
+        self.minimo_registros = minimo_registros or len(CARACTERISTICAS) + 2
+        self.registros = []
+        self._ajustes = {}
+
+    def registrar(self, instancia, backend, segundos, caracteristicas=None):
+        """
+        Agrega el tiempo medido de una resolución. Retorna False si el modelo no admite predicción.
+        """
+        caracteristicas = caracteristicas or caracteristicas_instancia(instancia)
+        if caracteristicas is None:
+            return False
+        self.registros.append({"modelo": instancia["modelo"], "backend": backend, "segundos": float(segundos),
+                               "caracteristicas": caracteristicas})
+        self._ajustes.pop((instancia["modelo"], backend), None)
+        return True
+
+    def num_registros(self, modelo, backend):
+        """
+        Retorna el número de tiempos registrados de un (modelo, backend).
+        """
+        return sum(1 for r in self.registros if r["modelo"] == modelo and r["backend"] == backend)
+
+    def _ajuste(self, modelo, backend):
+        # (coeficientes, desviación de los residuos) o None si faltan registros
+        clave = (modelo, backend)
+        if clave not in self._ajustes:
+            registros = [r for r in self.registros if r["modelo"] == modelo and r["backend"] == backend]
+            if len(registros) < self.minimo_registros:
+                return None
+            X = np.array([[1.0] + [r["caracteristicas"][k] for k in CARACTERISTICAS] for r in registros])
+            y = np.log(np.maximum([r["segundos"] for r in registros], 1e-4))
+            # Ridge como mínimos cuadrados aumentados: filas sqrt(lambda) * I debajo de X
+            penalizacion = math.sqrt(self.regularizacion) * np.eye(X.shape[1])[1:]
+            beta = np.linalg.lstsq(np.vstack([X, penalizacion]), np.concatenate([y, np.zeros(len(penalizacion))]),
+                                   rcond=None)[0]
+            residuos = y - X @ beta
+            libertad = max(len(y) - X.shape[1], 1)
+            self._ajustes[clave] = (beta, float(np.sqrt(residuos @ residuos / libertad)))
+        return self._ajustes[clave]
+
+    def predecir(self, instancia, backend, caracteristicas=None):
+        """
+        Retorna el tiempo previsto en segundos, o None si no hay registros suficientes.
+        """
+        caracteristicas = caracteristicas or caracteristicas_instancia(instancia)
+        if caracteristicas is None:
+            return None
+        ajuste = self._ajuste(instancia["modelo"], backend)
+        if ajuste is None:
+            return None
+        beta, _ = ajuste
+        return float(np.exp(beta[0] + beta[1:] @ [caracteristicas[k] for k in CARACTERISTICAS]))
+
+    def limite_tiempo(self, instancia, backend, cuantil=2.0, margen=1.5, minimo=1.0, maximo=None,
+                      caracteristicas=None):
+        """
+        Límite de tiempo para una instancia: el tiempo previsto multiplicado por
+        exp(cuantil * desviación de los residuos) y por margen, entre minimo y maximo.
+
+        Retorna:
+            - float, o maximo (posiblemente None) si no hay registros suficientes.
+        """
+        caracteristicas = caracteristicas or caracteristicas_instancia(instancia)
+        prevista = self.predecir(instancia, backend, caracteristicas)
+        if prevista is None:
+            return maximo
+        _, desviacion = self._ajuste(instancia["modelo"], backend)
+        limite = max(prevista * math.exp(cuantil * desviacion) * margen, minimo)
+        return min(limite, maximo) if maximo is not None else limite
+
+    def elegir_backend(self, instancia, backends=("highs", "cbc"), caracteristicas=None):
+        """
+        Retorna (backend, tiempo previsto) con el backend de menor tiempo previsto; si
+        ninguno tiene registros suficientes, el primero de backends con tiempo None.
+        """
+        caracteristicas = caracteristicas or caracteristicas_instancia(instancia)
+        previstos = [(self.predecir(instancia, backend, caracteristicas), backend) for backend in backends]
+        conocidos = [(tiempo, backend) for tiempo, backend in previstos if tiempo is not None]
+        if not conocidos:
+            return backends[0], None
+        tiempo, backend = min(conocidos)
+        return backend, tiempo
+
+    def guardar(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"regularizacion": self.regularizacion, "minimo_registros": self.minimo_registros,
+                       "registros": self.registros}, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            contenido = json.load(archivo)
+        predictor = cls(contenido["regularizacion"], contenido["minimo_registros"])
+        predictor.registros = contenido["registros"]
+        return predictor
+
+
+def planificar_lote(instancias, predictor, backends=("highs", "cbc"), limite_maximo=None, exploracion=0.1,
+                    **parametros_limite):
+    """
+    Decide backend, límite de tiempo y orden de ejecución de un lote de instancias.
+
+    Si algún backend no tiene registros suficientes para un modelo, las instancias sin
+    predicción se reparten por turnos entre los backends que los necesitan, y una de cada
+    1 / exploracion instancias con predicción se envía a uno de ellos en vez de al más
+    rápido, hasta completar sus registros faltantes (sin esto, solo el primer backend
+    llegaría a tener tiempos medidos). Las instancias se criban antes (cribar_instancia):
+    las que el cribado prueba infactibles no se resuelven ni se registran, así que no
+    cuentan para la exploración.
+
+    Parámetros:
+        - instancias (list): Instancias con las claves "modelo" y "datos".
+        - predictor (PredictorTiempo): Predictor ya entrenado (puede no tener registros).
+        - backends (tuple): Backends candidatos ("highs", "cbc"); el primero es el de
+          las instancias sin predicción cuando ya no hace falta explorar.
+        - limite_maximo (float): Tope del límite de tiempo (y límite de las instancias sin
+          predicción o exploradas).
+        - exploracion (float): Fracción de las instancias con predicción que se envía a un
+          backend con registros insuficientes (0 para no explorar).
+        - parametros_limite: cuantil, margen y minimo de PredictorTiempo.limite_tiempo.
+
+    Retorna:
+        - list: Un dict por instancia con "indice" (posición en instancias), "backend",
+          "tiempo_previsto", "limite_tiempo", "explorada" y "certificados" (los del cribado,
+          vacía si no se probó infactible), de la más larga a la más corta. Las instancias
+          sin predicción (incluidas las exploradas) van primero, ya que pueden ser las más
+          largas, y las cribadas (backend None, tiempo previsto 0) al final.
+    """
+    from .cribado import cribar_instancia
+
+    # Registros que aún le faltan a cada (modelo, backend), descontando los ya planificados
+    faltantes = {}
+    sin_prediccion, con_prediccion = {}, {}
+    planes = []
+    for indice, instancia in enumerate(instancias):
+        modelo = instancia["modelo"]
+        caracteristicas = caracteristicas_instancia(instancia)
+        certificados = [certificado.a_dict() for certificado in cribar_instancia(instancia)]
+        if certificados:
+            planes.append({"indice": indice, "backend": None, "tiempo_previsto": 0.0, "limite_tiempo": None,
+                           "explorada": False, "caracteristicas": caracteristicas, "certificados": certificados})
+            continue
+        backend, prevista = predictor.elegir_backend(instancia, backends, caracteristicas)
+        explorada = False
+        if caracteristicas is not None and exploracion > 0:
+            for candidato in backends:
+                if (modelo, candidato) not in faltantes:
+                    faltantes[modelo, candidato] = max(predictor.minimo_registros
+                                                       - predictor.num_registros(modelo, candidato), 0)
+            pendientes = [candidato for candidato in backends if faltantes[modelo, candidato] > 0]
+            if pendientes and prevista is None:
+                turno = sin_prediccion[modelo] = sin_prediccion.get(modelo, -1) + 1
+                backend = pendientes[turno % len(pendientes)]
+            elif pendientes:
+                # La k-ésima instancia con predicción explora si ceil(k * exploracion) aumenta
+                k = con_prediccion[modelo] = con_prediccion.get(modelo, -1) + 1
+                if math.ceil((k + 1) * exploracion) > math.ceil(k * exploracion):
+                    backend, prevista, explorada = pendientes[0], None, True
+            if backend in pendientes:
+                faltantes[modelo, backend] -= 1
+        planes.append({"indice": indice, "backend": backend, "tiempo_previsto": prevista,
+                       "limite_tiempo": (limite_maximo if explorada else
+                                         predictor.limite_tiempo(instancia, backend, maximo=limite_maximo,
+                                                                 caracteristicas=caracteristicas,
+                                                                 **parametros_limite)),
+                       "explorada": explorada, "caracteristicas": caracteristicas, "certificados": []})
+    # sorted es estable: a igual tiempo previsto se conserva el orden del lote
+    return sorted(planes, key=lambda plan: -math.inf if plan["tiempo_previsto"] is None
+                  else -plan["tiempo_previsto"])
+
+
+def _resolver_plan(instancia, backend, limite_tiempo):
+    from .instancias import resolver_instancia
+    from .memoria_compartida import materializar
+    from .resolucion import OpcionesResolucion
+
+    instancia = dict(instancia, datos=materializar(instancia["datos"]))
+    solver = OpcionesResolucion(limite_tiempo=limite_tiempo, backend=backend).crear_solver()
+    inicio = time.perf_counter()
+    # planificar_lote ya cribó la instancia
+    resultado = resolver_instancia(instancia, solver, cribar=False)
+    return resultado, time.perf_counter() - inicio
+
+
+def resolver_lote(instancias, predictor=None, procesos=None, backends=("highs", "cbc"), limite_maximo=None,
+                  registrar=True, exploracion=0.1, **parametros_limite):
+    """
+    Resuelve un lote de instancias en procesos trabajadores según planificar_lote.
+
+    Parámetros:
+        - instancias (list), backends (tuple), limite_maximo (float), exploracion (float),
+          parametros_limite: Ver planificar_lote.
+        - predictor (PredictorTiempo): Predictor a usar (por defecto uno vacío).
+        - procesos (int): Procesos trabajadores (por defecto, los núcleos disponibles).
+        - registrar (bool): Agregar al predictor los tiempos medidos de las instancias
+          resueltas sin alcanzar su límite (las cortadas por el límite subestimarían el tiempo).
+
+    Los arreglos grandes de las instancias del hospital viajan a los trabajadores en memoria
+    compartida (DatosCompartidos) en vez de serializarse con cada tarea.
+
+    Retorna:
+        - list: Un dict por instancia, en el orden de instancias, con "resultado",
+          "backend", "tiempo_previsto", "limite_tiempo", "explorada", "segundos" y "error".
+          Si la resolución de una instancia lanzó una excepción, "resultado" y "segundos"
+          son None y "error" la describe; el resto del lote sigue y su tiempo no se registra.
+          Las instancias cribadas no se envían a los trabajadores: su resultado es
+          {"estado": -1, "certificados": [...]}, como en resolver_instancia, con 0 segundos.
+    """
+    from .memoria_compartida import DatosCompartidos
+
+    predictor = predictor if predictor is not None else PredictorTiempo()
+    planes = planificar_lote(instancias, predictor, backends, limite_maximo, exploracion, **parametros_limite)
+    salida = [None] * len(instancias)
+    contexto = multiprocessing.get_context("spawn")
+    # Los segmentos se liberan al salir de la pila, después de cerrar el ejecutor
+    with ExitStack() as segmentos, \
+            ProcessPoolExecutor(procesos or multiprocessing.cpu_count(), mp_context=contexto) as ejecutor:
+        enviadas = []
+        for plan in planes:
+            if plan["certificados"]:
+                salida[plan["indice"]] = {"resultado": {"estado": -1, "certificados": plan["certificados"]},
+                                          "backend": None, "tiempo_previsto": plan["tiempo_previsto"],
+                                          "limite_tiempo": None, "explorada": False, "segundos": 0.0, "error": None}
+                continue
+            instancia = instancias[plan["indice"]]
+            if instancia["modelo"] in _MODELOS_COMPARTIDOS:
+                instancia = dict(instancia, datos=segmentos.enter_context(DatosCompartidos(instancia["datos"])).datos)
+            enviadas.append((plan, instancia))
+        # Enviar en orden de tiempo previsto decreciente: las largas empiezan primero
+        futuros = [(plan, ejecutor.submit(_resolver_plan, instancia, plan["backend"], plan["limite_tiempo"]))
+                   for plan, instancia in enviadas]
+        for plan, futuro in futuros:
+            entrada = {"resultado": None, "backend": plan["backend"], "tiempo_previsto": plan["tiempo_previsto"],
+                       "limite_tiempo": plan["limite_tiempo"], "explorada": plan["explorada"], "segundos": None,
+                       "error": None}
+            salida[plan["indice"]] = entrada
+            try:
+                resultado, segundos = futuro.result()
+            except Exception as error:
+                entrada["error"] = f"{type(error).__name__}: {error}"
+                continue
+            entrada.update(resultado=resultado, segundos=segundos)
+            cortada = plan["limite_tiempo"] is not None and segundos >= plan["limite_tiempo"]
+            if registrar and not cortada:
+                predictor.registrar(instancias[plan["indice"]], plan["backend"], segundos, plan["caracteristicas"])
+    return salida
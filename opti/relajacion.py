@@ -0,0 +1,212 @@
+"""
+Resolución rápida por relajación lineal y redondeo.
+
+En vez de ramificar desde el principio, se resuelve la relajación lineal del modelo con
+HiGHS, se redondea la solución hacia abajo (factible en modelos de tipo "<=" con
+coeficientes no negativos, como el hospitalario), se completa con una heurística voraz que
+aprovecha la holgura restante y se compara con la cota de la relajación. Solo si el gap
+probado supera la tolerancia se resuelve el modelo entero completo.
+"""
+import time
+
+import numpy as np
+
+from .matricial import desde_problema
+
+# Estados de PuLP (ver pulp.constants)
+_OPTIMO = 1
+_INFACTIBLE = -1
+_SOLUCION_OPTIMA = 1
+_SOLUCION_FACTIBLE = 2
+
+
+def redondear_factible(forma, x_relajado, tolerancia=1e-6):
+    """
+    Redondea una solución de la relajación lineal a una solución entera factible.
+
+    Las variables enteras se redondean hacia abajo y a continuación se aumentan, de mayor a
+    menor mejora del objetivo, con la holgura de sus filas. El llenado se hace por pasadas
+    vectorizadas: en cada pasada cada variable pide el aumento que le permitirían sus filas
+    por sí sola, y en cada fila la holgura se reparte en ese orden con sumas acumuladas,
+    de modo que una variable solo recibe lo que dejan las anteriores. Las pasadas se repiten
+    hasta que ninguna variable puede aumentar (la primera con aumento posible siempre recibe
+    lo que pide, así que cada pasada avanza).
+
+    Parámetros:
+        - forma (FormaMatricial): Modelo.
+        - x_relajado (array): Solución de la relajación lineal.
+        - tolerancia (float): Tolerancia absoluta de factibilidad.
+
+    Retorna:
+        - array con la solución redondeada, o None si el redondeo hacia abajo no es factible.
+    """
+    x_relajado = np.asarray(x_relajado, dtype=float)
+    x = np.where(forma.entera, np.floor(x_relajado + tolerancia), x_relajado)
+    x = np.maximum(x, forma.col_inf)
+
+    actividad = forma.actividad(x)
+    if (actividad > forma.fila_sup + tolerancia).any() or (actividad < forma.fila_inf - tolerancia).any():
+        return None
+
+    # Candidatas: enteras que mejoran el objetivo, numeradas por prioridad
+    costo = forma.sentido * forma.c
+    candidata = forma.entera & (costo < 0)
+    orden = np.lexsort((x - x_relajado, costo))
+    orden = orden[candidata[orden]]
+    if not len(orden):
+        return x
+    rango = np.empty(forma.num_variables, dtype=np.int64)
+    rango[orden] = np.arange(len(orden))
+
+    # Elementos de las candidatas, agrupados por (fila, lado) y en orden de prioridad: un
+    # coeficiente positivo consume la holgura hacia fila_sup y uno negativo hacia fila_inf
+    filas = forma.filas_de_elementos()
+    usados = candidata[forma.indices] & (forma.datos != 0)
+    filas, columnas, coeficientes = filas[usados], forma.indices[usados], forma.datos[usados]
+    grupo = 2 * filas + (coeficientes < 0)
+    elementos = np.lexsort((rango[columnas], grupo))
+    filas, columnas, coeficientes, grupo = filas[elementos], columnas[elementos], coeficientes[elementos], grupo[elementos]
+    magnitud = np.abs(coeficientes)
+    positivo = coeficientes > 0
+    inicio_grupo = np.flatnonzero(np.diff(grupo, prepend=-1))
+    largo_grupo = np.diff(np.r_[inicio_grupo, len(grupo)])
+
+    while True:
+        holgura = np.where(positivo, forma.fila_sup[filas] - actividad[filas],
+                           actividad[filas] - forma.fila_inf[filas]) / magnitud
+        # Aumento que pide cada candidata con la holgura actual de todas sus filas
+        pedido = forma.col_sup - x
+        np.minimum.at(pedido, columnas, holgura)
+        pedido = np.where(candidata & np.isfinite(pedido), np.floor(np.maximum(pedido, 0) + tolerancia), 0)
+
+        # Reparto por fila: a cada elemento le queda la holgura menos lo pedido antes en su fila
+        demanda = magnitud * pedido[columnas]
+        acumulada = np.cumsum(demanda)
+        acumulada -= np.repeat(acumulada[inicio_grupo] - demanda[inicio_grupo], largo_grupo)
+        paso = pedido.copy()
+        np.minimum.at(paso, columnas, holgura - (acumulada - demanda) / magnitud)
+        paso = np.floor(np.maximum(paso, 0) + tolerancia)
+        if not paso.any():
+            return x
+        x += paso
+        actividad += np.bincount(filas, weights=coeficientes * paso[columnas], minlength=forma.num_restricciones)
+
+
+def _cota_entera(forma, cota):
+    # Si el objetivo solo tiene variables enteras con coeficientes enteros, c'x es entero
+    # y la cota de la relajación (en el sentido de minimizar) puede redondearse hacia arriba
+    usadas = forma.c != 0
+    if forma.entera[usadas].all() and np.allclose(forma.c[usadas], np.round(forma.c[usadas])):
+        constante = forma.sentido * forma.constante
+        return float(np.ceil(cota - constante - 1e-6) + constante)
+    return cota
+
+
+def relajar_y_redondear(forma):
+    """
+    Resuelve la relajación lineal de un modelo en forma matricial con HiGHS y la redondea
+    con redondear_factible, sin pasar por PuLP.
+
+    Parámetros:
+        - forma (FormaMatricial): Modelo.
+
+    Retorna:
+        - dict: Claves "infactible" (la relajación no tiene solución), "x" (solución
+          redondeada, o None), "funcion_objetivo", "cota" y "gap", en el sentido del modelo.
+          La cota es la de la relajación (mejorada si el objetivo es entero).
+
+    Lanza:
+        - RuntimeError: Si la relajación termina sin probar optimalidad ni infactibilidad.
+    """
+    import highspy
+
+    h = forma.a_highs(relajar_enteras=True)
+    h.run()
+    estado = h.getModelStatus()
+    if estado != highspy.HighsModelStatus.kOptimal:
+        if estado == highspy.HighsModelStatus.kInfeasible:
+            return {"infactible": True, "x": None, "funcion_objetivo": None, "cota": None, "gap": None}
+        raise RuntimeError(f"La relajación lineal terminó con estado {h.modelStatusToString(estado)}")
+
+    x_relajado = np.asarray(h.getSolution().col_value)
+    # En sentido de minimizar: costo'x + sentido*constante
+    cota = _cota_entera(forma, forma.sentido * forma.valor_objetivo(x_relajado))
+    x = redondear_factible(forma, x_relajado)
+    resumen = {"infactible": False, "x": x, "funcion_objetivo": None, "cota": forma.sentido * cota, "gap": None}
+    if x is not None:
+        valor = forma.sentido * forma.valor_objetivo(x)
+        resumen.update(funcion_objetivo=forma.sentido * valor, gap=max(valor - cota, 0.0) / max(abs(valor), 1e-9))
+    return resumen
+
+
+def resolver_entero(problema, forma, relajado, solver=None):
+    """
+    Resuelve el LpProblem entero cuando el redondeo no alcanza el gap pedido, con la solución
+    redondeada (si la hay) como valor inicial para los solvers creados con warmStart=True.
+
+    Parámetros:
+        - problema (LpProblem): Modelo entero, con las variables nombradas como las columnas
+          de la forma.
+        - forma (FormaMatricial): Modelo pasado a relajar_y_redondear.
+        - relajado (dict): Resultado de relajar_y_redondear.
+        - solver: Solver de PuLP.
+
+    Retorna:
+        - dict: Claves "metodo" ("entero"), "funcion_objetivo", "cota" y "gap". Si el solver
+          termina sin solución entera (tiempo límite o infactible por integralidad),
+          "funcion_objetivo" y "gap" son None y la cota es la de la relajación.
+    """
+    sentido = problema.sense
+    if relajado["x"] is not None:
+        variables = problema.variablesDict()
+        for nombre, valor_variable in zip(forma.nombres_variables, relajado["x"].tolist()):
+            variables[nombre].setInitialValue(valor_variable)
+    problema.solve(solver)
+    if problema.sol_status not in (_SOLUCION_OPTIMA, _SOLUCION_FACTIBLE) or problema.objective.value() is None:
+        return {"metodo": "entero", "funcion_objetivo": None, "cota": relajado["cota"], "gap": None}
+    valor = sentido * problema.objective.value()
+    cota = valor if problema.sol_status == _SOLUCION_OPTIMA else sentido * relajado["cota"]
+    return {"metodo": "entero", "funcion_objetivo": problema.objective.value(), "cota": sentido * cota,
+            "gap": max(valor - cota, 0.0) / max(abs(valor), 1e-9)}
+
+
+def resolver_por_relajacion(problema, tolerancia_gap=0.01, solver=None):
+    """
+    Resuelve un LpProblem entero por relajación lineal y redondeo, con escalamiento al
+    modelo entero si el gap probado supera la tolerancia.
+
+    Al terminar, los valores de la solución quedan asignados a las variables de "problema"
+    (varValue) y problema.status / problema.sol_status reflejan el resultado, de modo que
+    pueden usarse las funciones habituales de recopilación de resultados. Si el modelo ya
+    está en forma matricial conviene usar relajar_y_redondear directamente y construir el
+    LpProblem solo para escalar.
+
+    Parámetros:
+        - problema (LpProblem): Modelo a resolver.
+        - tolerancia_gap (float): Gap relativo máximo aceptado sin resolver el modelo entero.
+        - solver: Solver de PuLP para el modelo entero, si hace falta escalar.
+
+    Retorna:
+        - dict: Claves "metodo" ("relajacion" o "entero"), "funcion_objetivo", "cota",
+          "gap" y "segundos". La cota es la de la relajación (mejorada si el objetivo es
+          entero) en el sentido del modelo.
+    """
+    inicio = time.perf_counter()
+    forma = desde_problema(problema)
+    relajado = relajar_y_redondear(forma)
+    if relajado["infactible"]:
+        problema.status = _INFACTIBLE
+        return {"metodo": "relajacion", "funcion_objetivo": None, "cota": None, "gap": None,
+                "segundos": time.perf_counter() - inicio}
+
+    if relajado["gap"] is None or relajado["gap"] > tolerancia_gap:
+        resumen = resolver_entero(problema, forma, relajado, solver)
+        resumen["segundos"] = time.perf_counter() - inicio
+        return resumen
+
+    for variable, valor_variable in zip(problema.variables(), relajado["x"]):
+        variable.varValue = float(valor_variable)
+    problema.status = _OPTIMO
+    problema.sol_status = _SOLUCION_OPTIMA if relajado["gap"] == 0 else _SOLUCION_FACTIBLE
+    return {"metodo": "relajacion", "funcion_objetivo": relajado["funcion_objetivo"], "cota": relajado["cota"],
+            "gap": relajado["gap"], "segundos": time.perf_counter() - inicio}
@@ -0,0 +1,243 @@
+"""
+Modelos de asignación de fondos municipales para la gestión de residuos.
+
+Igual que en el resto del paquete, PuLP se importa dentro de cada función.
+"""
+import time
+
+
+def construir_problema_residuos(municipalidades, actividades, R, F, I, C):
+    """
+    Construye el modelo de maximización de la reducción de residuos sin resolverlo.
+
+    Parámetros:
+    - municipalidades: Lista de municipalidades.
+    - actividades: Lista de actividades disponibles.
+    - R: Diccionario con residuos anuales generados (toneladas) por municipalidad.
+    - F: Diccionario con fondos disponibles (pesos chilenos) por municipalidad.
+    - I: Diccionario con impacto (toneladas evitadas por peso invertido) por actividad.
+    - C: Diccionario con costo mínimo de cada actividad (pesos chilenos).
+
+    Retorno:
+    - tuple: (model, x, y) con el LpProblem y los diccionarios de variables.
+    """
+    from pulp import LpProblem, LpMaximize, LpVariable, lpSum
+
+    # Variables de decisión
+    x = {(a, m): LpVariable(f"x_{a}_{m}", lowBound=0, cat='Continuous') for a in actividades for m in municipalidades}
+    y = {m: LpVariable(f"y_{m}", lowBound=0, cat='Continuous') for m in municipalidades}
+
+    # Problema de optimización
+    model = LpProblem("Gestion_de_Residuos", LpMaximize)
+
+    # Función objetivo: Maximizar la reducción de residuos
+    model += lpSum(y[m] for m in municipalidades), "Maximizar_Reduccion_Residuos"
+
+    # Restricciones
+    for m in municipalidades:
+        # Cálculo de reducción de residuos
+        model += y[m] == lpSum((I[a] * x[a, m]) / C[a] for a in actividades), f"Calculo_Reduccion_Residuos_{m}"
+        # Restricción de presupuesto
+        model += lpSum(x[a, m] for a in actividades) <= F[m], f"Presupuesto_{m}"
+        # Límite de residuos reducidos
+        model += y[m] <= R[m], f"Limite_Residuos_Reducidos_{m}"
+
+    for a in actividades:
+        for m in municipalidades:
+            # Asignación mínima por actividad
+            model += x[a, m] >= C[a], f"Asignacion_Minima_{a}_{m}"
+
+    return model, x, y
+
+
+def optimizar_gestion_residuos(municipalidades, actividades, R, F, I, C, solver=None):
+    """
+    Función para optimizar la gestión de residuos maximizando la reducción de residuos.
+
+    Parámetros:
+    - municipalidades: Lista de municipalidades.
+    - actividades: Lista de actividades disponibles.
+    - R: Diccionario con residuos anuales generados (toneladas) por municipalidad.
+    - F: Diccionario con fondos disponibles (pesos chilenos) por municipalidad.
+    - I: Diccionario con impacto (toneladas evitadas por peso invertido) por actividad.
+    - C: Diccionario con costo mínimo de cada actividad (pesos chilenos).
+    - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorno:
+    - results: Diccionario con los fondos asignados y residuos reducidos por municipalidad.
+    - objetivo: Valor de la función objetivo (residuos totales REDUCIDOS).
+    - elapsed_time: Tiempo de ejecución del modelo.
+    """
+    results, objetivo, elapsed_time, _ = _resolver_gestion_residuos(municipalidades, actividades, R, F, I, C, solver)
+    return results, objetivo, elapsed_time
+
+
+def _resolver_gestion_residuos(municipalidades, actividades, R, F, I, C, solver):
+    # Como optimizar_gestion_residuos, pero también retorna el estado de la solución (sol_status de PuLP)
+    model, x, y = construir_problema_residuos(municipalidades, actividades, R, F, I, C)
+
+    # Medir el tiempo de ejecución
+    start_time = time.time()
+
+    # Resolver el modelo
+    model.solve(solver)
+
+    # Calcular el tiempo de ejecución
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+
+    # Preparar resultados
+    results = {}
+    for m in municipalidades:
+        results[m] = {
+            "reduccion_residuos": y[m].varValue,
+            "fondos_asignados": {a: x[a, m].varValue for a in actividades}
+        }
+    objetivo = model.objective.value()
+
+    return results, objetivo, elapsed_time, model.sol_status
+
+
+def optimizar_residuos_porcentual(
+    actividades,
+    municipalidades,
+    residuos_generados,
+    costos_actividad,
+    impacto_actividad,
+    presupuesto_municipal,
+    max_fondos_actividad,
+    max_reduccion_porcentual,
+    solver=None
+):
+    """
+    Minimiza los residuos remanentes cuando el impacto de cada actividad es porcentual.
+
+    Parámetros:
+    - actividades: Lista de actividades disponibles.
+    - municipalidades: Lista de municipalidades.
+    - residuos_generados: Diccionario con residuos generados por municipalidad.
+    - costos_actividad: Diccionario (actividad, municipalidad) con el costo de cada actividad.
+    - impacto_actividad: Diccionario (actividad, municipalidad) con el porcentaje reducido por peso invertido.
+    - presupuesto_municipal: Diccionario con el presupuesto de cada municipalidad.
+    - max_fondos_actividad: Diccionario (actividad, municipalidad) con el tope de fondos por actividad.
+    - max_reduccion_porcentual: Diccionario con la reducción porcentual máxima por municipalidad.
+    - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorno:
+    - resultados: Diccionario (actividad, municipalidad) con los fondos asignados.
+    - objetivo: Residuos remanentes totales.
+    """
+    from pulp import LpProblem, LpMinimize, LpVariable, lpSum
+
+    problema = LpProblem("Optimizacion_Gestion_Residuos", LpMinimize)
+
+    fondos = {
+        (a, m): LpVariable(f"fondos_{a}_{m}", lowBound=0)
+        for a in actividades for m in municipalidades
+    }
+
+    problema += lpSum(
+        residuos_generados[m] * (1 - lpSum(impacto_actividad[a, m] * fondos[a, m] for a in actividades) / 100)
+        for m in municipalidades
+    )
+
+    for m in municipalidades:
+        problema += lpSum(fondos[a, m] for a in actividades) <= presupuesto_municipal[m]
+
+    for a in actividades:
+        for m in municipalidades:
+            problema += fondos[a, m] <= max_fondos_actividad[a, m]
+
+    for m in municipalidades:
+        problema += lpSum(impacto_actividad[a, m] * fondos[a, m] for a in actividades) <= max_reduccion_porcentual[m]
+
+    problema.solve(solver)
+
+    resultados = {
+        (a, m): fondos[a, m].varValue for a in actividades for m in municipalidades
+    }
+    return resultados, problema.objective.value()
+
+
+def optimizar_fondos_balanceados(municipalidades, actividades, impacto, fondos_disponibles, costos_minimos,
+                                 solver=None):
+    """
+    Maximiza el impacto de los fondos asignados penalizando las diferencias entre actividades.
+
+    Parámetros:
+    - municipalidades: Lista de municipalidades.
+    - actividades: Lista de actividades disponibles.
+    - impacto: Diccionario con el impacto por peso invertido en cada actividad.
+    - fondos_disponibles: Diccionario con los fondos disponibles por municipalidad.
+    - costos_minimos: Diccionario con el costo mínimo de cada actividad.
+    - solver: Solver de PuLP a utilizar (por defecto el de PuLP, CBC).
+
+    Retorno:
+    - dict: Diccionario con "estado", "fondos" ((actividad, municipalidad) -> valor) y "funcion_objetivo".
+    """
+    from pulp import LpProblem, LpMaximize, LpVariable, lpSum
+
+    # Crear el problema de optimización
+    problema = LpProblem("Optimización_Fondos_Municipales", LpMaximize)
+
+    # Variables de decisión
+    fondos = {
+        (a, m): LpVariable(f"fondos_{a}_{m}", lowBound=0)
+        for a in actividades for m in municipalidades
+    }
+
+    # Variables auxiliares para las diferencias en valor absoluto
+    diferencias = {
+        (a, b, m): LpVariable(f"diferencia_{a}_{b}_{m}", lowBound=0)
+        for a in actividades for b in actividades for m in municipalidades if a != b
+    }
+
+    # Función objetivo: Maximizar el impacto total ponderado
+    problema += (
+        lpSum(fondos[a, m] * impacto[a] for a in actividades for m in municipalidades)
+        - lpSum(diferencias[a, b, m] for a in actividades for b in actividades for m in municipalidades if a != b),
+        "Maximizar impacto y balancear fondos"
+    )
+
+    # Restricciones
+    # 1. Los fondos asignados no deben exceder los disponibles por municipalidad
+    for m in municipalidades:
+        problema += lpSum(fondos[a, m] for a in actividades) <= fondos_disponibles[m], f"Restriccion_fondos_{m}"
+
+    # 2. Los fondos asignados deben cumplir los costos mínimos por actividad
+    for a in actividades:
+        for m in municipalidades:
+            problema += fondos[a, m] >= costos_minimos[a], f"Restriccion_minima_{a}_{m}"
+
+    # 3. Definir las diferencias con variables auxiliares
+    for m in municipalidades:
+        for a in actividades:
+            for b in actividades:
+                if a != b:
+                    problema += diferencias[a, b, m] >= fondos[a, m] - fondos[b, m], f"DiferenciaPositiva_{a}_{b}_{m}"
+                    problema += diferencias[a, b, m] >= fondos[b, m] - fondos[a, m], f"DiferenciaNegativa_{a}_{b}_{m}"
+
+    # Resolver el problema
+    problema.solve(solver)
+
+    return {
+        "estado": problema.status,
+        "fondos": {(a, m): fondos[a, m].varValue for a in actividades for m in municipalidades},
+        "funcion_objetivo": problema.objective.value()
+    }
+
+
+def imprimir_resultados(resultados, objetivo, tiempo, R):
+    """
+    Muestra por pantalla el resultado de optimizar_gestion_residuos.
+    """
+    print("Resultados:\n")
+    for m, data in resultados.items():
+        print(f"Municipalidad: {m}")
+        print(f"  Residuos anuales generados antes de optimización: {R[m]:,.0f} toneladas")
+        print(f"  Residuos a reducir producto de la optimización: {data['reduccion_residuos']:,.0f} toneladas")
+        print(f"  Residuos anuales generados después de optimización: {R[m] - data['reduccion_residuos']:,.0f} toneladas")
+        for a, fondos in data['fondos_asignados'].items():
+            print(f"  Fondos asignados a {a}: ${fondos:,.0f}")
+    print(f"\nObjetivo (residuos totales minimizados): {objetivo:,.2f}")
+    print(f"Tiempo computacional: {tiempo:.4f} segundos\n")
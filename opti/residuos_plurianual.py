@@ -0,0 +1,230 @@
+"""
+Asignación plurianual de fondos municipales para la gestión de residuos.
+
+Extiende optimizar_gestion_residuos a un horizonte de T años. Para cada municipalidad m y
+año t (variables x[a,m,t] >= C[a], ahorro s[m,t] >= 0, impacto acumulado k[m,t] y
+reducción y[m,t]):
+
+    Presupuesto_{m}_{t}:  sum_a x[a,m,t] + s[m,t] - arrastre * s[m,t-1] = F[m,t]
+    Impacto_{m}_{t}:      k[m,t] - persistencia * k[m,t-1] - sum_a I[a]/C[a] x[a,m,t] = 0
+    Reduccion_{m}_{t}:    y[m,t] <= k[m,t],   0 <= y[m,t] <= R[m,t]
+
+y se maximiza sum_t sum_m y[m,t] / (1 + descuento)^(t-1). Los fondos no gastados pasan al
+año siguiente, el impacto de lo invertido persiste en los años siguientes y los residuos
+R[m,t] evolucionan con una tasa de crecimiento o se dan año a año. A diferencia del modelo
+anual, la reducción puede quedar por debajo del impacto (y <= k) para que un impacto
+acumulado mayor que los residuos no haga infactible el modelo.
+
+El modelo es diagonal por bloques: las municipalidades no comparten restricciones y, dentro
+de cada una, los años solo se enlazan por el ahorro y el impacto acumulado (escalera). La
+matriz se arma directamente en CSR con NumPy, sin expresiones de PuLP. Además, el bloque
+de una municipalidad es el mismo para todas (I y C no dependen de m); solo cambian los
+lados derechos de los presupuestos y las cotas de y. Por eso, con descomponer=True, se
+carga en HiGHS un único bloque y se resuelve una vez por municipalidad cambiando esas cotas,
+con el simplex partiendo de la base de la municipalidad anterior.
+"""
+import time
+
+import numpy as np
+
+from .matricial import MAXIMIZAR, FormaMatricial
+
+
+def _por_anio(valores, nombres, anios, crecimiento=0.0):
+    # Diccionario nombre -> escalar (primer año) o lista de T valores, a una matriz (nombres x años)
+    matriz = np.empty((len(nombres), anios))
+    for k, nombre in enumerate(nombres):
+        valor = np.asarray(valores[nombre], dtype=float)
+        if valor.ndim == 0:
+            matriz[k] = valor * (1 + crecimiento) ** np.arange(anios)
+        elif len(valor) == anios:
+            matriz[k] = valor
+        else:
+            raise ValueError(f"Se esperaban {anios} valores anuales para {nombre!r}, no {len(valor)}")
+    return matriz
+
+
+def construir_forma_bloque(actividades, I, C, anios, arrastre=1.0, persistencia=1.0, descuento=0.0):
+    """
+    Construye la forma matricial del modelo plurianual de una municipalidad genérica.
+
+    Las cotas que dependen de la municipalidad quedan en F = 0 y R = inf; se fijan al
+    resolver cada municipalidad o al armar el modelo completo.
+
+    Retorna:
+        - FormaMatricial: Columnas ordenadas por año (x de cada actividad, s, k, y) y filas
+          Presupuesto, Impacto y Reduccion de cada año.
+    """
+    num_actividades = len(actividades)
+    ancho = num_actividades + 3
+    cociente = np.array([I[a] / C[a] for a in actividades], dtype=float)
+
+    indices, datos, largos = [], [], []
+    for t in range(anios):
+        base = t * ancho
+        x = base + np.arange(num_actividades)
+        s, k, y = base + num_actividades, base + num_actividades + 1, base + num_actividades + 2
+        anterior = t > 0
+        # Presupuesto
+        indices.append(np.concatenate([x, [s], [s - ancho] if anterior else []]))
+        datos.append(np.concatenate([np.ones(num_actividades), [1.0], [-arrastre] if anterior else []]))
+        # Impacto acumulado
+        indices.append(np.concatenate([[k], [k - ancho] if anterior else [], x]))
+        datos.append(np.concatenate([[1.0], [-persistencia] if anterior else [], -cociente]))
+        # Reducción
+        indices.append(np.array([y, k]))
+        datos.append(np.array([1.0, -1.0]))
+        largos.extend(len(fila) for fila in indices[-3:])
+
+    fila_inf = np.tile([0.0, 0.0, -np.inf], anios)
+    fila_sup = np.tile([0.0, 0.0, 0.0], anios)
+    col_inf = np.tile(np.concatenate([[C[a] for a in actividades], [0.0, 0.0, 0.0]]), anios)
+    col_sup = np.full(anios * ancho, np.inf)
+    c = np.zeros(anios * ancho)
+    c[num_actividades + 2::ancho] = (1 + descuento) ** -np.arange(anios)
+
+    return FormaMatricial(
+        nombres_variables=[nombre for t in range(anios)
+                           for nombre in [f"x_{a}_{t+1}" for a in actividades] + [f"s_{t+1}", f"k_{t+1}", f"y_{t+1}"]],
+        nombres_restricciones=[f"{fila}_{t+1}" for t in range(anios) for fila in ("Presupuesto", "Impacto", "Reduccion")],
+        c=c,
+        constante=0.0,
+        sentido=MAXIMIZAR,
+        indptr=np.concatenate([[0], np.cumsum(largos)]).astype(np.int64),
+        indices=np.concatenate(indices).astype(np.int64),
+        datos=np.concatenate(datos),
+        fila_inf=fila_inf,
+        fila_sup=fila_sup,
+        col_inf=col_inf,
+        col_sup=col_sup,
+        entera=np.zeros(anios * ancho, dtype=bool),
+    )
+
+
+def construir_forma_residuos_plurianual(municipalidades, actividades, R, F, I, C, anios, crecimiento=0.0,
+                                        arrastre=1.0, persistencia=1.0, descuento=0.0):
+    """
+    Construye el modelo plurianual completo en forma matricial, repitiendo el bloque de una
+    municipalidad en la diagonal.
+
+    Parámetros:
+        - municipalidades, actividades, I, C: Los mismos de optimizar_gestion_residuos.
+        - R (dict): Residuos por municipalidad: el del primer año (crece con "crecimiento")
+          o una lista con el de cada año.
+        - F (dict): Fondos nuevos por municipalidad: los mismos todos los años o una lista por año.
+        - anios (int): Años del horizonte.
+        - crecimiento (float): Tasa anual de crecimiento de los residuos dados como escalar.
+        - arrastre (float): Fracción del ahorro de un año que pasa al siguiente.
+        - persistencia (float): Fracción del impacto acumulado que se mantiene de un año al siguiente.
+        - descuento (float): Tasa anual de descuento de la reducción en el objetivo.
+
+    Retorna:
+        - FormaMatricial: Columnas y filas agrupadas por municipalidad, con el nombre de la
+          municipalidad antes del año (p. ej. "x_Reciclaje_M1_3", "Presupuesto_M1_3").
+    """
+    bloque = construir_forma_bloque(actividades, I, C, anios, arrastre, persistencia, descuento)
+    num_municipalidades = len(municipalidades)
+    n, m = bloque.num_variables, bloque.num_restricciones
+    F_anual = _por_anio(F, municipalidades, anios)
+    R_anual = _por_anio(R, municipalidades, anios, crecimiento)
+
+    desplazamiento = np.repeat(np.arange(num_municipalidades) * n, bloque.no_ceros)
+    fila_inf = np.tile(bloque.fila_inf, num_municipalidades)
+    fila_sup = np.tile(bloque.fila_sup, num_municipalidades)
+    fila_inf[::3] = fila_sup[::3] = F_anual.ravel()
+    col_sup = np.tile(bloque.col_sup, num_municipalidades)
+    col_sup[len(actividades) + 2::len(actividades) + 3] = R_anual.ravel()
+
+    def con_municipalidad(nombre, municipalidad):
+        prefijo, anio = nombre.rsplit("_", 1)
+        return f"{prefijo}_{municipalidad}_{anio}"
+
+    return FormaMatricial(
+        nombres_variables=[con_municipalidad(nombre, mu) for mu in municipalidades for nombre in bloque.nombres_variables],
+        nombres_restricciones=[con_municipalidad(nombre, mu)
+                               for mu in municipalidades for nombre in bloque.nombres_restricciones],
+        c=np.tile(bloque.c, num_municipalidades),
+        constante=0.0,
+        sentido=MAXIMIZAR,
+        indptr=np.concatenate([[0], np.tile(bloque.indptr[1:], num_municipalidades)
+                               + np.repeat(np.arange(num_municipalidades) * bloque.no_ceros, m)]).astype(np.int64),
+        indices=np.tile(bloque.indices, num_municipalidades) + desplazamiento,
+        datos=np.tile(bloque.datos, num_municipalidades),
+        fila_inf=fila_inf,
+        fila_sup=fila_sup,
+        col_inf=np.tile(bloque.col_inf, num_municipalidades),
+        col_sup=col_sup,
+        entera=np.zeros(n * num_municipalidades, dtype=bool),
+    )
+
+
+def optimizar_residuos_plurianual(municipalidades, actividades, R, F, I, C, anios, crecimiento=0.0, arrastre=1.0,
+                                  persistencia=1.0, descuento=0.0, descomponer=True, opciones=None):
+    """
+    Optimiza la asignación de fondos de varios años con ahorro, impacto acumulado y residuos
+    que evolucionan (ver construir_forma_residuos_plurianual para los parámetros).
+
+    Parámetros:
+        - descomponer (bool): Resolver municipalidad por municipalidad sobre un único bloque
+          cargado en HiGHS (True) o el modelo completo de una vez (False).
+        - opciones (OpcionesResolucion): Tiempo límite e hilos de HiGHS (el backend se ignora).
+
+    Retorna:
+        - results: Diccionario por municipalidad con listas anuales "reduccion_residuos",
+          "ahorro" y "fondos_asignados" (actividad -> lista anual); None en las
+          municipalidades infactibles (fondos insuficientes para los mínimos).
+        - objetivo: Reducción total (descontada) de residuos, o None si alguna municipalidad
+          es infactible.
+        - elapsed_time: Tiempo de armado y resolución.
+    """
+    import highspy
+
+    from .resolucion import OpcionesResolucion
+
+    inicio = time.perf_counter()
+    opciones = opciones or OpcionesResolucion()
+    num_actividades = len(actividades)
+    ancho = num_actividades + 3
+
+    if descomponer:
+        bloque = construir_forma_bloque(actividades, I, C, anios, arrastre, persistencia, descuento)
+        h = opciones.aplicar_highs(bloque.a_highs())
+        filas_presupuesto = np.arange(0, 3 * anios, 3, dtype=np.int32)
+        columnas_y = np.arange(num_actividades + 2, anios * ancho, ancho, dtype=np.int32)
+        F_anual = _por_anio(F, municipalidades, anios)
+        R_anual = _por_anio(R, municipalidades, anios, crecimiento)
+        soluciones = []
+        for k in range(len(municipalidades)):
+            h.changeRowsBounds(anios, filas_presupuesto, F_anual[k], F_anual[k])
+            h.changeColsBounds(anios, columnas_y, np.zeros(anios), R_anual[k])
+            h.run()
+            optimo = h.getModelStatus() == highspy.HighsModelStatus.kOptimal
+            soluciones.append(np.asarray(h.getSolution().col_value) if optimo else None)
+    else:
+        forma = construir_forma_residuos_plurianual(municipalidades, actividades, R, F, I, C, anios, crecimiento,
+                                                    arrastre, persistencia, descuento)
+        h = opciones.aplicar_highs(forma.a_highs())
+        h.run()
+        if h.getModelStatus() == highspy.HighsModelStatus.kOptimal:
+            valores = np.asarray(h.getSolution().col_value)
+            soluciones = list(valores.reshape(len(municipalidades), -1))
+        else:
+            # Sin descomponer no se sabe qué municipalidad es infactible
+            soluciones = [None] * len(municipalidades)
+
+    c = np.zeros(anios * ancho)
+    c[num_actividades + 2::ancho] = (1 + descuento) ** -np.arange(anios)
+    results = {}
+    for m, valores in zip(municipalidades, soluciones):
+        if valores is None:
+            results[m] = None
+            continue
+        por_anio = valores.reshape(anios, ancho)
+        results[m] = {
+            "reduccion_residuos": por_anio[:, num_actividades + 2].tolist(),
+            "ahorro": por_anio[:, num_actividades].tolist(),
+            "fondos_asignados": {a: por_anio[:, j].tolist() for j, a in enumerate(actividades)},
+        }
+    objetivo = (None if any(valores is None for valores in soluciones)
+                else float(sum(c @ valores for valores in soluciones)))
+    return results, objetivo, time.perf_counter() - inicio
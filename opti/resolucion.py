@@ -0,0 +1,170 @@
+"""
+Opciones de resolución (tiempo límite, gap, hilos) y resolución progresiva con incumbentes.
+
+OpcionesResolucion.crear_solver() produce el solver de PuLP configurado para pasarlo como
+solver= a cualquier modelo del paquete. resolver_progresivo() y resolver_con_progreso()
+usan los callbacks de HiGHS para entregar cada solución entera que mejora, junto con la
+cota dual, mientras avanza la búsqueda; quien tenga un plazo puede cortar la búsqueda y
+quedarse con la mejor solución encontrada hasta ese momento.
+"""
+import queue
+import threading
+from dataclasses import dataclass, field, replace
+
+
+@dataclass
+class OpcionesResolucion:
+    """
+    Parámetros de parada y paralelismo del solver.
+
+    Atributos:
+        - limite_tiempo (float): Segundos máximos de resolución (None sin límite).
+        - gap_relativo (float): Gap relativo con el que el solver se detiene (p. ej. 0.01).
+        - gap_absoluto (float): Gap absoluto con el que el solver se detiene.
+        - hilos (int): Hilos que puede usar el solver.
+        - mensajes (bool): Mostrar la salida del solver.
+        - backend (str): "cbc" o "highs".
+    """
+    limite_tiempo: float = None
+    gap_relativo: float = None
+    gap_absoluto: float = None
+    hilos: int = None
+    mensajes: bool = False
+    backend: str = "cbc"
+
+    def crear_solver(self, **parametros):
+        """
+        Retorna el solver de PuLP configurado con estas opciones.
+        """
+        import pulp
+
+        if self.backend == "highs":
+            return pulp.HiGHS(msg=self.mensajes, timeLimit=self.limite_tiempo, gapRel=self.gap_relativo,
+                              gapAbs=self.gap_absoluto, threads=self.hilos, **parametros)
+        if self.backend == "cbc":
+            return pulp.PULP_CBC_CMD(msg=self.mensajes, timeLimit=self.limite_tiempo, gapRel=self.gap_relativo,
+                                     gapAbs=self.gap_absoluto, threads=self.hilos, **parametros)
+        raise ValueError(f"Backend desconocido: {self.backend!r}")
+
+    def aplicar_highs(self, h):
+        """
+        Aplica estas opciones a un highspy.Highs creado directamente (sin PuLP).
+        """
+        h.setOptionValue("output_flag", self.mensajes)
+        if self.limite_tiempo is not None:
+            h.setOptionValue("time_limit", float(self.limite_tiempo))
+        if self.gap_relativo is not None:
+            h.setOptionValue("mip_rel_gap", float(self.gap_relativo))
+        if self.gap_absoluto is not None:
+            h.setOptionValue("mip_abs_gap", float(self.gap_absoluto))
+        if self.hilos is not None:
+            h.setOptionValue("threads", int(self.hilos))
+        return h
+
+
+@dataclass
+class Incumbente:
+    """
+    Evento de progreso de una resolución.
+
+    Atributos:
+        - objetivo (float): Valor de la función objetivo de la solución (en el sentido del modelo).
+        - cota (float): Mejor cota conocida del óptimo (None si aún no hay).
+        - gap (float): Gap relativo entre objetivo y cota informado por el solver.
+        - segundos (float): Tiempo transcurrido desde el inicio de la resolución.
+        - valores (dict): Nombre de variable -> valor de la solución.
+        - final (bool): True en el último evento, cuando la resolución terminó.
+        - estado (int): Estado de PuLP del problema (solo en el evento final).
+    """
+    objetivo: float
+    cota: float = None
+    gap: float = None
+    segundos: float = 0.0
+    valores: dict = field(default_factory=dict)
+    final: bool = False
+    estado: int = None
+
+
+def resolver_con_progreso(problema, opciones=None, callback=None, detener=None):
+    """
+    Resuelve un LpProblem con HiGHS informando cada solución entera que mejora.
+
+    Parámetros:
+        - problema (LpProblem): Problema a resolver; al terminar queda con la mejor solución.
+        - opciones (OpcionesResolucion): Tiempo límite, gaps e hilos (el backend se ignora).
+        - callback (callable): Se llama con un Incumbente por cada mejora. Si retorna True,
+          la búsqueda se interrumpe y el problema queda con la mejor solución encontrada.
+        - detener (threading.Event): Si se activa desde otro hilo, la búsqueda se interrumpe.
+
+    Retorna:
+        - int: El estado de PuLP (problema.status).
+    """
+    import highspy
+    import pulp
+
+    opciones = opciones or OpcionesResolucion()
+    tipos = highspy.cb.HighsCallbackType
+    signo = -1 if problema.sense == pulp.LpMaximize else 1
+    constante = problema.objective.constant if problema.objective is not None else 0
+    nombres = [v.name for v in problema.variables()]
+    interrumpir = detener if detener is not None else threading.Event()
+
+    def al_llamar(tipo, mensaje, salida, entrada, datos_usuario):
+        if tipo == tipos.kCallbackMipInterrupt:
+            if interrumpir.is_set():
+                entrada.user_interrupt = True
+        elif tipo == tipos.kCallbackMipImprovingSolution and callback is not None:
+            cota = salida.mip_dual_bound
+            incumbente = Incumbente(
+                objetivo=signo * salida.objective_function_value + constante,
+                cota=signo * cota + constante if abs(cota) != highspy.kHighsInf else None,
+                gap=salida.mip_gap,
+                segundos=salida.running_time,
+                valores=dict(zip(nombres, salida.mip_solution)),
+            )
+            if callback(incumbente):
+                interrumpir.set()
+
+    solver = replace(opciones, backend="highs").crear_solver()
+    solver.callbackTuple = (al_llamar, None)
+    solver.callbacksToActivate = [tipos.kCallbackMipImprovingSolution, tipos.kCallbackMipInterrupt]
+    return problema.solve(solver)
+
+
+def resolver_progresivo(problema, opciones=None):
+    """
+    Generador que resuelve el problema en segundo plano y entrega cada Incumbente.
+
+    El último evento tiene final=True, el estado de PuLP y los valores finales. Si quien
+    consume el generador lo abandona antes (p. ej. con break al llegar a un plazo), la
+    búsqueda se interrumpe y el problema queda con la mejor solución encontrada.
+    """
+    eventos = queue.Queue()
+    detener = threading.Event()
+    error = []
+
+    def ejecutar():
+        try:
+            resolver_con_progreso(problema, opciones, eventos.put, detener)
+        except BaseException as excepcion:
+            error.append(excepcion)
+        finally:
+            eventos.put(None)
+
+    hilo = threading.Thread(target=ejecutar, name="opti-progresivo", daemon=True)
+    hilo.start()
+    try:
+        while (incumbente := eventos.get()) is not None:
+            yield incumbente
+        if error:
+            raise error[0]
+        yield Incumbente(
+            objetivo=problema.objective.value() if problema.objective is not None else None,
+            segundos=problema.solutionTime,
+            valores={v.name: v.varValue for v in problema.variables()},
+            final=True,
+            estado=problema.status,
+        )
+    finally:
+        detener.set()
+        hilo.join()
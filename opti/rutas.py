@@ -0,0 +1,407 @@
+"""
+Rutas de recolección de residuos con capacidad por vehículo.
+
+optimizar_gestion_residuos decide cuánto invierte cada municipalidad en reducir residuos,
+pero no cómo se recolectan. Aquí, dados los puntos de recolección de una municipalidad (con
+su demanda) y un depósito, se arman rutas que parten y terminan en el depósito sin superar
+la capacidad de cada vehículo:
+
+1. Construcción por ahorros de Clarke y Wright: se unen rutas por los extremos en orden de
+   ahorro d(0, i) + d(0, j) - d(i, j) decreciente. Solo se consideran los pares (i, j) en
+   que j es uno de los k vecinos más cercanos de i, así que no se arma la matriz completa
+   de n x n distancias ni se ordenan n^2 / 2 ahorros.
+2. Búsqueda local: 2-opt dentro de cada ruta, limitado a las inversiones que unen un punto
+   con uno de sus vecinos cercanos, y reubicación de puntos junto a uno de sus vecinos
+   cercanos, en la misma u otra ruta. En ambos casos los movimientos de los puntos activos
+   se evalúan a la vez, se aplican los que siguen mejorando y en la ronda siguiente solo se
+   evalúan los puntos afectados por los cambios. Ninguno arma matrices por ruta, así que el
+   costo no depende del largo de las rutas más que por las inversiones (O(largo) cada una):
+   una sola ruta de miles de puntos (capacidad sin límite) es tan viable como muchas cortas.
+
+optimizar_residuos_con_rutas descuenta el costo anual de recolección de los fondos de cada
+municipalidad antes de resolver la asignación de fondos.
+"""
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+
+def matriz_distancias(origenes, destinos=None):
+    """
+    Distancias euclidianas entre dos conjuntos de puntos (array n x d y m x d), en una sola
+    operación vectorizada.
+
+    Retorna:
+        - array n x m (n x n si no se dan destinos).
+    """
+    A = np.asarray(origenes, dtype=float)
+    B = A if destinos is None else np.asarray(destinos, dtype=float)
+    cuadrados = (A * A).sum(axis=1)[:, None] + (B * B).sum(axis=1)[None, :] - 2 * A @ B.T
+    return np.sqrt(np.maximum(cuadrados, 0.0))
+
+
+def vecinos_cercanos(puntos, k, bloque=2048):
+    """
+    Los k vecinos más cercanos de cada punto (sin incluirlo), calculados por bloques de filas
+    para no guardar la matriz completa de distancias.
+
+    Retorna:
+        - tuple: (indices, distancias), arrays n x k ordenados de más cercano a más lejano.
+    """
+    X = np.asarray(puntos, dtype=float)
+    n = len(X)
+    k = min(k, n - 1)
+    indices = np.empty((n, k), dtype=np.int64)
+    distancias = np.empty((n, k))
+    for inicio in range(0, n, bloque):
+        filas = np.arange(inicio, min(inicio + bloque, n))
+        D = matriz_distancias(X[filas], X)
+        D[np.arange(len(filas)), filas] = np.inf
+        candidatos = np.argpartition(D, k - 1, axis=1)[:, :k] if k > 0 else np.empty((len(filas), 0), dtype=np.int64)
+        d = np.take_along_axis(D, candidatos, axis=1)
+        orden = np.argsort(d, axis=1)
+        indices[filas] = np.take_along_axis(candidatos, orden, axis=1)
+        distancias[filas] = np.take_along_axis(d, orden, axis=1)
+    return indices, distancias
+
+
+def _distancia(coordenadas, a, b):
+    diferencia = coordenadas[a] - coordenadas[b]
+    return np.hypot(diferencia[..., 0], diferencia[..., 1])
+
+
+def ahorros_clarke_wright(puntos, deposito, demandas, capacidad, vecinos):
+    """
+    Construye rutas con el algoritmo de ahorros de Clarke y Wright (versión paralela).
+
+    Parámetros:
+        - puntos (array n x 2), deposito (array 2): Coordenadas.
+        - demandas (array n): Carga de cada punto.
+        - capacidad (float): Capacidad de cada vehículo.
+        - vecinos (array n x k): Vecinos cercanos de cada punto (ver vecinos_cercanos).
+
+    Retorna:
+        - list: Rutas (listas de índices de puntos, sin el depósito).
+    """
+    X = np.asarray(puntos, dtype=float)
+    n = len(X)
+    d0 = np.sqrt(((X - np.asarray(deposito, dtype=float)) ** 2).sum(axis=1))
+    i = np.repeat(np.arange(n), vecinos.shape[1])
+    j = vecinos.ravel()
+    # Cada par una sola vez, aunque aparezca como vecino en ambos sentidos
+    codigos = np.unique(np.minimum(i, j) * n + np.maximum(i, j))
+    extremo_a, extremo_b = codigos // n, codigos % n
+    ahorro = d0[extremo_a] + d0[extremo_b] - _distancia(X, extremo_a, extremo_b)
+    orden = np.argsort(-ahorro, kind="stable")
+    orden = orden[ahorro[orden] > 0]
+
+    rutas = {r: deque([r]) for r in range(n)}
+    ruta_de = list(range(n))
+    carga = np.asarray(demandas, dtype=float).tolist()
+    for a, b in zip(extremo_a[orden].tolist(), extremo_b[orden].tolist()):
+        ra, rb = ruta_de[a], ruta_de[b]
+        if ra == rb or carga[ra] + carga[rb] > capacidad:
+            continue
+        la, lb = rutas[ra], rutas[rb]
+        # Orientar las rutas para que a y b queden contiguos, invirtiendo la más corta si hace falta
+        if la[-1] == a and lb[0] == b:
+            izquierda, derecha = ra, rb
+        elif la[0] == a and lb[-1] == b:
+            izquierda, derecha = rb, ra
+        elif la[0] == a and lb[0] == b:
+            if len(la) <= len(lb):
+                la.reverse()
+                izquierda, derecha = ra, rb
+            else:
+                lb.reverse()
+                izquierda, derecha = rb, ra
+        elif la[-1] == a and lb[-1] == b:
+            if len(lb) <= len(la):
+                lb.reverse()
+                izquierda, derecha = ra, rb
+            else:
+                la.reverse()
+                izquierda, derecha = rb, ra
+        else:
+            continue  # a o b es interior a su ruta
+        # Se conserva la ruta más larga y se reetiquetan los puntos de la otra
+        li, ld = rutas[izquierda], rutas[derecha]
+        if len(li) >= len(ld):
+            li.extend(ld)
+            queda, sale = izquierda, derecha
+        else:
+            ld.extendleft(reversed(li))
+            queda, sale = derecha, izquierda
+        for punto in rutas.pop(sale):
+            ruta_de[punto] = queda
+        carga[queda] += carga[sale]
+    return [list(ruta) for ruta in rutas.values()]
+
+
+def _dos_opt(coordenadas, ruta, deposito, vecinos, tolerancia):
+    # 2-opt con listas de vecinos: solo se evalúan las inversiones que crean una arista entre
+    # un punto y uno de sus vecinos cercanos de la misma ruta, en rondas vectorizadas sobre
+    # los puntos activos (los extremos de las aristas que cambiaron en la ronda anterior).
+    # Cada inversión cuesta O(largo del tramo) y una ronda O(activos * k), en vez de O(L^2)
+    # por movimiento como con la matriz completa; deposito es el índice del depósito.
+    largo = len(ruta)
+    if largo < 3:
+        return list(ruta), False
+    secuencia = np.concatenate([[deposito], ruta, [deposito]]).astype(np.int64)
+    posicion = np.full(len(coordenadas), -1, dtype=np.int64)
+    posicion[secuencia[1:-1]] = np.arange(1, largo + 1)
+    puntos_xy = coordenadas.tolist()
+
+    def cambio(a, b):
+        # Invertir las posiciones a+1..b cambia las aristas (a, a+1) y (b, b+1) por (a, b) y (a+1, b+1)
+        sa, sa1, sb, sb1 = (puntos_xy[secuencia[k]] for k in (a, a + 1, b, b + 1))
+        return math.dist(sa, sb) + math.dist(sa1, sb1) - math.dist(sa, sa1) - math.dist(sb, sb1)
+
+    activos = secuencia[1:-1]
+    mejorada = False
+    while len(activos):
+        j = vecinos[activos]
+        p, q = posicion[activos][:, None], posicion[j]
+        # Dos variantes por par (i, j): unir i con j y sus sucesores, o i con j y sus predecesores
+        opciones = []
+        for corrimiento in (0, 1):
+            a = np.minimum(p, q) - corrimiento
+            b = np.maximum(p, q) - corrimiento
+            a, b = np.maximum(a, 0), np.maximum(b, 0)
+            delta = (_distancia(coordenadas, secuencia[a], secuencia[b])
+                     + _distancia(coordenadas, secuencia[a + 1], secuencia[b + 1])
+                     - _distancia(coordenadas, secuencia[a], secuencia[a + 1])
+                     - _distancia(coordenadas, secuencia[b], secuencia[b + 1]))
+            delta[(q < 0) | (b - a < 2)] = np.inf
+            opciones.append(delta)
+        delta = np.stack(opciones, axis=2).reshape(len(activos), -1)
+        mejor = np.argmin(delta, axis=1)
+        valor = delta[np.arange(len(activos)), mejor]
+        candidatos = np.flatnonzero(valor < -tolerancia)
+        candidatos = candidatos[np.argsort(valor[candidatos], kind="stable")]
+
+        siguientes = []
+        for k in candidatos.tolist():
+            i = activos[k]
+            vecino, corrimiento = divmod(int(mejor[k]), 2)
+            pi, pj = posicion[i], posicion[j[k, vecino]]
+            a, b = min(pi, pj) - corrimiento, max(pi, pj) - corrimiento
+            # Las inversiones anteriores de la ronda pudieron cambiar las aristas: se recalcula
+            if b - a < 2 or cambio(a, b) >= -tolerancia:
+                siguientes.append(i)
+                continue
+            siguientes.extend(secuencia[[a, a + 1, b, b + 1]].tolist())
+            tramo = secuencia[a + 1:b + 1][::-1].copy()
+            secuencia[a + 1:b + 1] = tramo
+            posicion[tramo] = np.arange(a + 1, b + 1)
+            mejorada = True
+        activos = np.unique(np.asarray(siguientes, dtype=np.int64))
+        activos = activos[activos != deposito]
+    return secuencia[1:-1].tolist(), mejorada
+
+
+def _reubicar(coordenadas, demandas, capacidad, rutas, vecinos, tolerancia, max_rondas):
+    # Reubica puntos junto a sus vecinos cercanos; las rutas se guardan como listas enlazadas
+    # (pred, succ) con el depósito como índice n. Retorna las rutas y las que cambiaron.
+    n = len(demandas)
+    deposito = n
+    pred = np.empty(n, dtype=np.int64)
+    succ = np.empty(n, dtype=np.int64)
+    ruta_de = np.empty(n, dtype=np.int64)
+    primero = np.empty(len(rutas), dtype=np.int64)
+    carga = np.empty(len(rutas))
+    for r, ruta in enumerate(rutas):
+        ruta = np.asarray(ruta, dtype=np.int64)
+        pred[ruta] = np.concatenate([[deposito], ruta[:-1]])
+        succ[ruta] = np.concatenate([ruta[1:], [deposito]])
+        ruta_de[ruta] = r
+        primero[r] = ruta[0]
+        carga[r] = demandas[ruta].sum()
+    cambiadas = np.zeros(len(rutas), dtype=bool)
+
+    # Solo se evalúan los puntos cuyo mejor movimiento pudo cambiar: los que cambiaron de
+    # vecino en la ruta, los que tienen un vecino cercano que cambió y los que tienen un
+    # vecino cercano en una ruta cuya carga cambió
+    activos = np.arange(n)
+    for _ in range(max_rondas):
+        p, s = pred[activos], succ[activos]
+        cercanos = vecinos[activos]
+        ganancia = (_distancia(coordenadas, p, activos) + _distancia(coordenadas, activos, s)
+                    - _distancia(coordenadas, p, s))
+        mejores = []
+        fila = np.arange(len(activos))
+        for a, b in ((cercanos, succ[cercanos]), (pred[cercanos], cercanos)):  # después o antes del vecino
+            i = activos[:, None]
+            delta = (_distancia(coordenadas, a, i) + _distancia(coordenadas, i, b) - _distancia(coordenadas, a, b)
+                     - ganancia[:, None])
+            destino = ruta_de[cercanos]
+            invalido = (a == i) | (b == i) | ((destino != ruta_de[i])
+                                              & (carga[destino] + demandas[i] > capacidad))
+            delta[invalido] = np.inf
+            k = np.argmin(delta, axis=1)
+            mejores.append((delta[fila, k], a[fila, k], b[fila, k], destino[fila, k]))
+        usar_antes = mejores[1][0] < mejores[0][0]
+        delta, a, b, destino = (np.where(usar_antes, antes, despues) for despues, antes in zip(*mejores))
+
+        candidatos = np.flatnonzero(delta < -tolerancia)
+        if len(candidatos) == 0:
+            break
+        candidatos = candidatos[np.argsort(delta[candidatos], kind="stable")]
+        tocado = np.zeros(n + 1, dtype=bool)
+        carga_cambiada = np.zeros(len(rutas), dtype=bool)
+        aplicados = 0
+        bloqueados = []
+        for k in candidatos.tolist():
+            i = activos[k]
+            involucrados = [i, pred[i], succ[i], a[k], b[k]]
+            if tocado[involucrados].any():
+                bloqueados.append(i)
+                continue
+            origen, r = ruta_de[i], destino[k]
+            if r != origen and carga[r] + demandas[i] > capacidad:
+                bloqueados.append(i)
+                continue
+            # Sacar i de su ruta
+            anterior, siguiente = pred[i], succ[i]
+            if anterior == deposito:
+                primero[origen] = siguiente
+            else:
+                succ[anterior] = siguiente
+            if siguiente != deposito:
+                pred[siguiente] = anterior
+            # Insertarlo entre a y b
+            if a[k] == deposito:
+                primero[r] = i
+            else:
+                succ[a[k]] = i
+            if b[k] != deposito:
+                pred[b[k]] = i
+            pred[i], succ[i], ruta_de[i] = a[k], b[k], r
+            carga[origen] -= demandas[i]
+            carga[r] += demandas[i]
+            cambiadas[[origen, r]] = True
+            if r != origen:
+                carga_cambiada[[origen, r]] = True
+            tocado[involucrados] = True
+            tocado[deposito] = False
+            aplicados += 1
+        if not aplicados:
+            break
+        # Los puntos cuyo movimiento quedó bloqueado por otro de la misma ronda siguen activos
+        tocado[bloqueados] = True
+        tocado[deposito] = False
+        activos = np.flatnonzero(tocado[:n] | tocado[vecinos].any(axis=1) | carga_cambiada[ruta_de[vecinos]].any(axis=1))
+
+    nuevas = []
+    for r in range(len(rutas)):
+        ruta, punto = [], primero[r]
+        while punto != deposito:
+            ruta.append(int(punto))
+            punto = succ[punto]
+        nuevas.append(ruta)
+    return nuevas, cambiadas
+
+
+def planificar_rutas(puntos, deposito, demandas=None, capacidad=np.inf, vecinos=20, mejorar=True, max_rondas=50,
+                     tolerancia=1e-9):
+    """
+    Arma rutas de recolección con capacidad para los puntos de una municipalidad.
+
+    Parámetros:
+        - puntos (array n x 2): Coordenadas de los puntos de recolección.
+        - deposito (array 2): Coordenadas del depósito, donde empieza y termina cada ruta.
+        - demandas (array n): Carga de cada punto (1 por defecto).
+        - capacidad (float): Carga máxima por vehículo (sin límite por defecto).
+        - vecinos (int): Vecinos cercanos considerados en los ahorros y reubicaciones.
+        - mejorar (bool): Aplicar la búsqueda local (2-opt y reubicación). Con 2000 puntos en
+          una sola ruta toma unos 0.5 s, y con 5000 puntos en rutas de 200 o 1000 unos 2 s
+          (en un núcleo, incluida la construcción).
+        - max_rondas (int): Rondas máximas de reubicación por pasada de búsqueda local.
+        - tolerancia (float): Mejora mínima para aceptar un movimiento.
+
+    Retorna:
+        - dict: Claves "rutas" (lista de arrays de índices de puntos, en orden de visita),
+          "distancias" y "cargas" (arrays, una por ruta), "distancia_total" y "tiempo".
+
+    Lanza:
+        - ValueError: Si un punto tiene más demanda que la capacidad de un vehículo.
+    """
+    inicio = time.perf_counter()
+    X = np.asarray(puntos, dtype=float).reshape(-1, 2)
+    n = len(X)
+    q = np.ones(n) if demandas is None else np.asarray(demandas, dtype=float)
+    if np.any(q > capacidad):
+        raise ValueError(f"La demanda de los puntos {np.flatnonzero(q > capacidad).tolist()} supera la capacidad")
+    if n == 0:
+        return {"rutas": [], "distancias": np.empty(0), "cargas": np.empty(0), "distancia_total": 0.0,
+                "tiempo": time.perf_counter() - inicio}
+
+    # El depósito va al final de las coordenadas, con índice n
+    coordenadas = np.vstack([X, np.asarray(deposito, dtype=float).reshape(1, 2)])
+    cercanos = vecinos_cercanos(X, vecinos)[0]
+    rutas = ahorros_clarke_wright(X, coordenadas[n], q, capacidad, cercanos)
+
+    if mejorar and cercanos.shape[1] > 0:
+        rutas = [_dos_opt(coordenadas, ruta, n, cercanos, tolerancia)[0] for ruta in rutas]
+        while True:
+            rutas = [ruta for ruta in rutas if ruta]
+            rutas, cambiadas = _reubicar(coordenadas, q, capacidad, rutas, cercanos, tolerancia, max_rondas)
+            if not cambiadas.any():
+                break
+            hubo_mejora = False
+            for r in np.flatnonzero(cambiadas):
+                rutas[r], mejorada = _dos_opt(coordenadas, rutas[r], n, cercanos, tolerancia)
+                hubo_mejora |= mejorada
+            if not hubo_mejora:
+                break
+        rutas = [ruta for ruta in rutas if ruta]
+
+    rutas = [np.asarray(ruta, dtype=np.int64) for ruta in rutas]
+    distancias = np.array([_distancia(coordenadas, np.concatenate([[n], ruta]), np.concatenate([ruta, [n]])).sum()
+                           for ruta in rutas])
+    return {
+        "rutas": rutas,
+        "distancias": distancias,
+        "cargas": np.array([q[ruta].sum() for ruta in rutas]),
+        "distancia_total": float(distancias.sum()),
+        "tiempo": time.perf_counter() - inicio,
+    }
+
+
+def optimizar_residuos_con_rutas(municipalidades, actividades, R, F, I, C, puntos, depositos, capacidad_vehiculo,
+                                 costo_distancia, costo_vehiculo=0.0, demandas=None, solver=None, **parametros_rutas):
+    """
+    Planifica las rutas de recolección de cada municipalidad y asigna los fondos que quedan
+    después de pagar la recolección (optimizar_gestion_residuos con F[m] - costo[m]).
+
+    Parámetros:
+        - municipalidades, actividades, R, F, I, C, solver: Los mismos de optimizar_gestion_residuos.
+        - puntos (dict): Municipalidad -> array n x 2 con los puntos de recolección.
+        - depositos (dict): Municipalidad -> coordenadas del depósito.
+        - capacidad_vehiculo (float): Carga máxima por vehículo.
+        - costo_distancia (float): Costo anual por unidad de distancia de las rutas.
+        - costo_vehiculo (float): Costo anual por vehículo (una ruta por vehículo).
+        - demandas (dict): Municipalidad -> demanda de cada punto (1 por defecto).
+        - parametros_rutas: Parámetros adicionales de planificar_rutas.
+
+    Retorna:
+        - tuple: (results, objetivo, elapsed_time, rutas), los tres primeros como
+          optimizar_gestion_residuos (con los fondos ya descontados) y rutas un diccionario
+          municipalidad -> resultado de planificar_rutas con la clave adicional "costo".
+    """
+    from .residuos import optimizar_gestion_residuos
+
+    rutas = {}
+    fondos = {}
+    for m in municipalidades:
+        plan = planificar_rutas(puntos[m], depositos[m], None if demandas is None else demandas[m],
+                                capacidad_vehiculo, **parametros_rutas)
+        plan["costo"] = costo_distancia * plan["distancia_total"] + costo_vehiculo * len(plan["rutas"])
+        rutas[m] = plan
+        fondos[m] = F[m] - plan["costo"]
+
+    results, objetivo, elapsed_time = optimizar_gestion_residuos(municipalidades, actividades, R, fondos, I, C,
+                                                                 solver)
+    return results, objetivo, elapsed_time, rutas
@@ -0,0 +1,185 @@
+"""
+Análisis de sensibilidad de los modelos lineales a partir de la base óptima.
+
+Una sola resolución con HiGHS entrega, para todas las filas y columnas a la vez, los
+precios sombra (cuánto cambia el objetivo por unidad adicional de lado derecho), los
+costos reducidos y los rangos de lado derecho y de costos dentro de los cuales la base
+sigue siendo óptima. Reemplaza resolver copias perturbadas del modelo una por una.
+
+En los modelos enteros (hospital) el análisis corresponde a la relajación lineal. Todos
+los valores se expresan en el sentido original del modelo: en un modelo de maximización,
+un precio sombra positivo significa que aumentar el lado derecho aumenta el objetivo.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class InformeSensibilidad:
+    """
+    Sensibilidad de todas las filas y columnas de un modelo lineal.
+
+    Atributos:
+        - nombres_restricciones (list), nombres_variables (list): Nombres de filas y columnas.
+        - funcion_objetivo (float): Valor óptimo (de la relajación, si el modelo es entero).
+        - valores (array n): Solución óptima.
+        - actividad (array m): Valor de A x en cada fila.
+        - precios_sombra (array m): Variación del objetivo por unidad de lado derecho.
+        - costos_reducidos (array n): Variación del objetivo por unidad de cada variable
+          (la de una variable en su cota es el precio sombra de esa cota).
+        - rango_lado_derecho (array m x 2): Valores del lado derecho activo entre los que el
+          precio sombra se mantiene.
+        - rango_costos (array n x 2): Valores del costo de cada variable entre los que la
+          solución sigue siendo óptima.
+    """
+    nombres_restricciones: list
+    nombres_variables: list
+    funcion_objetivo: float
+    valores: np.ndarray
+    actividad: np.ndarray
+    precios_sombra: np.ndarray
+    costos_reducidos: np.ndarray
+    rango_lado_derecho: np.ndarray
+    rango_costos: np.ndarray
+
+    def restriccion(self, nombre):
+        """
+        Retorna un diccionario con la sensibilidad de la fila indicada.
+        """
+        k = self.nombres_restricciones.index(nombre)
+        return {"actividad": float(self.actividad[k]), "precio_sombra": float(self.precios_sombra[k]),
+                "rango_lado_derecho": tuple(self.rango_lado_derecho[k].tolist())}
+
+    def variable(self, nombre):
+        """
+        Retorna un diccionario con la sensibilidad de la columna indicada.
+        """
+        k = self.nombres_variables.index(nombre)
+        return {"valor": float(self.valores[k]), "costo_reducido": float(self.costos_reducidos[k]),
+                "rango_costo": tuple(self.rango_costos[k].tolist())}
+
+
+def analizar_sensibilidad(problema, opciones=None):
+    """
+    Resuelve la relajación lineal de un modelo y calcula su sensibilidad completa.
+
+    Parámetros:
+        - problema (LpProblem o FormaMatricial): Modelo a analizar.
+        - opciones (OpcionesResolucion): Tiempo límite e hilos de HiGHS.
+
+    Retorna:
+        - InformeSensibilidad
+
+    Lanza:
+        - RuntimeError: Si la relajación no tiene óptimo o HiGHS no puede calcular los rangos.
+    """
+    import highspy
+
+    from .matricial import FormaMatricial, desde_problema
+    from .resolucion import OpcionesResolucion
+
+    forma = problema if isinstance(problema, FormaMatricial) else desde_problema(problema)
+    h = (opciones or OpcionesResolucion()).aplicar_highs(forma.a_highs(relajar_enteras=True))
+    h.run()
+    estado = h.getModelStatus()
+    if estado != highspy.HighsModelStatus.kOptimal:
+        raise RuntimeError(f"La relajación lineal terminó con estado {h.modelStatusToString(estado)}")
+    solucion = h.getSolution()
+    estado_rangos, rangos = h.getRanging()
+    if estado_rangos != highspy.HighsStatus.kOk or not rangos.valid:
+        raise RuntimeError("HiGHS no pudo calcular los rangos de sensibilidad")
+
+    # HiGHS resuelve min sentido * c'x: se vuelve al sentido original multiplicando por sentido
+    signo = forma.sentido
+    inf = highspy.kHighsInf
+
+    def valores(registro):
+        arreglo = np.asarray(registro.value_, dtype=float)
+        return np.where(np.abs(arreglo) >= inf, np.copysign(np.inf, arreglo), arreglo)
+
+    # Los rangos de costos vienen con una entrada por columna y luego una por fila (holguras)
+    n = forma.num_variables
+    costo_abajo, costo_arriba = signo * valores(rangos.col_cost_dn)[:n], signo * valores(rangos.col_cost_up)[:n]
+    x = np.asarray(solucion.col_value)
+    return InformeSensibilidad(
+        nombres_restricciones=list(forma.nombres_restricciones),
+        nombres_variables=list(forma.nombres_variables),
+        funcion_objetivo=forma.valor_objetivo(x),
+        valores=x,
+        actividad=np.asarray(solucion.row_value),
+        precios_sombra=signo * np.asarray(solucion.row_dual),
+        costos_reducidos=signo * np.asarray(solucion.col_dual),
+        rango_lado_derecho=np.column_stack([valores(rangos.row_bound_dn), valores(rangos.row_bound_up)]),
+        rango_costos=np.column_stack([np.minimum(costo_abajo, costo_arriba), np.maximum(costo_abajo, costo_arriba)]),
+    )
+
+
+def sensibilidad_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                          opciones=None):
+    """
+    Sensibilidad de la relajación lineal de la planificación hospitalaria.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+        - opciones (OpcionesResolucion): Tiempo límite e hilos de HiGHS.
+
+    Retorna:
+        - dict: Claves "informe" (InformeSensibilidad completo, con la capacidad como cotas
+          de las variables), "valor_recurso" (array semanas: reducción del objetivo por
+          unidad adicional de recursos_disponibles[j]), "valor_paciente" (array
+          especialidades), "valor_capacidad" (array especialidades x semanas) y
+          "rango_prioridad" (array especialidades x 2: valores de prioridad[i] entre los que
+          el plan de la relajación no cambia, por la regla del 100 % sobre sus semanas).
+    """
+    from .hospital import construir_forma_hospital
+
+    p = np.asarray(prioridad, dtype=float)
+    num_especialidades, num_semanas = len(p), len(recursos_disponibles)
+    informe = analizar_sensibilidad(
+        construir_forma_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles),
+        opciones)
+
+    # El costo de x_i_j es -prioridad[i] en todas las semanas: cambiar la prioridad en d
+    # cambia los J costos en -d a la vez. La base sigue siendo óptima si la suma de las
+    # fracciones usadas de cada rango individual no supera 1 (regla del 100 %)
+    costo = np.repeat(-p, num_semanas)
+    holgura_baja = (costo - informe.rango_costos[:, 0]).reshape(num_especialidades, num_semanas)
+    holgura_alta = (informe.rango_costos[:, 1] - costo).reshape(num_especialidades, num_semanas)
+    with np.errstate(divide="ignore"):
+        # Subir la prioridad baja los costos (usa la holgura baja) y viceversa
+        subida = 1 / (1 / holgura_baja).sum(axis=1)
+        bajada = 1 / (1 / holgura_alta).sum(axis=1)
+
+    return {
+        "informe": informe,
+        "valor_recurso": -informe.precios_sombra[num_especialidades:],
+        "valor_paciente": -informe.precios_sombra[:num_especialidades],
+        "valor_capacidad": -np.minimum(informe.costos_reducidos, 0).reshape(num_especialidades, num_semanas),
+        "rango_prioridad": np.column_stack([p - bajada, p + subida]),
+    }
+
+
+def sensibilidad_residuos(municipalidades, actividades, R, F, I, C, opciones=None):
+    """
+    Sensibilidad del modelo de gestión de residuos (optimizar_gestion_residuos).
+
+    Retorna:
+        - dict: Claves "informe" (InformeSensibilidad), "valor_fondos" (municipalidad ->
+          toneladas adicionales por peso adicional de F[m]), "valor_limite" (municipalidad
+          -> toneladas adicionales por tonelada adicional de R[m]) y "valor_costo_minimo"
+          ((actividad, municipalidad) -> variación por peso adicional de asignación mínima).
+    """
+    from .residuos import construir_problema_residuos
+
+    problema, _, _ = construir_problema_residuos(municipalidades, actividades, R, F, I, C)
+    informe = analizar_sensibilidad(problema, opciones)
+    precio = dict(zip(informe.nombres_restricciones, informe.precios_sombra.tolist()))
+    return {
+        "informe": informe,
+        "valor_fondos": {m: precio[f"Presupuesto_{m}"] for m in municipalidades},
+        "valor_limite": {m: precio[f"Limite_Residuos_Reducidos_{m}"] for m in municipalidades},
+        "valor_costo_minimo": {(a, m): precio[f"Asignacion_Minima_{a}_{m}"]
+                               for a in actividades for m in municipalidades},
+    }
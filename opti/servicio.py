@@ -0,0 +1,295 @@
+"""
+Servicio asíncrono de resolución con concurrencia acotada y cola de solicitudes.
+
+Las resoluciones de PuLP son bloqueantes, así que el servicio las ejecuta en un conjunto
+fijo de trabajadores (hilos por defecto) y expone una API async que no bloquea el bucle
+de eventos. La cola tiene tamaño máximo: cuando se llena, las solicitudes nuevas se
+rechazan con ServicioSaturado en lugar de acumularse. Las solicitudes idénticas que están
+en curso se combinan y comparten un único resultado.
+
+Servidor local de líneas JSON:
+    python -m opti.servicio --puerto 8765 --trabajadores 4
+
+Cada línea recibida es {"id": ..., "modelo": "hospital", "datos": {...}, "timeout": 30}
+y cada respuesta es {"id": ..., "ok": true, "resultado": {...}} o {"id": ..., "ok": false, "error": "..."}.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .instancias import MODELOS, resolver_instancia
+from .resolucion import OpcionesResolucion
+
+
+class ServicioSaturado(Exception):
+    """La cola de solicitudes del servicio está llena."""
+
+
+class _Trabajo:
+    def __init__(self, clave, instancia, futuro):
+        self.clave = clave
+        self.instancia = instancia
+        self.futuro = futuro
+        self.interesados = 0
+        # Instante (time.monotonic) en que expira la última solicitud interesada; None sin límite
+        self.plazo = None
+
+
+def clave_solicitud(modelo, datos):
+    """
+    Retorna una clave estable para combinar solicitudes con el mismo modelo y datos.
+    """
+    texto = json.dumps({"modelo": modelo, "datos": datos}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _crear_solver_silencioso(limite_tiempo=None):
+    return OpcionesResolucion(limite_tiempo=limite_tiempo).crear_solver()
+
+
+def _recuperar_excepcion(futuro):
+    # Si todas las solicitudes expiraron antes de que el trabajo fallara, nadie lee la
+    # excepción y asyncio avisaría "exception was never retrieved"
+    if not futuro.cancelled():
+        futuro.exception()
+
+
+class ServicioResolucion:
+    """
+    Encola solicitudes de resolución y las atiende con un número fijo de trabajadores.
+
+    Parámetros:
+        - trabajadores (int): Resoluciones simultáneas como máximo.
+        - max_pendientes (int): Tamaño máximo de la cola; al superarlo se lanza ServicioSaturado.
+        - timeout (float): Tiempo máximo por solicitud en segundos (None para no limitar).
+        - crear_solver (callable): Fábrica del solver de PuLP usado en cada resolución. Si
+          las solicitudes tienen timeout, recibe limite_tiempo=segundos restantes hasta que
+          expire la última solicitud interesada, para que el solver no siga ocupando un
+          trabajador después de que nadie espera el resultado.
+        - ejecutor: Ejecutor de concurrent.futures propio (por defecto un ThreadPoolExecutor
+          con tantos hilos como trabajadores).
+    """
+
+    def __init__(self, trabajadores=4, max_pendientes=100, timeout=None, crear_solver=_crear_solver_silencioso,
+                 ejecutor=None):
+        self.trabajadores = trabajadores
+        self.max_pendientes = max_pendientes
+        self.timeout = timeout
+        self.crear_solver = crear_solver
+        self._ejecutor = ejecutor
+        self._ejecutor_propio = ejecutor is None
+        self._cola = None
+        self._tareas = []
+        self._en_curso = {}
+        self.estadisticas = {"recibidas": 0, "resueltas": 0, "combinadas": 0, "rechazadas": 0, "descartadas": 0}
+
+    async def iniciar(self):
+        if self._tareas:
+            return
+        if self._ejecutor is None:
+            self._ejecutor = ThreadPoolExecutor(max_workers=self.trabajadores, thread_name_prefix="opti-solver")
+        self._cola = asyncio.Queue(maxsize=self.max_pendientes)
+        self._tareas = [asyncio.create_task(self._atender()) for _ in range(self.trabajadores)]
+
+    async def detener(self):
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
+        for trabajo in self._en_curso.values():
+            if not trabajo.futuro.done():
+                trabajo.futuro.cancel()
+        self._en_curso.clear()
+        if self._ejecutor_propio and self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=False, cancel_futures=True)
+            self._ejecutor = None
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.detener()
+
+    async def resolver(self, modelo, datos, timeout=None):
+        """
+        Resuelve una instancia sin bloquear el bucle de eventos.
+
+        Parámetros:
+            - modelo (str): Clave del modelo (ver instancias.MODELOS).
+            - datos (dict): Argumentos del modelo.
+            - timeout (float): Tiempo máximo de espera; por defecto el del servicio.
+
+        Retorna:
+            - dict: El resultado serializable de resolver_instancia.
+
+        Lanza:
+            - ServicioSaturado si la cola está llena.
+            - TimeoutError si el resultado no llega a tiempo.
+        """
+        if modelo not in MODELOS:
+            raise ValueError(f"Modelo desconocido: {modelo!r}")
+        if not self._tareas:
+            await self.iniciar()
+
+        self.estadisticas["recibidas"] += 1
+        clave = clave_solicitud(modelo, datos)
+        trabajo = self._en_curso.get(clave)
+        if trabajo is not None:
+            self.estadisticas["combinadas"] += 1
+        else:
+            futuro = asyncio.get_running_loop().create_future()
+            trabajo = _Trabajo(clave, {"modelo": modelo, "datos": datos}, futuro)
+            try:
+                self._cola.put_nowait(trabajo)
+            except asyncio.QueueFull:
+                self.estadisticas["rechazadas"] += 1
+                raise ServicioSaturado(f"Hay {self.max_pendientes} solicitudes pendientes") from None
+            self._en_curso[clave] = trabajo
+            futuro.add_done_callback(lambda _: self._en_curso.pop(clave, None))
+            futuro.add_done_callback(_recuperar_excepcion)
+
+        timeout = self.timeout if timeout is None else timeout
+        if trabajo.interesados == 0 and trabajo.plazo is None and timeout is not None:
+            trabajo.plazo = time.monotonic() + timeout
+        elif trabajo.plazo is not None:
+            # Una solicitud sin timeout quita el límite; si no, vale el plazo más lejano
+            trabajo.plazo = None if timeout is None else max(trabajo.plazo, time.monotonic() + timeout)
+        trabajo.interesados += 1
+        try:
+            # shield: si esta solicitud expira, las combinadas con ella siguen esperando
+            return await asyncio.wait_for(asyncio.shield(trabajo.futuro), timeout)
+        finally:
+            trabajo.interesados -= 1
+
+    async def planificar_hospital(self, prioridad, pacientes, capacidad, recursos_por_paciente,
+                                  recursos_disponibles, timeout=None):
+        """
+        Versión asíncrona de planificar_hospital.
+        """
+        datos = {
+            "prioridad": prioridad,
+            "pacientes": pacientes,
+            "capacidad": capacidad,
+            "recursos_por_paciente": recursos_por_paciente,
+            "recursos_disponibles": recursos_disponibles,
+        }
+        return await self.resolver("hospital", datos, timeout)
+
+    async def _atender(self):
+        bucle = asyncio.get_running_loop()
+        while True:
+            trabajo = await self._cola.get()
+            try:
+                restante = None if trabajo.plazo is None else trabajo.plazo - time.monotonic()
+                # Nadie espera ya este resultado (todas las solicitudes expiraron)
+                if trabajo.interesados == 0 or trabajo.futuro.done() or (restante is not None and restante <= 0):
+                    self.estadisticas["descartadas"] += 1
+                    if not trabajo.futuro.done():
+                        trabajo.futuro.cancel()
+                    continue
+                try:
+                    resultado = await bucle.run_in_executor(self._ejecutor, self._resolver_bloqueante,
+                                                            trabajo.instancia, restante)
+                except Exception as error:
+                    if not trabajo.futuro.done():
+                        trabajo.futuro.set_exception(error)
+                else:
+                    self.estadisticas["resueltas"] += 1
+                    if not trabajo.futuro.done():
+                        trabajo.futuro.set_result(resultado)
+            finally:
+                self._cola.task_done()
+
+    def _resolver_bloqueante(self, instancia, limite_tiempo=None):
+        if self.crear_solver is None:
+            solver = None
+        elif limite_tiempo is None:
+            solver = self.crear_solver()
+        else:
+            solver = self.crear_solver(limite_tiempo=limite_tiempo)
+        return resolver_instancia(instancia, solver)
+
+
+async def _atender_conexion(servicio, lector, escritor):
+    candado = asyncio.Lock()
+    pendientes = set()
+
+    async def responder(respuesta):
+        async with candado:
+            escritor.write((json.dumps(respuesta, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+            await escritor.drain()
+
+    async def procesar(linea):
+        try:
+            solicitud = json.loads(linea)
+        except json.JSONDecodeError as error:
+            await responder({"id": None, "ok": False, "error": f"JSON inválido: {error}"})
+            return
+        if not isinstance(solicitud, dict):
+            await responder({"id": None, "ok": False,
+                             "error": f"La solicitud debe ser un objeto JSON, no {type(solicitud).__name__}"})
+            return
+        identificador = solicitud.get("id")
+        try:
+            resultado = await servicio.resolver(solicitud["modelo"], solicitud["datos"], solicitud.get("timeout"))
+        except asyncio.TimeoutError:
+            await responder({"id": identificador, "ok": False, "error": "timeout"})
+        except ServicioSaturado as error:
+            await responder({"id": identificador, "ok": False, "error": f"saturado: {error}"})
+        except Exception as error:
+            await responder({"id": identificador, "ok": False, "error": f"{type(error).__name__}: {error}"})
+        else:
+            await responder({"id": identificador, "ok": True, "resultado": resultado})
+
+    try:
+        # Las solicitudes de una misma conexión se atienden en paralelo; las respuestas llevan su "id"
+        while linea := await lector.readline():
+            if linea.strip():
+                tarea = asyncio.create_task(procesar(linea))
+                pendientes.add(tarea)
+                tarea.add_done_callback(pendientes.discard)
+        await asyncio.gather(*pendientes, return_exceptions=True)
+    finally:
+        escritor.close()
+
+
+async def servir(servicio, host="127.0.0.1", puerto=8765):
+    """
+    Inicia el servidor de líneas JSON para el servicio dado y retorna el asyncio.Server.
+    """
+    await servicio.iniciar()
+    return await asyncio.start_server(lambda lector, escritor: _atender_conexion(servicio, lector, escritor),
+                                      host, puerto)
+
+
+async def _principal(args):
+    servicio = ServicioResolucion(trabajadores=args.trabajadores, max_pendientes=args.max_pendientes,
+                                  timeout=args.timeout)
+    async with servicio:
+        servidor = await servir(servicio, args.host, args.puerto)
+        async with servidor:
+            print(f"Escuchando en {args.host}:{args.puerto}")
+            await servidor.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m opti.servicio",
+                                     description="Servidor local de resolución con líneas JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--trabajadores", type=int, default=4)
+    parser.add_argument("--max-pendientes", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=None)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_principal(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
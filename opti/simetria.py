@@ -0,0 +1,179 @@
+"""
+Reducción por simetría: fusiona especialidades o municipalidades idénticas antes de resolver.
+
+Si varias entidades tienen exactamente los mismos parámetros, cualquier permutación de sus
+valores en una solución es otra solución con el mismo objetivo, y el branch-and-bound
+explora esas ramas simétricas en vano. Aquí las entidades se agrupan en clases de
+equivalencia (con un diccionario indexado por los bytes de su fila de parámetros), se
+resuelve un modelo reducido con una entidad por clase y la solución se reparte de vuelta
+entre los miembros de forma exacta.
+
+Hospital: dos especialidades son equivalentes si tienen la misma prioridad, los mismos
+recursos por paciente, la misma fila de capacidad y la misma lista de espera efectiva
+min(pacientes, sum_j capacidad) (con los valores truncados al entero, ya que x es entera).
+Así, las especialidades cuya lista de espera supera su capacidad total se fusionan aunque
+sus listas sean distintas. Una clase de k especialidades se reemplaza por una con k veces
+su capacidad y su lista efectiva; el total X[j] de cada semana se reparte de forma cíclica
+entre los miembros, que reciben floor o ceil de X[j] / k por semana y totales que difieren
+a lo más en uno, de modo que se respetan la capacidad y la lista de cada uno.
+
+Residuos: las municipalidades no comparten restricciones, así que las que tienen los
+mismos R y F tienen el mismo subproblema; se resuelve uno por clase y se copia su solución.
+"""
+import time
+
+import numpy as np
+
+
+def clases_equivalencia(filas):
+    """
+    Agrupa filas idénticas.
+
+    Parámetros:
+        - filas (array N x d): Parámetros de cada entidad.
+
+    Retorna:
+        - tuple: (clase, representantes, tamanos) con la clase de cada fila (array N,
+          numeradas en orden de primera aparición), la primera fila de cada clase y el
+          número de filas de cada clase.
+    """
+    # Sumar 0.0 unifica -0.0 y 0.0, que tienen bytes distintos
+    filas = np.ascontiguousarray(np.asarray(filas, dtype=float) + 0.0)
+    indice = {}
+    clase = np.empty(len(filas), dtype=np.int64)
+    for k, fila in enumerate(filas):
+        clase[k] = indice.setdefault(fila.tobytes(), len(indice))
+    representantes = np.unique(clase, return_index=True)[1]
+    return clase, representantes, np.bincount(clase, minlength=len(representantes))
+
+
+def _entero(valores):
+    # Truncar al entero, tolerando el error de redondeo de datos que ya son enteros
+    return np.floor(np.asarray(valores, dtype=float) + 1e-9)
+
+
+def reducir_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles):
+    """
+    Fusiona las especialidades equivalentes del modelo hospitalario.
+
+    Parámetros:
+        - prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles:
+          Los mismos de planificar_hospital.
+
+    Retorna:
+        - dict: Claves "datos" (argumentos de planificar_hospital del modelo reducido, con
+          una especialidad por clase), "clase" (clase de cada especialidad original),
+          "tamanos" (especialidades por clase) y "constante" (diferencia entre el objetivo
+          original y el reducido).
+    """
+    p = np.asarray(prioridad, dtype=float)
+    c = _entero(capacidad)
+    r = np.asarray(recursos_por_paciente, dtype=float)
+    P = np.asarray(pacientes, dtype=float)
+    efectivos = np.minimum(_entero(P), c.sum(axis=1))
+
+    clase, representantes, tamanos = clases_equivalencia(np.column_stack([p, r, efectivos, c]))
+    return {
+        "datos": {
+            "prioridad": p[representantes].tolist(),
+            "pacientes": (tamanos * efectivos[representantes]).tolist(),
+            "capacidad": (tamanos[:, None] * c[representantes]).tolist(),
+            "recursos_por_paciente": r[representantes].tolist(),
+            "recursos_disponibles": list(recursos_disponibles),
+        },
+        "clase": clase,
+        "tamanos": tamanos,
+        "constante": float(p @ (P - efectivos)),
+    }
+
+
+def expandir_hospital(asignacion, clase, tamanos):
+    """
+    Reparte la solución del modelo reducido entre las especialidades originales.
+
+    Parámetros:
+        - asignacion (array clases x semanas): Pacientes atendidos por clase y semana (enteros).
+        - clase (array), tamanos (array): Los de reducir_hospital.
+
+    Retorna:
+        - array especialidades x semanas.
+    """
+    X = np.rint(np.asarray(asignacion, dtype=float)).astype(np.int64)
+    x = np.empty((len(clase), X.shape[1]), dtype=np.int64)
+    # Las unidades de la semana j son las posiciones [S_j, S_j + X_j) de una numeración
+    # continua de la clase; la posición u va al miembro u mod k
+    inicio = np.cumsum(X, axis=1) - X
+    fin = inicio + X
+    for K, k in enumerate(tamanos):
+        miembros = np.flatnonzero(clase == K)
+        q = np.arange(k)[:, None]
+        # Posiciones u en [a, b) con u = q (mod k): ceil((b - q) / k) - ceil((a - q) / k)
+        x[miembros] = -((q - fin[K]) // k) + ((q - inicio[K]) // k)
+    return x
+
+
+def planificar_hospital_simetrico(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles,
+                                  solver=None):
+    """
+    Resuelve planificar_hospital sobre el modelo reducido por simetría y expande la solución.
+
+    Retorna:
+        - dict: Las mismas claves de planificar_hospital (variables x_i_j de las
+          especialidades originales y el objetivo del modelo original) más "clases"
+          (especialidades del modelo reducido).
+    """
+    from .hospital import construir_problema_hospital
+
+    reduccion = reducir_hospital(prioridad, pacientes, capacidad, recursos_por_paciente, recursos_disponibles)
+    problema, X = construir_problema_hospital(**reduccion["datos"])
+    problema.solve(solver)
+
+    num_semanas = len(recursos_disponibles)
+    resultados = {
+        "estado": problema.status,
+        "estado_solucion": problema.sol_status,
+        "variables": {},
+        "funcion_objetivo": None,
+        "clases": len(reduccion["tamanos"]),
+    }
+    valores = [[variable.varValue for variable in fila] for fila in X]
+    if any(valor is None for fila in valores for valor in fila):
+        resultados["variables"] = {f"x_{i+1}_{j+1}": None for i in range(len(prioridad)) for j in range(num_semanas)}
+        return resultados
+
+    x = expandir_hospital(valores, reduccion["clase"], reduccion["tamanos"])
+    for i, fila in enumerate(x.tolist()):
+        for j, valor in enumerate(fila):
+            resultados["variables"][f"x_{i+1}_{j+1}"] = float(valor)
+    resultados["funcion_objetivo"] = problema.objective.value() + reduccion["constante"]
+    return resultados
+
+
+def optimizar_residuos_simetrico(municipalidades, actividades, R, F, I, C, solver=None):
+    """
+    Resuelve optimizar_gestion_residuos con una municipalidad por clase de equivalencia
+    (mismos R y F) y copia su solución a las demás de la clase.
+
+    Retorna:
+        - tuple: (results, objetivo, elapsed_time), como optimizar_gestion_residuos.
+    """
+    from .residuos import construir_problema_residuos
+
+    clase, representantes, tamanos = clases_equivalencia([[R[m], F[m]] for m in municipalidades])
+    elegidas = [municipalidades[k] for k in representantes]
+    model, x, y = construir_problema_residuos(elegidas, actividades, R, F, I, C)
+
+    start_time = time.time()
+    model.solve(solver)
+    elapsed_time = time.time() - start_time
+
+    results = {}
+    for m, K in zip(municipalidades, clase):
+        representante = elegidas[K]
+        results[m] = {
+            "reduccion_residuos": y[representante].varValue,
+            "fondos_asignados": {a: x[a, representante].varValue for a in actividades}
+        }
+    valores = [y[m].varValue for m in elegidas]
+    objetivo = None if None in valores else float(np.dot(tamanos, valores))
+    return results, objetivo, elapsed_time
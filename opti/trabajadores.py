@@ -0,0 +1,312 @@
+"""
+Procesos solver persistentes que reciben modelos en memoria por tuberías.
+
+Con el solver por defecto (PULP_CBC_CMD), cada solve() escribe un MPS en disco, lanza un
+proceso CBC nuevo y lee un archivo de solución; en los modelos pequeños del proyecto ese
+costo fijo supera al de resolver. PoolSolvers mantiene procesos de larga vida que importan
+el backend una sola vez, reciben el modelo como diccionario (LpProblem.to_dict) por una
+tubería y lo resuelven en memoria con HiGHS (highspy). Si highspy no está instalado, el
+trabajador recurre a CBC, que sigue evitando el arranque de Python pero no el de CBC.
+
+Uso:
+    with PoolSolvers(procesos=4) as pool:
+        resultados = planificar_hospital(..., solver=SolverPersistente(pool))
+"""
+import multiprocessing
+import queue
+import threading
+
+
+class TrabajadorCaido(RuntimeError):
+    """Un proceso solver terminó inesperadamente y no pudo completar la resolución."""
+
+
+def _crear_solver(backend):
+    import pulp
+
+    if backend in ("auto", "highs") and pulp.HiGHS().available():
+        return pulp.HiGHS(msg=False)
+    if backend == "highs":
+        raise RuntimeError("El backend 'highs' requiere el paquete highspy")
+    return pulp.PULP_CBC_CMD(msg=0)
+
+
+def _bucle_trabajador(conexion, backend):
+    # Se ejecuta en el proceso hijo: el backend se importa una vez por proceso
+    import os
+    from pulp import LpProblem
+
+    solver = _crear_solver(backend)
+    conexion.send(("listo", os.getpid(), type(solver).__name__))
+    while True:
+        try:
+            mensaje = conexion.recv()
+        except EOFError:
+            return
+        tipo = mensaje[0]
+        if tipo == "ping":
+            conexion.send(("pong", os.getpid()))
+        elif tipo == "terminar":
+            return
+        elif tipo == "resolver":
+            try:
+                _, problema = LpProblem.fromDict(mensaje[1])
+                problema.solve(solver)
+                respuesta = {
+                    "estado": problema.status,
+                    "estado_solucion": problema.sol_status,
+                    "valores": {v.name: v.varValue for v in problema.variables()},
+                    "pi": {nombre: c.pi for nombre, c in problema.constraints.items()},
+                    "dj": {v.name: v.dj for v in problema.variables()},
+                }
+                conexion.send(("ok", respuesta))
+            except Exception as error:
+                conexion.send(("error", f"{type(error).__name__}: {error}"))
+
+
+class _Trabajador:
+    def __init__(self, contexto, backend):
+        self.conexion, extremo_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=_bucle_trabajador, args=(extremo_hijo, backend), daemon=True)
+        self.proceso.start()
+        extremo_hijo.close()
+        self.resoluciones = 0
+        _, self.pid, self.solver = self._recibir(timeout=60)
+
+    def _recibir(self, timeout=None):
+        if not self.conexion.poll(timeout):
+            raise TimeoutError("El trabajador no respondió a tiempo")
+        mensaje = self.conexion.recv()
+        if mensaje[0] == "error":
+            raise RuntimeError(mensaje[1])
+        return mensaje
+
+    def vivo(self, timeout=5):
+        if not self.proceso.is_alive():
+            return False
+        try:
+            self.conexion.send(("ping",))
+            return self._recibir(timeout)[0] == "pong"
+        except (OSError, EOFError, TimeoutError):
+            return False
+
+    def resolver(self, modelo, timeout=None):
+        self.conexion.send(("resolver", modelo))
+        respuesta = self._recibir(timeout)[1]
+        self.resoluciones += 1
+        return respuesta
+
+    def cerrar(self):
+        try:
+            self.conexion.send(("terminar",))
+        except OSError:
+            pass
+        self.proceso.join(timeout=2)
+        if self.proceso.is_alive():
+            self.proceso.kill()
+            self.proceso.join()
+        self.conexion.close()
+
+
+class _Vacante:
+    # Lugar de un trabajador cuyo reemplazo no se pudo crear: se reintenta al tomarlo de la
+    # cola de libres (o en verificar_salud), de modo que el pool no se achica para siempre
+    pid = None
+    solver = None
+    resoluciones = 0
+
+    def __init__(self, error):
+        self.error = error
+
+    def vivo(self, timeout=5):
+        return False
+
+    def cerrar(self):
+        pass
+
+
+class PoolSolvers:
+    """
+    Conjunto de procesos solver reutilizables, seguro para usar desde varios hilos.
+
+    Parámetros:
+        - procesos (int): Cantidad de procesos solver.
+        - backend (str): "auto" (HiGHS si está disponible, si no CBC), "highs" o "cbc".
+        - intervalo_salud (float): Segundos entre chequeos de salud en segundo plano
+          (None para chequear solo al llamar verificar_salud()).
+        - reintentos (int): Reintentos de una resolución cuando su trabajador se cae.
+
+    Si no se puede crear el proceso que reemplaza a uno caído, su lugar queda vacante (el
+    pool queda degradado, ver degradado) y se vuelve a intentar crearlo la próxima vez que
+    se toma ese lugar.
+    """
+
+    def __init__(self, procesos=2, backend="auto", intervalo_salud=None, reintentos=1):
+        # spawn evita heredar hilos y candados del proceso padre (p. ej. del servicio asíncrono)
+        self._contexto = multiprocessing.get_context("spawn")
+        self.backend = backend
+        self.reintentos = reintentos
+        self.reinicios = 0
+        self._libres = queue.Queue()
+        self._trabajadores = [_Trabajador(self._contexto, backend) for _ in range(procesos)]
+        for trabajador in self._trabajadores:
+            self._libres.put(trabajador)
+        self._candado = threading.Lock()
+        self._cerrado = False
+        self._detener_salud = threading.Event()
+        self._hilo_salud = None
+        if intervalo_salud:
+            self._hilo_salud = threading.Thread(target=self._vigilar, args=(intervalo_salud,), daemon=True)
+            self._hilo_salud.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _reemplazar(self, trabajador):
+        # Nunca lanza: si el proceso nuevo no arranca, retorna una _Vacante en su lugar
+        try:
+            trabajador.cerrar()
+        except Exception:
+            pass
+        try:
+            nuevo = _Trabajador(self._contexto, self.backend)
+        except Exception as error:
+            nuevo = _Vacante(error)
+        with self._candado:
+            self._trabajadores[self._trabajadores.index(trabajador)] = nuevo
+            if not isinstance(nuevo, _Vacante):
+                self.reinicios += 1
+        return nuevo
+
+    def _tomar(self):
+        trabajador = self._libres.get()
+        if isinstance(trabajador, _Vacante):
+            trabajador = self._reemplazar(trabajador)
+            if isinstance(trabajador, _Vacante):
+                self._libres.put(trabajador)
+                raise TrabajadorCaido(f"No se pudo crear un proceso solver: {trabajador.error}") from trabajador.error
+        return trabajador
+
+    @property
+    def degradado(self):
+        """
+        True si algún lugar del pool quedó sin proceso porque su reemplazo no pudo crearse.
+        """
+        with self._candado:
+            return any(isinstance(trabajador, _Vacante) for trabajador in self._trabajadores)
+
+    def resolver_dict(self, modelo, timeout=None):
+        """
+        Resuelve un modelo en formato LpProblem.to_dict() en algún trabajador libre.
+
+        Retorna:
+            - dict: "estado", "estado_solucion", "valores", "pi" y "dj" de la resolución.
+
+        Lanza:
+            - TimeoutError si no hay respuesta en timeout segundos (el trabajador se reinicia).
+            - TrabajadorCaido si el trabajador se cae más veces que los reintentos permitidos
+              o si el lugar tomado está vacante y su proceso sigue sin poder crearse.
+        """
+        if self._cerrado:
+            raise RuntimeError("El pool está cerrado")
+        for intento in range(self.reintentos + 1):
+            trabajador = self._tomar()
+            try:
+                respuesta = trabajador.resolver(modelo, timeout)
+            except TimeoutError:
+                # El proceso sigue ocupado con este modelo: se descarta y se reemplaza
+                self._libres.put(self._reemplazar(trabajador))
+                raise
+            except (EOFError, OSError, ConnectionError):
+                self._libres.put(self._reemplazar(trabajador))
+                if intento == self.reintentos:
+                    raise TrabajadorCaido("El proceso solver terminó durante la resolución") from None
+            except BaseException:
+                self._libres.put(trabajador)
+                raise
+            else:
+                self._libres.put(trabajador)
+                return respuesta
+
+    def resolver(self, problema, timeout=None):
+        """
+        Resuelve un LpProblem en el pool y vuelca la solución en sus variables.
+
+        Retorna:
+            - int: El estado de PuLP (problema.status).
+        """
+        respuesta = self.resolver_dict(problema.to_dict(), timeout)
+        problema.assignStatus(respuesta["estado"], respuesta["estado_solucion"])
+        problema.assignVarsVals(respuesta["valores"])
+        problema.assignVarsDj(respuesta["dj"])
+        problema.assignConsPi(respuesta["pi"])
+        return problema.status
+
+    def verificar_salud(self, timeout=5):
+        """
+        Hace ping a los trabajadores libres y reemplaza los que no responden.
+
+        Retorna:
+            - int: Cantidad de trabajadores reemplazados (incluidas las vacantes cubiertas).
+        """
+        reemplazados = 0
+        revisados = []
+        while True:
+            try:
+                trabajador = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            if not trabajador.vivo(timeout):
+                trabajador = self._reemplazar(trabajador)
+                reemplazados += not isinstance(trabajador, _Vacante)
+            revisados.append(trabajador)
+        for trabajador in revisados:
+            self._libres.put(trabajador)
+        return reemplazados
+
+    def _vigilar(self, intervalo):
+        while not self._detener_salud.wait(intervalo):
+            self.verificar_salud()
+
+    def estado(self):
+        """
+        Retorna una lista con pid, solver, vida y resoluciones de cada trabajador (pid None
+        en los lugares vacantes).
+        """
+        with self._candado:
+            return [{"pid": t.pid, "solver": t.solver, "vivo": not isinstance(t, _Vacante) and t.proceso.is_alive(),
+                     "resoluciones": t.resoluciones} for t in self._trabajadores]
+
+    def cerrar(self):
+        if self._cerrado:
+            return
+        self._cerrado = True
+        self._detener_salud.set()
+        if self._hilo_salud is not None:
+            self._hilo_salud.join()
+        for trabajador in self._trabajadores:
+            trabajador.cerrar()
+
+
+class SolverPersistente:
+    """
+    Adaptador que permite pasar un PoolSolvers como solver= a cualquier modelo del paquete.
+
+    LpProblem.solve() solo usa actualSolve() del solver, así que no hace falta heredar de
+    pulp.LpSolver (lo que obligaría a importar PuLP al importar este módulo).
+    """
+
+    name = "SolverPersistente"
+
+    def __init__(self, pool, timeout=None):
+        self.pool = pool
+        self.timeout = timeout
+
+    def available(self):
+        return True
+
+    def actualSolve(self, lp, **kwargs):
+        return self.pool.resolver(lp, self.timeout)
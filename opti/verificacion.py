@@ -0,0 +1,299 @@
+"""
+Verificación independiente de soluciones y reutilización de soluciones ante cambios de datos.
+
+Los verificadores reciben los datos de una instancia (formato de instancias.py) y el
+resultado retornado por el modelo, y comprueban todas las restricciones en una pasada
+vectorizada con NumPy, sin construir el modelo ni llamar al solver. Las violaciones se
+informan con los mismos nombres de restricción que usan los constructores.
+
+reutilizable() decide si una solución guardada sigue siendo factible y demostrablemente
+óptima para datos nuevos, con argumentos que no requieren resolver el modelo entero:
+
+- Cota por especialidad (hospital), por municipalidad (residuos) o por cupos (agenda): si la
+  solución alcanza una cota superior del objetivo que se calcula en forma cerrada, es óptima.
+- Restricciones ajustadas: si el objetivo no cambió, los datos nuevos solo restringen más
+  el problema y la solución sigue siendo factible, sigue siendo óptima. Solo vale si la
+  solución guardada era óptima probada (resultado["estado_solucion"] == 1), no una
+  factible de una resolución cortada por tiempo o gap.
+- Relajación lineal (hospital, opcional): si la cota de la relajación de los datos nuevos
+  coincide con el valor de la solución, esta es óptima; resolver un LP es mucho más barato
+  que el modelo entero.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class Verificacion:
+    """
+    Resultado de verificar una solución.
+
+    Atributos:
+        - factible (bool): La solución cumple todas las restricciones.
+        - funcion_objetivo (float): Valor del objetivo calculado a partir de la solución.
+        - violaciones (dict): Nombre de restricción -> magnitud de la violación.
+    """
+    factible: bool
+    funcion_objetivo: float
+    violaciones: dict = field(default_factory=dict)
+
+
+@dataclass
+class Reutilizacion:
+    """
+    Decisión sobre una solución guardada frente a datos nuevos.
+
+    Atributos:
+        - reutilizable (bool): La solución es factible y óptima para los datos nuevos.
+        - motivo (str): Argumento que lo demuestra, o por qué no se pudo demostrar.
+        - verificacion (Verificacion): Verificación de la solución con los datos nuevos.
+    """
+    reutilizable: bool
+    motivo: str
+    verificacion: Verificacion
+
+
+def _violaciones(nombres, exceso, tolerancia):
+    exceso = np.asarray(exceso, dtype=float)
+    return {nombres(k): float(exceso.flat[k]) for k in np.flatnonzero(exceso > tolerancia)}
+
+
+def _matriz_hospital(datos, resultado):
+    num_especialidades = len(datos["prioridad"])
+    num_semanas = len(datos["recursos_disponibles"])
+    variables = resultado["variables"]
+    return np.array([[variables.get(f"x_{i+1}_{j+1}") or 0.0 for j in range(num_semanas)]
+                     for i in range(num_especialidades)], dtype=float)
+
+
+def verificar_hospital(datos, resultado, tolerancia=1e-6):
+    """
+    Verifica un resultado de planificar_hospital contra los datos dados.
+    """
+    x = _matriz_hospital(datos, resultado)
+    p = np.asarray(datos["prioridad"], dtype=float)
+    P = np.asarray(datos["pacientes"], dtype=float)
+    c = np.asarray(datos["capacidad"], dtype=float)
+    r = np.asarray(datos["recursos_por_paciente"], dtype=float)
+    R = np.asarray(datos["recursos_disponibles"], dtype=float)
+    num_semanas = len(R)
+
+    violaciones = {}
+    violaciones.update(_violaciones(lambda k: f"x_{k // num_semanas + 1}_{k % num_semanas + 1}>=0", -x, tolerancia))
+    violaciones.update(_violaciones(lambda k: f"x_{k // num_semanas + 1}_{k % num_semanas + 1}_entera",
+                                    np.abs(x - np.round(x)), tolerancia))
+    violaciones.update(_violaciones(lambda k: f"Pacientes_Especialidad_{k+1}", x.sum(axis=1) - P, tolerancia))
+    violaciones.update(_violaciones(lambda k: f"Capacidad_{k // num_semanas + 1}_{k % num_semanas + 1}",
+                                    x - c, tolerancia))
+    violaciones.update(_violaciones(lambda k: f"Recursos_Semana_{k+1}", r @ x - R, tolerancia))
+    return Verificacion(not violaciones, float(p @ (P - x.sum(axis=1))), violaciones)
+
+
+def verificar_agenda(datos, resultado, tolerancia=1e-6):
+    """
+    Verifica un resultado de programar_lista_espera contra los datos dados.
+    """
+    pacientes = [str(i) for i in datos["pacientes"]]
+    dias = list(datos["dias"])
+    dias_urgentes = datos.get("dias_urgentes", 3)
+    posicion_dia = {str(j): k for k, j in enumerate(dias)}
+    asignacion = {str(i): str(j) for i, j in resultado["asignacion"].items()}
+
+    # Índice del día asignado a cada paciente (-1 si no tiene o si el día no existe)
+    indice = np.array([posicion_dia.get(asignacion.get(i), -1) for i in pacientes])
+    asignado = indice >= 0
+    violaciones = {}
+    violaciones.update(_violaciones(lambda k: f"Paciente_{pacientes[k]}_Atendido_Una_Vez", (~asignado) * 1.0, 0.5))
+    uso = np.bincount(indice[asignado], minlength=len(dias))
+    violaciones.update(_violaciones(lambda k: f"Capacidad_Diaria_{dias[k]}", uso - datos["capacidad_diaria"],
+                                    tolerancia))
+    urgentes = [str(i) for i in datos["urgentes"]]
+    posicion_paciente = {i: k for k, i in enumerate(pacientes)}
+    indice_urgentes = np.array([indice[posicion_paciente[i]] if i in posicion_paciente else -1 for i in urgentes],
+                               dtype=int)
+    fuera = (indice_urgentes < 0) | (indice_urgentes >= dias_urgentes)
+    violaciones.update(_violaciones(lambda k: f"Urgente_{urgentes[k]}_En_{dias_urgentes}_Dias", fuera * 1.0, 0.5))
+
+    objetivo = float(np.asarray(dias, dtype=float)[indice[asignado]].sum())
+    return Verificacion(not violaciones, objetivo, violaciones)
+
+
+def _arreglos_residuos(datos, resultado):
+    municipalidades, actividades = datos["municipalidades"], datos["actividades"]
+    por_municipalidad = resultado.get("resultados", resultado)
+    x = np.array([[por_municipalidad[m]["fondos_asignados"][a] or 0.0 for m in municipalidades]
+                  for a in actividades], dtype=float)
+    y = np.array([por_municipalidad[m]["reduccion_residuos"] or 0.0 for m in municipalidades], dtype=float)
+    return x, y
+
+
+def verificar_residuos(datos, resultado, tolerancia=1e-6):
+    """
+    Verifica un resultado de optimizar_gestion_residuos (el diccionario por municipalidad, o
+    el resultado de resolver_instancia que lo contiene en "resultados").
+    """
+    municipalidades, actividades = datos["municipalidades"], datos["actividades"]
+    if resultado.get("estado") == -1:
+        return Verificacion(False, None, {"certificado_infactibilidad": 1.0})
+    x, y = _arreglos_residuos(datos, resultado)
+    R = np.array([datos["R"][m] for m in municipalidades], dtype=float)
+    F = np.array([datos["F"][m] for m in municipalidades], dtype=float)
+    I = np.array([datos["I"][a] for a in actividades], dtype=float)
+    C = np.array([datos["C"][a] for a in actividades], dtype=float)
+    num_municipalidades = len(municipalidades)
+
+    escala = 1 + np.abs(y)
+    violaciones = {}
+    violaciones.update(_violaciones(lambda k: f"Calculo_Reduccion_Residuos_{municipalidades[k]}",
+                                    np.abs(y - (I / C) @ x) / escala, tolerancia))
+    violaciones.update(_violaciones(lambda k: f"Presupuesto_{municipalidades[k]}", x.sum(axis=0) - F,
+                                    tolerancia * (1 + F)))
+    violaciones.update(_violaciones(lambda k: f"Limite_Residuos_Reducidos_{municipalidades[k]}", y - R,
+                                    tolerancia * (1 + R)))
+    violaciones.update(_violaciones(
+        lambda k: f"Asignacion_Minima_{actividades[k // num_municipalidades]}_{municipalidades[k % num_municipalidades]}",
+        C[:, None] - x, tolerancia * (1 + C[:, None])))
+    return Verificacion(not violaciones, float(y.sum()), violaciones)
+
+
+VERIFICADORES = {
+    "hospital": verificar_hospital,
+    "agenda": verificar_agenda,
+    "residuos": verificar_residuos,
+}
+
+
+def verificar_instancia(instancia, resultado, tolerancia=1e-6):
+    """
+    Verifica el resultado de una instancia con el verificador de su modelo.
+    """
+    verificador = VERIFICADORES.get(instancia["modelo"])
+    if verificador is None:
+        raise ValueError(f"El modelo {instancia['modelo']!r} no tiene verificador")
+    return verificador(instancia["datos"], resultado, tolerancia)
+
+
+def _cota_hospital(datos):
+    # Cada especialidad atiende a lo sumo min(P[i], sum_j c[i][j]) pacientes
+    P = np.asarray(datos["pacientes"], dtype=float)
+    c = np.asarray(datos["capacidad"], dtype=float)
+    p = np.asarray(datos["prioridad"], dtype=float)
+    return float(p @ (P - np.minimum(P, c.sum(axis=1))))
+
+
+def _cota_residuos(datos):
+    # Con los mínimos cubiertos, cada peso adicional rinde a lo sumo max_a I[a]/C[a]
+    municipalidades, actividades = datos["municipalidades"], datos["actividades"]
+    I = np.array([datos["I"][a] for a in actividades], dtype=float)
+    C = np.array([datos["C"][a] for a in actividades], dtype=float)
+    F = np.array([datos["F"][m] for m in municipalidades], dtype=float)
+    R = np.array([datos["R"][m] for m in municipalidades], dtype=float)
+    maximo = I.sum() + np.maximum(F - C.sum(), 0) * (I / C).max()
+    return float(np.minimum(R, maximo).sum())
+
+
+def _cota_agenda(datos):
+    # Llenar los días en orden con la capacidad diaria da el menor tiempo total posible
+    dias = np.sort(np.asarray(list(datos["dias"]), dtype=float))
+    cupos = np.repeat(dias, datos["capacidad_diaria"])
+    return float(cupos[:len(list(datos["pacientes"]))].sum())
+
+
+def _mismas_dimensiones(anteriores, nuevos, claves):
+    return all(np.shape(anteriores[clave]) == np.shape(nuevos[clave]) for clave in claves)
+
+
+def _ajusta_hospital(anteriores, nuevos):
+    # Mismo objetivo (prioridades) y un conjunto factible contenido en el anterior
+    if not _mismas_dimensiones(anteriores, nuevos, ["prioridad", "pacientes", "capacidad", "recursos_por_paciente",
+                                                    "recursos_disponibles"]):
+        return False
+    return (np.array_equal(anteriores["prioridad"], nuevos["prioridad"])
+            and np.all(np.asarray(nuevos["pacientes"]) <= np.asarray(anteriores["pacientes"]))
+            and np.all(np.asarray(nuevos["capacidad"]) <= np.asarray(anteriores["capacidad"]))
+            and np.all(np.asarray(nuevos["recursos_por_paciente"]) >= np.asarray(anteriores["recursos_por_paciente"]))
+            and np.all(np.asarray(nuevos["recursos_disponibles"]) <= np.asarray(anteriores["recursos_disponibles"])))
+
+
+def _ajusta_residuos(anteriores, nuevos):
+    if anteriores["municipalidades"] != nuevos["municipalidades"] or anteriores["actividades"] != nuevos["actividades"]:
+        return False
+    return (all(nuevos["I"][a] == anteriores["I"][a] for a in nuevos["actividades"])
+            and all(nuevos["C"][a] >= anteriores["C"][a] for a in nuevos["actividades"])
+            and all(nuevos["F"][m] <= anteriores["F"][m] and nuevos["R"][m] <= anteriores["R"][m]
+                    for m in nuevos["municipalidades"]))
+
+
+def _ajusta_agenda(anteriores, nuevos):
+    return (list(map(str, nuevos["pacientes"])) == list(map(str, anteriores["pacientes"]))
+            and list(nuevos["dias"]) == list(anteriores["dias"])
+            and set(map(str, nuevos["urgentes"])) >= set(map(str, anteriores["urgentes"]))
+            and nuevos["capacidad_diaria"] <= anteriores["capacidad_diaria"]
+            and nuevos.get("dias_urgentes", 3) <= anteriores.get("dias_urgentes", 3))
+
+
+def _cota_lineal_hospital(datos):
+    from .hospital import construir_problema_hospital
+    from .relajacion import _cota_entera
+    from .matricial import desde_problema
+
+    forma = desde_problema(construir_problema_hospital(**datos)[0])
+    h = forma.a_highs(relajar_enteras=True)
+    h.run()
+    import highspy
+    if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+        return None
+    return _cota_entera(forma, forma.valor_objetivo(h.getSolution().col_value))
+
+
+# Modelo -> (cota del objetivo en forma cerrada, comprobación de restricciones ajustadas, maximizar)
+_REUTILIZACION = {
+    "hospital": (_cota_hospital, _ajusta_hospital, False),
+    "residuos": (_cota_residuos, _ajusta_residuos, True),
+    "agenda": (_cota_agenda, _ajusta_agenda, False),
+}
+
+
+def reutilizable(modelo, datos_anteriores, resultado, datos_nuevos, resolver_relajacion=True, tolerancia=1e-6):
+    """
+    Decide si el resultado obtenido con datos_anteriores sigue siendo factible y óptimo con datos_nuevos.
+
+    Parámetros:
+        - modelo (str): "hospital", "residuos" o "agenda".
+        - datos_anteriores (dict): Datos con los que se obtuvo el resultado.
+        - resultado (dict): Resultado guardado (el que retorna el modelo). El argumento de
+          restricciones ajustadas solo se usa si incluye "estado_solucion" igual a 1 (lo traen
+          los resultados de hospital y agenda, y los de residuos obtenidos con resolver_instancia).
+        - datos_nuevos (dict): Datos modificados.
+        - resolver_relajacion (bool): En el hospital, permitir resolver la relajación lineal
+          de los datos nuevos como último argumento.
+        - tolerancia (float): Tolerancia de factibilidad y de comparación de objetivos.
+
+    Retorna:
+        - Reutilizacion
+    """
+    cota, ajusta, maximizar = _REUTILIZACION[modelo]
+    verificacion = VERIFICADORES[modelo](datos_nuevos, resultado, tolerancia)
+    if not verificacion.factible:
+        return Reutilizacion(False, "La solución no es factible con los datos nuevos", verificacion)
+
+    valor = verificacion.funcion_objetivo
+    escala = tolerancia * max(abs(valor), 1.0)
+    mejor_posible = cota(datos_nuevos)
+    if (valor >= mejor_posible - escala) if maximizar else (valor <= mejor_posible + escala):
+        return Reutilizacion(True, "La solución alcanza la cota del objetivo en forma cerrada", verificacion)
+
+    optimo = resultado.get("estado_solucion") == 1
+    if optimo and ajusta(datos_anteriores, datos_nuevos):
+        return Reutilizacion(True, "Los datos nuevos solo restringen el problema y la solución sigue siendo factible",
+                             verificacion)
+
+    if modelo == "hospital" and resolver_relajacion:
+        cota_lineal = _cota_lineal_hospital(datos_nuevos)
+        if cota_lineal is not None and valor <= cota_lineal + escala:
+            return Reutilizacion(True, "La solución alcanza la cota de la relajación lineal", verificacion)
+
+    if not optimo:
+        return Reutilizacion(False, "El resultado guardado no es óptimo probado y no alcanza las cotas", verificacion)
+    return Reutilizacion(False, "No se pudo demostrar la optimalidad sin resolver", verificacion)
@@ -1,5 +1,9 @@
-from docplex.mp.model import Model #type: ignore
+def main():
+    from docplex.mp.model import Model  # type: ignore
 
-modelo = Model(name="Gestion_de_listas de espera")
+    modelo = Model(name="Gestion_de_listas de espera")
+    return modelo
 
 
+if __name__ == "__main__":
+    main()